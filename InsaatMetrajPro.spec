@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('app', 'app'), ('assets', 'assets'), ('data', 'data')]
 binaries = []
-hiddenimports = ['PyQt6', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'pandas', 'openpyxl', 'reportlab', 'ezdxf', 'sqlite3', 'pdfplumber', 'matplotlib', 'app.core.database', 'app.core.calculator', 'app.core.material_calculator', 'app.core.dxf_engine', 'app.core.cad_manager', 'app.ui.main_window', 'app.ui.dialogs', 'app.ui.startup_dialog', 'app.ui.taseron_window', 'app.ui.styles', 'app.utils.data_loader', 'app.utils.export_manager', 'app.utils.helpers', 'app.utils.pdf_importer', 'app.data.konut_is_kalemleri', 'app.data.malzeme_formulleri', 'app.data.fire_oranlari']
+hiddenimports = ['PyQt6', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'pandas', 'openpyxl', 'reportlab', 'ezdxf', 'sqlite3', 'pdfplumber', 'matplotlib', 'orjson', 'numpy', 'numba', 'scipy.spatial', 'app.core.database', 'app.core.calculator', 'app.core.material_calculator', 'app.core.dxf_engine', 'app.core.cad_manager', 'app.ui.main_window', 'app.ui.dialogs', 'app.ui.startup_dialog', 'app.ui.taseron_window', 'app.ui.styles', 'app.utils.data_loader', 'app.utils.export_manager', 'app.utils.helpers', 'app.utils.pdf_importer', 'app.data.konut_is_kalemleri', 'app.data.malzeme_formulleri', 'app.data.fire_oranlari']
 tmp_ret = collect_all('PyQt6')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
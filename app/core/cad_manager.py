@@ -18,6 +18,181 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _line_uzunlugu(entity) -> float:
+    """LINE uzunluğu (3B, çizim birimi)."""
+    start = entity.dxf.start
+    end = entity.dxf.end
+    return ((end.x - start.x)**2 + 
+            (end.y - start.y)**2 + 
+            (end.z - start.z)**2)**0.5
+
+
+def _lwpolyline_uzunlugu(entity) -> float:
+    """LWPOLYLINE uzunluğu; kapalıysa son -> ilk kenar dahil (okunamazsa flattening ile)."""
+    try:
+        # LWPOLYLINE için noktaları al ve manuel hesapla
+        points = list(entity.vertices)
+        if len(points) > 1:
+            length = 0.0
+            for i in range(len(points) - 1):
+                # LWPOLYLINE noktaları (x, y) tuple olarak gelir
+                x1, y1 = points[i][:2]  # İlk iki değer x, y
+                x2, y2 = points[i + 1][:2]
+                # Segment uzunluğu
+                segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
+                length += segment_length
+            
+            # Eğer kapalıysa, son noktadan ilk noktaya olan uzunluğu ekle
+            if entity.is_closed or (getattr(entity.dxf, 'flags', 0) & 1):
+                x1, y1 = points[-1][:2]
+                x2, y2 = points[0][:2]
+                segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
+                length += segment_length
+            
+            return length
+    except Exception as e:
+        logger.warning(f"Polyline uzunluk hesaplama hatası: {e}")
+        # Alternatif yöntem: flattening kullan
+        try:
+            # ezdxf'in flattening metodu ile düzleştirilmiş noktaları al
+            flattened = list(entity.flattening(0.01))  # 0.01 tolerans
+            if len(flattened) > 1:
+                length = 0.0
+                for i in range(len(flattened) - 1):
+                    p1 = flattened[i]
+                    p2 = flattened[i + 1]
+                    length += ((p2.x - p1.x)**2 + (p2.y - p1.y)**2)**0.5
+                return length
+        except Exception as e2:
+            logger.warning(f"Alternatif polyline uzunluk hesaplama hatası: {e2}")
+    return 0.0
+
+
+def _polyline_uzunlugu(entity) -> float:
+    """POLYLINE (eski format) uzunluğu (3B, çizim birimi)."""
+    try:
+        # Polyline noktalarını topla
+        points = list(entity.vertices)
+        if len(points) > 1:
+            length = 0.0
+            for i in range(len(points) - 1):
+                p1 = points[i].dxf.location
+                p2 = points[i + 1].dxf.location
+                length += ((p2.x - p1.x)**2 + 
+                           (p2.y - p1.y)**2 + 
+                           (p2.z - p1.z)**2)**0.5
+            return length
+    except Exception as e:
+        logger.warning(f"Polyline işleme hatası: {e}")
+    return 0.0
+
+
+def _circle_alani(entity) -> Optional[float]:
+    """CIRCLE alanı (π·r²); hesaplanamazsa None."""
+    try:
+        radius = entity.dxf.radius
+        area = 3.141592653589793 * radius * radius  # π * r²
+        logger.debug("CIRCLE bulundu, yarıçap: %s, alan: %s", radius, area)
+        return abs(area)
+    except Exception as e:
+        logger.warning(f"Circle alan hesaplama hatası: {e}")
+        return None
+
+
+def _ellipse_alani(entity) -> Optional[float]:
+    """ELLIPSE alanı (π·a·b); hesaplanamazsa None."""
+    try:
+        # Ellips için major ve minor axis gerekli
+        major_axis = entity.dxf.major_axis
+        minor_axis = entity.dxf.minor_axis
+        # Basitleştirilmiş: major ve minor axis uzunluklarını al
+        a = ((major_axis.x)**2 + (major_axis.y)**2 + (major_axis.z)**2)**0.5
+        b = ((minor_axis.x)**2 + (minor_axis.y)**2 + (minor_axis.z)**2)**0.5
+        area = 3.141592653589793 * a * b  # π * a * b
+        logger.debug("ELLIPSE bulundu, alan: %s", area)
+        return abs(area)
+    except Exception as e:
+        logger.warning(f"Ellipse alan hesaplama hatası: {e}")
+        return None
+
+
+def _lwpolyline_alani(entity) -> Optional[float]:
+    """Kapalı (veya ilk/son noktası çakışan) LWPOLYLINE alanı; değilse None."""
+    try:
+        # Kapalı mı kontrol et
+        is_closed = getattr(entity.dxf, 'flags', 0) & 1  # Bit 0 = closed flag
+        if is_closed or entity.is_closed:
+            area = entity.area()
+            logger.debug("Kapalı LWPOLYLINE bulundu, alan: %s", area)
+            return abs(area)
+        # Kapalı değilse, ilk ve son nokta aynı mı kontrol et
+        try:
+            points = list(entity.vertices)
+            if len(points) >= 3:
+                first = points[0]
+                last = points[-1]
+                # İlk ve son nokta yaklaşık olarak aynı mı? (0.001 tolerans)
+                if abs(first[0] - last[0]) < 0.001 and abs(first[1] - last[1]) < 0.001:
+                    try:
+                        area = entity.area()
+                        logger.debug("Kapalı olmayan ama alan hesaplanabilir LWPOLYLINE, alan: %s", area)
+                        return abs(area)
+                    except:
+                        pass
+        except:
+            pass
+    except Exception as e:
+        logger.warning(f"Polyline alan hesaplama hatası: {e}")
+    return None
+
+
+def _polyline_alani(entity) -> Optional[float]:
+    """Kapalı POLYLINE alanı (Shoelace formülü); değilse None."""
+    try:
+        is_closed = getattr(entity.dxf, 'flags', 0) & 1
+        if is_closed or entity.is_closed:
+            # Polyline alanını hesapla (Shoelace formülü)
+            points = list(entity.vertices)
+            if len(points) >= 3:
+                area = 0.0
+                for i in range(len(points)):
+                    p1 = points[i].dxf.location
+                    p2 = points[(i + 1) % len(points)].dxf.location
+                    area += p1.x * p2.y - p2.x * p1.y
+                logger.debug("Kapalı POLYLINE bulundu, alan: %s", abs(area) / 2.0)
+                return abs(area) / 2.0
+    except Exception as e:
+        logger.warning(f"Polyline alan hesaplama hatası: {e}")
+    return None
+
+
+def _spline_alani(entity) -> Optional[float]:
+    """Kapalı SPLINE alanı hesaplanmaz (karmaşık); her zaman None."""
+    try:
+        if entity.closed:
+            # Spline için alan hesaplama karmaşık, şimdilik atla
+            # veya yaklaşık hesaplama yapılabilir
+            logger.debug("Kapalı SPLINE bulundu ama alan hesaplanmadı (karmaşık)")
+    except:
+        pass
+    return None
+
+
+# Varlık tipi -> hesap fonksiyonu; katman döngüsü tip başına elif zinciri yerine tek sözlük araması yapar
+_UZUNLUK_FONKSIYONLARI = {
+    'LINE': _line_uzunlugu,
+    'LWPOLYLINE': _lwpolyline_uzunlugu,
+    'POLYLINE': _polyline_uzunlugu,
+}
+_ALAN_FONKSIYONLARI = {
+    'CIRCLE': _circle_alani,
+    'ELLIPSE': _ellipse_alani,
+    'LWPOLYLINE': _lwpolyline_alani,
+    'POLYLINE': _polyline_alani,
+    'SPLINE': _spline_alani,
+}
+
+
 class CADManager:
     """
     CAD dosya yönetim sınıfı.
@@ -94,77 +269,20 @@ class CADManager:
         total_length = 0.0
         
         try:
+            # Katman adı döngü dışında bir kez küçük harfe çevrilir
+            hedef_katman = layer_name.lower()
             for entity in modelspace:
                 # Katman kontrolü
                 entity_layer = getattr(entity.dxf, 'layer', '0')
                 
-                if entity_layer.lower() != layer_name.lower():
+                if entity_layer.lower() != hedef_katman:
                     continue
-                    
-                # LINE entity
-                if entity.dxftype() == 'LINE':
-                    start = entity.dxf.start
-                    end = entity.dxf.end
-                    length = ((end.x - start.x)**2 + 
-                             (end.y - start.y)**2 + 
-                             (end.z - start.z)**2)**0.5
-                    total_length += length
-                    
-                # LWPOLYLINE entity
-                elif entity.dxftype() == 'LWPOLYLINE':
-                    try:
-                        # LWPOLYLINE için noktaları al ve manuel hesapla
-                        points = list(entity.vertices)
-                        if len(points) > 1:
-                            length = 0.0
-                            for i in range(len(points) - 1):
-                                # LWPOLYLINE noktaları (x, y) tuple olarak gelir
-                                x1, y1 = points[i][:2]  # İlk iki değer x, y
-                                x2, y2 = points[i + 1][:2]
-                                # Segment uzunluğu
-                                segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-                                length += segment_length
-                            
-                            # Eğer kapalıysa, son noktadan ilk noktaya olan uzunluğu ekle
-                            if entity.is_closed or (getattr(entity.dxf, 'flags', 0) & 1):
-                                x1, y1 = points[-1][:2]
-                                x2, y2 = points[0][:2]
-                                segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-                                length += segment_length
-                            
-                            total_length += length
-                    except Exception as e:
-                        logger.warning(f"Polyline uzunluk hesaplama hatası: {e}")
-                        # Alternatif yöntem: flattening kullan
-                        try:
-                            flattened = list(entity.flattening(0.01))
-                            if len(flattened) > 1:
-                                length = 0.0
-                                for i in range(len(flattened) - 1):
-                                    p1 = flattened[i]
-                                    p2 = flattened[i + 1]
-                                    length += ((p2.x - p1.x)**2 + (p2.y - p1.y)**2)**0.5
-                                total_length += length
-                        except Exception as e2:
-                            logger.warning(f"Alternatif polyline uzunluk hesaplama hatası: {e2}")
-                        
-                # POLYLINE entity (eski format)
-                elif entity.dxftype() == 'POLYLINE':
-                    try:
-                        # Polyline noktalarını topla
-                        points = list(entity.vertices)
-                        if len(points) > 1:
-                            length = 0.0
-                            for i in range(len(points) - 1):
-                                p1 = points[i].dxf.location
-                                p2 = points[i + 1].dxf.location
-                                length += ((p2.x - p1.x)**2 + 
-                                          (p2.y - p1.y)**2 + 
-                                          (p2.z - p1.z)**2)**0.5
-                            total_length += length
-                    except Exception as e:
-                        logger.warning(f"Polyline işleme hatası: {e}")
-                        
+                
+                # LINE, LWPOLYLINE, POLYLINE
+                uzunluk_fn = _UZUNLUK_FONKSIYONLARI.get(entity.dxftype())
+                if uzunluk_fn is not None:
+                    total_length += uzunluk_fn(entity)
+
         except Exception as e:
             logger.error(f"Katman analizi hatası: {e}")
             raise RuntimeError(f"Katman analizi sırasında hata: {e}")
@@ -379,77 +497,18 @@ class CADManager:
         try:
             if method == 'uzunluk':
                 # LINE ve LWPOLYLINE objelerinin toplam uzunluğu
+                hedef_katman = layer_name.lower()
                 for entity in modelspace:
                     entity_layer = getattr(entity.dxf, 'layer', '0')
                     
-                    if entity_layer.lower() != layer_name.lower():
+                    if entity_layer.lower() != hedef_katman:
                         continue
                     
                     layer_found = True
                     
-                    # LINE entity
-                    if entity.dxftype() == 'LINE':
-                        start = entity.dxf.start
-                        end = entity.dxf.end
-                        length = ((end.x - start.x)**2 + 
-                                 (end.y - start.y)**2 + 
-                                 (end.z - start.z)**2)**0.5
-                        result += length
-                        
-                    # LWPOLYLINE entity
-                    elif entity.dxftype() == 'LWPOLYLINE':
-                        try:
-                            # LWPOLYLINE için noktaları al ve manuel hesapla
-                            points = list(entity.vertices)
-                            if len(points) > 1:
-                                length = 0.0
-                                for i in range(len(points) - 1):
-                                    # LWPOLYLINE noktaları (x, y) tuple olarak gelir
-                                    x1, y1 = points[i][:2]  # İlk iki değer x, y
-                                    x2, y2 = points[i + 1][:2]
-                                    # Segment uzunluğu
-                                    segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-                                    length += segment_length
-                                
-                                # Eğer kapalıysa, son noktadan ilk noktaya olan uzunluğu ekle
-                                if entity.is_closed or (getattr(entity.dxf, 'flags', 0) & 1):
-                                    x1, y1 = points[-1][:2]
-                                    x2, y2 = points[0][:2]
-                                    segment_length = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-                                    length += segment_length
-                                
-                                result += length
-                        except Exception as e:
-                            logger.warning(f"Polyline uzunluk hesaplama hatası: {e}")
-                            # Alternatif yöntem: flattening kullan
-                            try:
-                                # ezdxf'in flattening metodu ile düzleştirilmiş noktaları al
-                                flattened = list(entity.flattening(0.01))  # 0.01 tolerans
-                                if len(flattened) > 1:
-                                    length = 0.0
-                                    for i in range(len(flattened) - 1):
-                                        p1 = flattened[i]
-                                        p2 = flattened[i + 1]
-                                        length += ((p2.x - p1.x)**2 + (p2.y - p1.y)**2)**0.5
-                                    result += length
-                            except Exception as e2:
-                                logger.warning(f"Alternatif polyline uzunluk hesaplama hatası: {e2}")
-                            
-                    # POLYLINE entity (eski format)
-                    elif entity.dxftype() == 'POLYLINE':
-                        try:
-                            points = list(entity.vertices)
-                            if len(points) > 1:
-                                length = 0.0
-                                for i in range(len(points) - 1):
-                                    p1 = points[i].dxf.location
-                                    p2 = points[i + 1].dxf.location
-                                    length += ((p2.x - p1.x)**2 + 
-                                              (p2.y - p1.y)**2 + 
-                                              (p2.z - p1.z)**2)**0.5
-                                result += length
-                        except Exception as e:
-                            logger.warning(f"Polyline işleme hatası: {e}")
+                    uzunluk_fn = _UZUNLUK_FONKSIYONLARI.get(entity.dxftype())
+                    if uzunluk_fn is not None:
+                        result += uzunluk_fn(entity)
                 
                 # Birim dönüşümü: DXF dosyaları genellikle mm cinsinden olur
                 # mm'den m'ye: /1000
@@ -468,102 +527,24 @@ class CADManager:
                 # KAPALI (Closed) LWPOLYLINE, CIRCLE, ELLIPSE vb. objelerinin alanı
                 entity_count = 0
                 closed_count = 0
+                hedef_katman = layer_name.lower()
                 
                 for entity in modelspace:
                     entity_layer = getattr(entity.dxf, 'layer', '0')
                     
-                    if entity_layer.lower() != layer_name.lower():
+                    if entity_layer.lower() != hedef_katman:
                         continue
                     
                     layer_found = True
                     entity_count += 1
                     
-                    # CIRCLE - daire alanı
-                    if entity.dxftype() == 'CIRCLE':
-                        try:
-                            radius = entity.dxf.radius
-                            area = 3.141592653589793 * radius * radius  # π * r²
-                            result += abs(area)
+                    # CIRCLE, ELLIPSE, kapalı LWPOLYLINE/POLYLINE (SPLINE alanı hesaplanmaz)
+                    alan_fn = _ALAN_FONKSIYONLARI.get(entity.dxftype())
+                    if alan_fn is not None:
+                        alan = alan_fn(entity)
+                        if alan is not None:
+                            result += alan
                             closed_count += 1
-                            logger.debug(f"CIRCLE bulundu, yarıçap: {radius}, alan: {area}")
-                        except Exception as e:
-                            logger.warning(f"Circle alan hesaplama hatası: {e}")
-                    
-                    # ELLIPSE - elips alanı
-                    elif entity.dxftype() == 'ELLIPSE':
-                        try:
-                            # Ellips için major ve minor axis gerekli
-                            major_axis = entity.dxf.major_axis
-                            minor_axis = entity.dxf.minor_axis
-                            # Basitleştirilmiş: major ve minor axis uzunluklarını al
-                            a = ((major_axis.x)**2 + (major_axis.y)**2 + (major_axis.z)**2)**0.5
-                            b = ((minor_axis.x)**2 + (minor_axis.y)**2 + (minor_axis.z)**2)**0.5
-                            area = 3.141592653589793 * a * b  # π * a * b
-                            result += abs(area)
-                            closed_count += 1
-                            logger.debug(f"ELLIPSE bulundu, alan: {area}")
-                        except Exception as e:
-                            logger.warning(f"Ellipse alan hesaplama hatası: {e}")
-                    
-                    # LWPOLYLINE - kapalı olanlar
-                    elif entity.dxftype() == 'LWPOLYLINE':
-                        try:
-                            # Kapalı mı kontrol et
-                            is_closed = getattr(entity.dxf, 'flags', 0) & 1  # Bit 0 = closed flag
-                            if is_closed or entity.is_closed:
-                                area = entity.area()
-                                result += abs(area)
-                                closed_count += 1
-                                logger.debug(f"Kapalı LWPOLYLINE bulundu, alan: {area}")
-                            else:
-                                # Kapalı değilse, ilk ve son nokta aynı mı kontrol et
-                                try:
-                                    points = list(entity.vertices)
-                                    if len(points) >= 3:
-                                        first = points[0]
-                                        last = points[-1]
-                                        # İlk ve son nokta yaklaşık olarak aynı mı? (0.001 tolerans)
-                                        if abs(first[0] - last[0]) < 0.001 and abs(first[1] - last[1]) < 0.001:
-                                            try:
-                                                area = entity.area()
-                                                result += abs(area)
-                                                closed_count += 1
-                                                logger.debug(f"Kapalı olmayan ama alan hesaplanabilir LWPOLYLINE, alan: {area}")
-                                            except:
-                                                pass
-                                except:
-                                    pass
-                        except Exception as e:
-                            logger.warning(f"Polyline alan hesaplama hatası: {e}")
-                            
-                    # POLYLINE - kapalı olanlar
-                    elif entity.dxftype() == 'POLYLINE':
-                        try:
-                            is_closed = getattr(entity.dxf, 'flags', 0) & 1
-                            if is_closed or entity.is_closed:
-                                # Polyline alanını hesapla (Shoelace formülü)
-                                points = list(entity.vertices)
-                                if len(points) >= 3:
-                                    area = 0.0
-                                    for i in range(len(points)):
-                                        p1 = points[i].dxf.location
-                                        p2 = points[(i + 1) % len(points)].dxf.location
-                                        area += p1.x * p2.y - p2.x * p1.y
-                                    result += abs(area) / 2.0
-                                    closed_count += 1
-                                    logger.debug(f"Kapalı POLYLINE bulundu, alan: {abs(area) / 2.0}")
-                        except Exception as e:
-                            logger.warning(f"Polyline alan hesaplama hatası: {e}")
-                    
-                    # SPLINE - kapalı spline'lar (eğer kapalıysa)
-                    elif entity.dxftype() == 'SPLINE':
-                        try:
-                            if entity.closed:
-                                # Spline için alan hesaplama karmaşık, şimdilik atla
-                                # veya yaklaşık hesaplama yapılabilir
-                                logger.debug("Kapalı SPLINE bulundu ama alan hesaplanmadı (karmaşık)")
-                        except:
-                            pass
                 
                 # Debug bilgisi
                 if entity_count > 0:
@@ -5,10 +5,226 @@ SQLite veritabanı bağlantısı ve işlemleri için core modül
 
 import sqlite3
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
-from contextlib import contextmanager
+from contextlib import contextmanager, closing
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
+# orjson opsiyonel: yedekleme/geri yüklemede stdlib json'dan birkaç kat hızlı
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# RETURNING desteği SQLite 3.35+ ile geldi; eski sürümlerde ek SELECT kullanılır
+RETURNING_DESTEKLI = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Bağlantı başına derlenmiş (prepared) sorgu önbelleği boyutu.
+# Bağlantılar kalıcı olduğundan aynı SQL metni tekrar derlenmez.
+_SORGU_ONBELLEK_BOYUTU = 256
+
+# get_poz_by_no / get_birim_fiyat sonuç önbelleğinin geçerlilik süresi (saniye).
+# Bu sınıf dışındaki doğrudan UPDATE'ler en geç bu süre sonunda görünür.
+_POZ_ONBELLEK_TTL = 5.0
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Veriyi UTF-8 JSON baytlarına çevir (orjson varsa onu kullan)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Any:
+    """UTF-8 JSON baytlarını çöz (orjson varsa onu kullan)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _iter_rows(cursor: sqlite3.Cursor, size: int = 1000) -> Iterator[sqlite3.Row]:
+    """Sorgu sonucunu fetchmany ile parça parça okuyarak satır satır döndür."""
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """
+    Sorgu sonucunu sözlük listesine çevir.
+    
+    Kolon adları cursor.description'dan bir kez alınır; dict(row)'un her
+    satırda keys() + anahtar başına erişim yapmasından daha az iş yapar.
+    """
+    cols = tuple(d[0] for d in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor]
+
+
+def _iter_dicts(cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+    """Sorgu sonucunu listede biriktirmeden satır satır sözlük olarak döndür."""
+    cols = tuple(d[0] for d in cursor.description)
+    for row in cursor:
+        yield dict(zip(cols, row))
+
+
+def _write_json_fields(f, fields: Dict[str, Any]) -> None:
+    """Açık bir JSON nesnesine '"anahtar": değer,' satırlarını yaz."""
+    for anahtar, deger in fields.items():
+        f.write(b'  "%s": %s,\n' % (anahtar.encode('utf-8'), _json_dumps(deger, indent=False)))
+
+
+def _write_json_array(f, rows) -> None:
+    """Satırları tek tek serileştirerek JSON dizisi olarak yaz (satır başına bir kayıt)."""
+    f.write(b'[')
+    bos = True
+    for row in rows:
+        f.write(b'\n    ' if bos else b',\n    ')
+        f.write(_json_dumps(dict(row), indent=False))
+        bos = False
+    f.write(b']' if bos else b'\n  ]')
+
+
+# Tek sorguda IN (...) içine bağlanan en fazla parametre
+# (eski SQLite sürümlerindeki 999 değişken sınırının altında kalır)
+_IN_PARCA_BOYUTU = 500
+
+
+@lru_cache(maxsize=64)
+def _update_sql(tablo: str, kolonlar: Tuple[str, ...], zaman_kolonu: str = "") -> str:
+    """
+    Dinamik UPDATE sorgusunu kolon kümesine göre bir kez üret.
+    
+    Aynı kolon kombinasyonu için her çağrıda aynı SQL metni döner; böylece
+    string birleştirme tekrarlanmaz ve bağlantının sorgu önbelleği kullanılır.
+    Kolon adları çağıran tarafından beyaz listeye göre doğrulanmalıdır.
+    """
+    fields = ", ".join(f"{k} = ?" for k in kolonlar)
+    if zaman_kolonu:
+        fields += f", {zaman_kolonu} = ?"
+    return f"UPDATE {tablo} SET {fields} WHERE id = ?"
+
+
+# update_template ile güncellenebilecek şablon kolonları
+_SABLON_GUNCELLENEBILIR = frozenset({'ad', 'aciklama'})
+# update_ihale_kalem ile güncellenebilecek ihale kalemi kolonları
+_KALEM_COLS = frozenset({
+    'poz_no', 'poz_tanim', 'kategori', 'birim_miktar', 'birim', 'birim_fiyat', 'toplam', 'sira_no'
+})
+
+
+# Birden fazla metotta aynen kullanılan sorgular (tek metin = tek önbellek girdisi)
+_POZ_BY_NO_SQL = "SELECT * FROM pozlar WHERE poz_no = ?"
+_POZ_FORMUL_SELECT_SQL = """
+    SELECT 
+        mf.id,
+        mf.poz_id,
+        mf.malzeme_id,
+        mf.miktar,
+        mf.birim,
+        mf.formul_tipi,
+        mf.aciklama,
+        m.ad as malzeme_adi,
+        m.birim as malzeme_birim,
+        m.kategori as malzeme_kategori
+    FROM malzeme_formulleri mf
+    JOIN malzemeler m ON mf.malzeme_id = m.id
+"""
+_POZ_FORMULLERI_SQL = _POZ_FORMUL_SELECT_SQL + """
+    WHERE mf.poz_id = ?
+    ORDER BY m.kategori, m.ad
+"""
+_POZ_FORMULLERI_BY_POZ_NO_SQL = _POZ_FORMUL_SELECT_SQL + """
+    JOIN pozlar p ON mf.poz_id = p.id
+    WHERE p.poz_no = ?
+    ORDER BY m.kategori, m.ad
+"""
+
+# Tekil ve toplu (executemany) eklemelerde ortak kullanılan INSERT sorguları
+_METRAJ_KALEM_INSERT_SQL = """
+    INSERT INTO metraj_kalemleri 
+    (proje_id, poz_no, tanim, miktar, birim, birim_fiyat, toplam, kategori, olusturma_tarihi)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_TASERON_TEKLIF_INSERT_SQL = """
+    INSERT INTO taseron_teklifleri
+    (proje_id, firma_adi, kalem_id, poz_no, tanim, miktar, birim, fiyat, toplam, teklif_tarihi)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SABLON_KALEM_INSERT_SQL = """
+    INSERT INTO sablon_kalemleri 
+    (sablon_id, poz_no, tanim, kategori, miktar, birim, birim_fiyat, toplam)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# İhale düzenleme ve poz arama (her tuş vuruşunda) sıcak yolları.
+# SELECT * yerine yalnızca arayüzün kullandığı kolonlar okunur.
+_KALEM_COLS_SQL = "id, ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no"
+_POZ_ARAMA_COLS = ("id", "poz_no", "tanim", "birim", "resmi_fiyat", "kategori")
+_POZ_ARAMA_COLS_SQL = ", ".join(_POZ_ARAMA_COLS)
+_IHALE_KALEMLERI_SQL = f"""
+    SELECT {_KALEM_COLS_SQL} FROM ihale_kalemleri
+    WHERE ihale_id = ?
+    ORDER BY sira_no, id
+"""
+_IHALE_KALEM_INSERT_SQL = """
+    INSERT INTO ihale_kalemleri 
+    (ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# sira_no verilmediğinde ihaledeki en büyük sira_no + 1 aynı sorguda hesaplanır
+_IHALE_KALEM_INSERT_SIRALI_SQL = """
+    INSERT INTO ihale_kalemleri 
+    (ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?,
+            (SELECT COALESCE(MAX(sira_no), 0) + 1 FROM ihale_kalemleri WHERE ihale_id = ?))
+"""
+_IHALE_KALEM_DELETE_SQL = "DELETE FROM ihale_kalemleri WHERE id = ?"
+_IHALE_DELETE_SQL = "DELETE FROM ihaleler WHERE id = ?"
+# Noktalı poz araması: önekli dal büyük/küçük harf duyarsız LIKE ile
+# idx_pozlar_poz_no_nocase indeksinde aralık olarak aranır, yalnızca tanım
+# içinde geçen dal tabloyu tarar. İki dal ayrı sınırlanır.
+_POZ_ARAMA_TAM_SQL = f"SELECT {_POZ_ARAMA_COLS_SQL} FROM pozlar WHERE poz_no = ?"
+_POZ_ONEK_ARAMA_SQL = f"""
+    SELECT * FROM (
+        SELECT {_POZ_ARAMA_COLS_SQL} FROM pozlar
+        WHERE poz_no LIKE ?
+        ORDER BY poz_no
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT {_POZ_ARAMA_COLS_SQL} FROM pozlar
+        WHERE tanim LIKE ?
+        ORDER BY poz_no
+        LIMIT ?
+    )
+"""
+# Noktasız arama (>= 3 karakter): FTS5 trigram indeksi üzerinden alt dizi eşleşmesi
+_POZ_FTS_ARAMA_SQL = f"""
+    SELECT {", ".join("p." + k for k in _POZ_ARAMA_COLS)} FROM pozlar_fts f
+    JOIN pozlar p ON p.id = f.rowid
+    WHERE pozlar_fts MATCH ?
+    ORDER BY p.poz_no
+    LIMIT ?
+"""
+_POZ_ARAMA_SQL = f"""
+    SELECT {_POZ_ARAMA_COLS_SQL} FROM pozlar
+    WHERE poz_no LIKE ? OR tanim LIKE ?
+    ORDER BY poz_no
+    LIMIT ?
+"""
 
 
 class DatabaseManager:
@@ -32,36 +248,163 @@ class DatabaseManager:
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_database()
         
+        # Thread başına tek kalıcı bağlantı (UI thread + QThread yükleyicileri)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        
+        # Sık okunan, seyrek değişen poz/fiyat sorguları için TTL önbellek
+        self._poz_by_no_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._birim_fiyat_cache: Dict[tuple, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        
+        # FTS5 trigram desteği _init_database içinde belirlenir
+        self._fts_aktif = False
+        
+        self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Yeni, yapılandırılmış bir SQLite bağlantısı aç."""
+        # Bağlantı yalnızca açan thread'de kullanılır; close() ise tüm
+        # bağlantıları ana thread'den kapatabilmek için kontrolü kapatır.
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                               cached_statements=_SORGU_ONBELLEK_BOYUTU)
+        conn.row_factory = sqlite3.Row  # Sözlük benzeri erişim
+        self._configure(conn)
+        return conn
+        
+    def invalidate_cache(self) -> None:
+        """Poz ve birim fiyat sorgu önbelleğini temizle."""
+        self._poz_by_no_cache.clear()
+        self._birim_fiyat_cache.clear()
+    
+    @staticmethod
+    def _cache_get(cache: Dict, key: Any) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Önbellekte süresi dolmamış kayıt varsa (True, kopya) döndür."""
+        entry = cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > _POZ_ONBELLEK_TTL:
+            return False, None
+        value = entry[1]
+        return True, (dict(value) if value is not None else None)
+    
     @contextmanager
     def get_connection(self):
         """
         Veritabanı bağlantısı context manager.
         
+        Her thread kendi kalıcı bağlantısını tekrar kullanır, böylece kısa
+        sorgularda bağlantı açma/kapama maliyeti ve sayfa önbelleği kaybı
+        yaşanmaz. İç içe kullanımda commit/rollback yalnızca en dıştaki
+        blokta yapılır.
+        
         Yields:
             sqlite3.Connection: Veritabanı bağlantısı
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Sözlük benzeri erişim
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            local.conn = conn
+            local.depth = 0
+            with self._pool_lock:
+                self._connections.append(conn)
+        
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
+            if local.depth == 1:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if local.depth == 1:
+                conn.rollback()
             raise
         finally:
-            conn.close()
+            local.depth -= 1
+    
+    def close(self) -> None:
+        """
+        Tüm thread'lerin kalıcı bağlantılarını kapat.
+        
+        Uygulama kapanırken çağrılır; kapatmadan önce sorgu planlayıcı
+        istatistikleri PRAGMA optimize ile tazelenir.
+        """
+        with self._pool_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        
+        for conn in connections:
+            try:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+    
+    @contextmanager
+    def _txn(self):
+        """
+        Toplu yazma işlemleri için tek bir açık transaction.
+        
+        Döngü içinde her satır için ayrı bağlantı/commit açmak yerine tüm
+        yazmalar tek BEGIN IMMEDIATE ... COMMIT içinde yapılır.
+        
+        Yields:
+            sqlite3.Cursor: Transaction'a bağlı cursor
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn.cursor()
+    
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """
+        Bağlantı bazlı PRAGMA ayarlarını uygula.
+        
+        Bu ayarlar dosyaya kaydedilmez, her yeni bağlantıda tekrar verilmelidir.
+        
+        Args:
+            conn: Yapılandırılacak bağlantı
+        """
+        # Synchronous mode'u optimize et (güvenlik vs hız dengesi)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Cache size artır (daha hızlı sorgular)
+        conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
+        # Yazma yoğunluğunda araya checkpoint girmesin (varsayılan: 1000 sayfa)
+        conn.execute("PRAGMA wal_autocheckpoint=10000")
+        # Geçici tablo/sıralama işlemleri bellekte; okumalar bellek eşlemeli (256MB)
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+    
+    @contextmanager
+    def _toplu_yazma(self):
+        """
+        Geri yükleme gibi toplu yazmalar süresince fsync'i kapat.
+        
+        WAL modunda synchronous=OFF veritabanını bozmaz; yalnızca işletim
+        sistemi çökmesi/elektrik kesintisinde son commit'ler kaybolabilir.
+        Blok bitince bağlantı tekrar synchronous=NORMAL'e döner.
+        """
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA synchronous=OFF")
+        try:
+            yield
+        finally:
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA synchronous=NORMAL")
+    
+    def checkpoint(self) -> None:
+        """
+        WAL dosyasını ana veritabanına aktar ve sıfırla.
+        
+        Uygulama boştayken (zamanlayıcı ile) çağrılmak üzere tasarlanmıştır.
+        """
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             
     def _init_database(self) -> None:
         """Veritabanı tablolarını oluştur."""
-        with self.get_connection() as conn:
+        # Şema kurulumu havuz dışında, kısa ömürlü bir bağlantıda yapılır
+        with closing(self._connect()) as conn, conn:
             # WAL mode aktif et (daha hızlı okuma/yazma)
             conn.execute("PRAGMA journal_mode=WAL")
-            # Synchronous mode'u optimize et (güvenlik vs hız dengesi)
-            conn.execute("PRAGMA synchronous=NORMAL")
-            # Cache size artır (daha hızlı sorgular)
-            conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
             # Foreign key kontrolünü aktif et
             conn.execute("PRAGMA foreign_keys=ON")
             
@@ -310,14 +653,35 @@ class DatabaseManager:
                 ON malzeme_formulleri(malzeme_id)
             """)
             
+            # Migration: UPSERT (ON CONFLICT) için (poz_id, malzeme_id) tekil olmalı.
+            # Tablo UNIQUE kısıtıyla oluşturulduysa bu indeks zaten gereksizdir.
+            try:
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_malzeme_formul_poz_malzeme 
+                    ON malzeme_formulleri(poz_id, malzeme_id)
+                """)
+            except sqlite3.IntegrityError:
+                pass  # Eski veride tekrar eden kayıt varsa indeks oluşturulamaz
+            
+            # Aktif fiyat sorguları (poz + aktif, tarih DESC) için bileşik indeksler;
+            # sıralama indeksten okunur. Tek kolonlu eski indeksler bunların önekidir.
+            cursor.execute("DROP INDEX IF EXISTS idx_birim_fiyat_poz")
+            cursor.execute("DROP INDEX IF EXISTS idx_birim_fiyat_poz_no")
+            
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_birim_fiyat_poz 
-                ON birim_fiyatlar(poz_id)
+                CREATE INDEX IF NOT EXISTS idx_birim_fiyat_poz_aktif_tarih 
+                ON birim_fiyatlar(poz_id, aktif, tarih DESC)
             """)
             
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_birim_fiyat_poz_no 
-                ON birim_fiyatlar(poz_no)
+                CREATE INDEX IF NOT EXISTS idx_birim_fiyat_poz_no_aktif_tarih 
+                ON birim_fiyatlar(poz_no, aktif, tarih DESC)
+            """)
+            
+            # LIKE 'önek%' yalnızca NOCASE harmanlamalı indeksle aralık aramasına dönüşür
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pozlar_poz_no_nocase 
+                ON pozlar(poz_no COLLATE NOCASE)
             """)
             
             cursor.execute("""
@@ -325,9 +689,18 @@ class DatabaseManager:
                 ON birim_fiyatlar(tarih)
             """)
             
+            # (ihale_id, sira_no): MAX(sira_no) tek B-tree araması, kalem listesi
+            # sıralaması da indeksten okunur. Eski tek kolonlu indeks bunun önekidir.
+            cursor.execute("DROP INDEX IF EXISTS idx_ihale_kalem_ihale")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ihale_kalem_ihale_sira 
+                ON ihale_kalemleri(ihale_id, sira_no)
+            """)
+            
+            # Formül listelerindeki ORDER BY m.kategori, m.ad için
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ihale_kalem_ihale 
-                ON ihale_kalemleri(ihale_id)
+                CREATE INDEX IF NOT EXISTS idx_malzemeler_kategori_ad 
+                ON malzemeler(kategori, ad)
             """)
             
             cursor.execute("""
@@ -454,8 +827,65 @@ class DatabaseManager:
             except sqlite3.OperationalError:
                 pass  # Kolon zaten varsa hata verme
             
-            conn.commit()
+            # Poz tanım/numara alt dizi araması için FTS5 trigram indeksi (SQLite 3.34+).
+            # Dış içerikli tablo: veri pozlar'da kalır, tetikleyiciler indeksi senkron tutar.
+            self._fts_aktif = self._init_poz_fts(cursor)
+            
+            # Sorgu planlayıcı istatistikleri hiç toplanmadıysa bir kez topla;
+            # sonrasını bağlantı kapanışındaki PRAGMA optimize günceller
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
             
+    def _init_poz_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        pozlar_fts sanal tablosunu ve tetikleyicilerini oluştur.
+        
+        Args:
+            cursor: Şema kurulum cursor'ı
+            
+        Returns:
+            bool: FTS5 trigram kullanılabiliyorsa True
+        """
+        if sqlite3.sqlite_version_info < (3, 34, 0):
+            return False
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'pozlar_fts'")
+        yeni = cursor.fetchone() is None
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS pozlar_fts USING fts5(
+                    poz_no, tanim,
+                    content='pozlar', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False  # FTS5 derlenmemiş
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS pozlar_fts_ai AFTER INSERT ON pozlar BEGIN
+                INSERT INTO pozlar_fts(rowid, poz_no, tanim) VALUES (new.id, new.poz_no, new.tanim);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS pozlar_fts_ad AFTER DELETE ON pozlar BEGIN
+                INSERT INTO pozlar_fts(pozlar_fts, rowid, poz_no, tanim)
+                VALUES ('delete', old.id, old.poz_no, old.tanim);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS pozlar_fts_au AFTER UPDATE OF poz_no, tanim ON pozlar BEGIN
+                INSERT INTO pozlar_fts(pozlar_fts, rowid, poz_no, tanim)
+                VALUES ('delete', old.id, old.poz_no, old.tanim);
+                INSERT INTO pozlar_fts(rowid, poz_no, tanim) VALUES (new.id, new.poz_no, new.tanim);
+            END
+        """)
+        
+        if yeni:
+            # Mevcut pozları bir kez indeksle
+            cursor.execute("INSERT INTO pozlar_fts(pozlar_fts) VALUES ('rebuild')")
+        return True
+    
     # Proje İşlemleri
     def create_project(self, ad: str, aciklama: str = "") -> int:
         """
@@ -468,14 +898,17 @@ class DatabaseManager:
         Returns:
             int: Oluşturulan projenin ID'si
         """
-        now = datetime.now().isoformat()
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO projects (ad, aciklama, olusturma_tarihi, guncelleme_tarihi)
-                VALUES (?, ?, ?, ?)
-            """, (ad, aciklama, now, now))
-            return cursor.lastrowid
+            return self._create_project_cursor(conn.cursor(), ad, aciklama)
+    
+    def _create_project_cursor(self, cursor: sqlite3.Cursor, ad: str, aciklama: str = "") -> int:
+        """Verilen cursor (transaction) üzerinden proje oluştur."""
+        now = datetime.now().isoformat()
+        cursor.execute("""
+            INSERT INTO projects (ad, aciklama, olusturma_tarihi, guncelleme_tarihi)
+            VALUES (?, ?, ?, ?)
+        """, (ad, aciklama, now, now))
+        return cursor.lastrowid
             
     def get_all_projects(self) -> List[Dict[str, Any]]:
         """
@@ -565,23 +998,44 @@ class DatabaseManager:
             int: Oluşturulan pozun ID'si
         """
         now = datetime.now().isoformat()
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute("""
-                    INSERT INTO pozlar (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, guncelleme_tarihi)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, now))
-                return cursor.lastrowid
-            except sqlite3.IntegrityError:
-                # Poz zaten varsa güncelle
-                cursor.execute("""
-                    UPDATE pozlar 
-                    SET tanim = ?, birim = ?, resmi_fiyat = ?, kategori = ?, fire_orani = ?, guncelleme_tarihi = ?
-                    WHERE poz_no = ?
-                """, (tanim, birim, resmi_fiyat, kategori, fire_orani, now, poz_no))
-                cursor.execute("SELECT id FROM pozlar WHERE poz_no = ?", (poz_no,))
-                return cursor.fetchone()['id']
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if RETURNING_DESTEKLI:
+                    # Ekle veya güncelle, ID'yi aynı sorguda döndür
+                    cursor.execute("""
+                        INSERT INTO pozlar (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, guncelleme_tarihi)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(poz_no) DO UPDATE SET
+                            tanim = excluded.tanim,
+                            birim = excluded.birim,
+                            resmi_fiyat = excluded.resmi_fiyat,
+                            kategori = excluded.kategori,
+                            fire_orani = excluded.fire_orani,
+                            guncelleme_tarihi = excluded.guncelleme_tarihi
+                        RETURNING id
+                    """, (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, now))
+                    return cursor.fetchone()['id']
+                
+                try:
+                    cursor.execute("""
+                        INSERT INTO pozlar (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, guncelleme_tarihi)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (poz_no, tanim, birim, resmi_fiyat, kategori, fire_orani, now))
+                    return cursor.lastrowid
+                except sqlite3.IntegrityError:
+                    # Poz zaten varsa güncelle
+                    cursor.execute("""
+                        UPDATE pozlar 
+                        SET tanim = ?, birim = ?, resmi_fiyat = ?, kategori = ?, fire_orani = ?, guncelleme_tarihi = ?
+                        WHERE poz_no = ?
+                    """, (tanim, birim, resmi_fiyat, kategori, fire_orani, now, poz_no))
+                    cursor.execute("SELECT id FROM pozlar WHERE poz_no = ?", (poz_no,))
+                    return cursor.fetchone()['id']
+        finally:
+            # Önbellek commit/rollback sonrasında temizlenir; yazma sürerken başka
+            # thread'deki okuma eski satırı önbelleğe koyarsa TTL boyunca kalmasın.
+            self._poz_by_no_cache.pop(poz_no, None)
                 
     def get_poz(self, poz_no: str) -> Optional[Dict[str, Any]]:
         """
@@ -593,11 +1047,7 @@ class DatabaseManager:
         Returns:
             Optional[Dict]: Poz bilgileri veya None
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM pozlar WHERE poz_no = ?", (poz_no,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        return self.get_poz_by_no(poz_no)
             
     def search_pozlar(self, search_term: str) -> List[Dict[str, Any]]:
         """
@@ -638,21 +1088,51 @@ class DatabaseManager:
         Returns:
             int: Oluşturulan kalemin ID'si
         """
-        toplam = miktar * birim_fiyat
-        now = datetime.now().isoformat()
-        
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO metraj_kalemleri 
-                (proje_id, poz_no, tanim, miktar, birim, birim_fiyat, toplam, kategori, olusturma_tarihi)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (proje_id, poz_no, tanim, miktar, birim, birim_fiyat, toplam, kategori, now))
+            item_id = self._add_metraj_kalem_cursor(
+                cursor, proje_id, tanim, miktar, birim, birim_fiyat, poz_no, kategori
+            )
             
             # Proje toplam maliyetini güncelle
             self._update_project_total(conn, proje_id)
             
-            return cursor.lastrowid
+            return item_id
+    
+    def _add_metraj_kalem_cursor(self, cursor: sqlite3.Cursor, proje_id: int, tanim: str,
+                                 miktar: float, birim: str, birim_fiyat: float = 0,
+                                 poz_no: str = "", kategori: str = "",
+                                 toplam: Optional[float] = None) -> int:
+        """
+        Verilen cursor (transaction) üzerinden metraj kalemi ekle.
+        
+        Proje toplamını güncellemez; toplu eklemelerde çağıran taraf
+        döngü sonunda bir kez _update_project_total çağırmalıdır.
+        """
+        if toplam is None:
+            toplam = miktar * birim_fiyat
+        now = datetime.now().isoformat()
+        cursor.execute(_METRAJ_KALEM_INSERT_SQL,
+                       (proje_id, poz_no, tanim, miktar, birim, birim_fiyat, toplam, kategori, now))
+        return cursor.lastrowid
+    
+    def _add_metraj_kalemleri_cursor(self, cursor: sqlite3.Cursor, proje_id: int,
+                                     items: List[Dict[str, Any]]) -> None:
+        """
+        Birden fazla metraj kalemini tek executemany çağrısıyla ekle.
+        
+        Args:
+            cursor: Transaction'a bağlı cursor
+            proje_id: Proje ID'si
+            items: Kalem sözlükleri (yedek/şablon formatında)
+        """
+        now = datetime.now().isoformat()
+        cursor.executemany(_METRAJ_KALEM_INSERT_SQL, [
+            (proje_id, item.get('poz_no', ''), item.get('tanim', ''),
+             item.get('miktar', 0), item.get('birim', ''), item.get('birim_fiyat', 0),
+             item.get('toplam', 0), item.get('kategori', ''), now)
+            for item in items
+        ])
             
     def get_project_metraj(self, proje_id: int) -> List[Dict[str, Any]]:
         """
@@ -664,14 +1144,28 @@ class DatabaseManager:
         Returns:
             List[Dict]: Metraj kalemleri listesi
         """
+        return [dict(row) for row in self.iter_project_metraj(proje_id)]
+    
+    def iter_project_metraj(self, proje_id: int) -> Iterator[sqlite3.Row]:
+        """
+        Projeye ait metraj kalemlerini satır satır döndür.
+        
+        Tek geçişte tüketilen yerlerde (yedekleme vb.) liste ve dict
+        kopyası oluşturmadan sqlite3.Row nesneleri verir.
+        
+        Args:
+            proje_id: Proje ID'si
+            
+        Yields:
+            sqlite3.Row: Metraj kalemi satırı
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT * FROM metraj_kalemleri
                 WHERE proje_id = ?
                 ORDER BY kategori, tanim
             """, (proje_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        yield from _iter_rows(cursor)
             
     def update_metraj_kalem(self, item_id: int, **kwargs) -> bool:
         """
@@ -729,18 +1223,28 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            # Önce proje ID'sini al
-            cursor.execute("SELECT proje_id FROM metraj_kalemleri WHERE id = ?", (item_id,))
-            row = cursor.fetchone()
+            if RETURNING_DESTEKLI:
+                # Silme ve proje ID/toplam okuma tek sorguda
+                cursor.execute("""
+                    DELETE FROM metraj_kalemleri WHERE id = ?
+                    RETURNING proje_id, toplam
+                """, (item_id,))
+                row = cursor.fetchone()
+            else:
+                cursor.execute("SELECT proje_id, toplam FROM metraj_kalemleri WHERE id = ?", (item_id,))
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute("DELETE FROM metraj_kalemleri WHERE id = ?", (item_id,))
             
-            if row:
-                proje_id = row['proje_id']
-                # Kalemi sil
-                cursor.execute("DELETE FROM metraj_kalemleri WHERE id = ?", (item_id,))
-                # Proje toplamını güncelle
-                self._update_project_total(conn, proje_id)
-                return cursor.rowcount > 0
-            return False
+            if not row:
+                return False
+            
+            # Proje toplamından silinen kalemin tutarını düş (tüm kalemleri yeniden toplamadan)
+            cursor.execute("""
+                UPDATE projects SET toplam_maliyet = COALESCE(toplam_maliyet, 0) - ?
+                WHERE id = ?
+            """, (row['toplam'] or 0, row['proje_id']))
+            return True
             
     def _update_project_total(self, conn: sqlite3.Connection, proje_id: int) -> None:
         """Proje toplam maliyetini güncelle."""
@@ -777,17 +1281,21 @@ class DatabaseManager:
         Returns:
             int: Oluşturulan teklifin ID'si
         """
+        with self.get_connection() as conn:
+            return self._add_taseron_teklif_cursor(
+                conn.cursor(), proje_id, firma_adi, kalem_id, fiyat, poz_no, tanim, miktar, birim
+            )
+    
+    def _add_taseron_teklif_cursor(self, cursor: sqlite3.Cursor, proje_id: int, firma_adi: str,
+                                   kalem_id: Optional[int], fiyat: float,
+                                   poz_no: str = "", tanim: str = "",
+                                   miktar: float = 0, birim: str = "") -> int:
+        """Verilen cursor (transaction) üzerinden taşeron teklifi ekle."""
         toplam = miktar * fiyat if miktar > 0 else fiyat
         now = datetime.now().isoformat()
-        
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO taseron_teklifleri
-                (proje_id, firma_adi, kalem_id, poz_no, tanim, miktar, birim, fiyat, toplam, teklif_tarihi)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (proje_id, firma_adi, kalem_id, poz_no, tanim, miktar, birim, fiyat, toplam, now))
-            return cursor.lastrowid
+        cursor.execute(_TASERON_TEKLIF_INSERT_SQL,
+                       (proje_id, firma_adi, kalem_id, poz_no, tanim, miktar, birim, fiyat, toplam, now))
+        return cursor.lastrowid
             
     def get_taseron_teklifleri(self, proje_id: int) -> List[Dict[str, Any]]:
         """
@@ -799,14 +1307,25 @@ class DatabaseManager:
         Returns:
             List[Dict]: Taşeron teklifleri listesi
         """
+        return [dict(row) for row in self.iter_taseron_teklifleri(proje_id)]
+    
+    def iter_taseron_teklifleri(self, proje_id: int) -> Iterator[sqlite3.Row]:
+        """
+        Projeye ait taşeron tekliflerini satır satır döndür.
+        
+        Args:
+            proje_id: Proje ID'si
+            
+        Yields:
+            sqlite3.Row: Taşeron teklifi satırı
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT * FROM taseron_teklifleri
                 WHERE proje_id = ?
                 ORDER BY firma_adi, tanim
             """, (proje_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        yield from _iter_rows(cursor)
     
     def update_taseron_teklif(self, offer_id: int, **kwargs) -> bool:
         """
@@ -877,6 +1396,21 @@ class DatabaseManager:
         now = datetime.now().isoformat()
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            if RETURNING_DESTEKLI:
+                # Malzeme zaten varsa birim fiyatı girilmemişse güncelle; CASE ile
+                # çakışmada her zaman bir satır döner, ek SELECT gerekmez
+                cursor.execute("""
+                    INSERT INTO malzemeler (ad, birim, kategori, aciklama, birim_fiyat, olusturma_tarihi)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(ad) DO UPDATE SET
+                        birim = CASE WHEN birim_fiyat = 0 THEN excluded.birim ELSE birim END,
+                        kategori = CASE WHEN birim_fiyat = 0 THEN excluded.kategori ELSE kategori END,
+                        aciklama = CASE WHEN birim_fiyat = 0 THEN excluded.aciklama ELSE aciklama END
+                    RETURNING id
+                """, (ad, birim, kategori, aciklama, birim_fiyat, now))
+                row = cursor.fetchone()
+                return row['id'] if row else 0
+            
             try:
                 cursor.execute("""
                     INSERT INTO malzemeler (ad, birim, kategori, aciklama, birim_fiyat, olusturma_tarihi)
@@ -936,6 +1470,22 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            if RETURNING_DESTEKLI:
+                # Ekle veya güncelle, ID'yi aynı sorguda döndür
+                cursor.execute("""
+                    INSERT INTO malzeme_formulleri 
+                    (poz_id, malzeme_id, miktar, birim, formul_tipi, aciklama)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(poz_id, malzeme_id) DO UPDATE SET
+                        miktar = excluded.miktar,
+                        birim = excluded.birim,
+                        formul_tipi = excluded.formul_tipi,
+                        aciklama = excluded.aciklama
+                    RETURNING id
+                """, (poz_id, malzeme_id, miktar, birim, formul_tipi, aciklama))
+                row = cursor.fetchone()
+                return row['id'] if row else 0
+            
             try:
                 cursor.execute("""
                     INSERT INTO malzeme_formulleri 
@@ -969,47 +1519,14 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    mf.id,
-                    mf.poz_id,
-                    mf.malzeme_id,
-                    mf.miktar,
-                    mf.birim,
-                    mf.formul_tipi,
-                    mf.aciklama,
-                    m.ad as malzeme_adi,
-                    m.birim as malzeme_birim,
-                    m.kategori as malzeme_kategori
-                FROM malzeme_formulleri mf
-                JOIN malzemeler m ON mf.malzeme_id = m.id
-                WHERE mf.poz_id = ?
-                ORDER BY m.kategori, m.ad
-            """, (poz_id,))
+            cursor.execute(_POZ_FORMULLERI_SQL, (poz_id,))
             return [dict(row) for row in cursor.fetchall()]
             
     def get_poz_formulleri_by_poz_no(self, poz_no: str) -> List[Dict[str, Any]]:
         """Poz numarasına göre formülleri getir."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    mf.id,
-                    mf.poz_id,
-                    mf.malzeme_id,
-                    mf.miktar,
-                    mf.birim,
-                    mf.formul_tipi,
-                    mf.aciklama,
-                    m.ad as malzeme_adi,
-                    m.birim as malzeme_birim,
-                    m.kategori as malzeme_kategori
-                FROM malzeme_formulleri mf
-                JOIN malzemeler m ON mf.malzeme_id = m.id
-                JOIN pozlar p ON mf.poz_id = p.id
-                WHERE p.poz_no = ?
-                ORDER BY m.kategori, m.ad
-            """, (poz_no,))
+            cursor.execute(_POZ_FORMULLERI_BY_POZ_NO_SQL, (poz_no,))
             return [dict(row) for row in cursor.fetchall()]
     
     # Birim Dönüşüm İşlemleri
@@ -1061,26 +1578,21 @@ class DatabaseManager:
             if not project:
                 return False
             
-            # Metraj kalemlerini al
-            metraj_items = self.get_project_metraj(project_id)
-            
-            # Taşeron tekliflerini al
-            taseron_offers = self.get_taseron_teklifleri(project_id)
-            
-            # Yedek verisi oluştur
-            backup_data = {
-                'version': '1.0',
-                'backup_date': datetime.now().isoformat(),
-                'project': dict(project),
-                'metraj_items': [dict(item) for item in metraj_items],
-                'taseron_offers': [dict(offer) for offer in taseron_offers],
-                'taseron_teklifleri': [dict(offer) for offer in taseron_offers]  # Uyumluluk için
-            }
-            
-            # JSON dosyasına kaydet
+            # JSON dosyasına akıt: metraj kalemleri ve taşeron teklifleri
+            # listeye toplanmadan satır satır yazılır
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, ensure_ascii=False, indent=2)
+            with open(backup_path, 'wb') as f:
+                f.write(b'{\n')
+                _write_json_fields(f, {
+                    'version': '1.0',
+                    'backup_date': datetime.now().isoformat(),
+                    'project': project,
+                })
+                f.write(b'  "metraj_items": ')
+                _write_json_array(f, self.iter_project_metraj(project_id))
+                f.write(b',\n  "taseron_offers": ')
+                _write_json_array(f, self.iter_taseron_teklifleri(project_id))
+                f.write(b'\n}\n')
             
             return True
             
@@ -1101,8 +1613,7 @@ class DatabaseManager:
         """
         try:
             # Yedek dosyasını oku
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
+            backup_data = _json_loads(Path(backup_path).read_bytes())
             
             # Proje bilgilerini al
             project_data = backup_data.get('project', {})
@@ -1110,55 +1621,47 @@ class DatabaseManager:
             # Uyumluluk için hem 'taseron_offers' hem 'taseron_teklifleri' kontrol et
             taseron_offers = backup_data.get('taseron_offers', backup_data.get('taseron_teklifleri', []))
             
-            # Yeni proje oluştur
             project_name = new_project_name or project_data.get('ad', 'Geri Yüklenen Proje')
-            project_id = self.create_project(
-                ad=project_name,
-                aciklama=project_data.get('aciklama', '')
-            )
-            
-            # Metraj kalemlerini geri yükle
-            for item in metraj_items:
-                try:
-                    self.add_item(
-                        proje_id=project_id,
-                        poz_no=item.get('poz_no', ''),
-                        tanim=item.get('tanim', ''),
-                        kategori=item.get('kategori', ''),
-                        miktar=item.get('miktar', 0),
-                        birim=item.get('birim', ''),
-                        birim_fiyat=item.get('birim_fiyat', 0),
-                        toplam=item.get('toplam', 0)
-                    )
-                except Exception as e:
-                    print(f"Metraj kalemi geri yükleme hatası: {e}")
-                    continue
             
-            # Taşeron tekliflerini geri yükle
-            for offer in taseron_offers:
-                try:
-                    # Önce kalem ID'sini bul (poz_no'ya göre)
-                    kalem_id = None
-                    if offer.get('poz_no'):
-                        metraj = self.get_project_metraj(project_id)
-                        for item in metraj:
-                            if item.get('poz_no') == offer.get('poz_no'):
-                                kalem_id = item.get('id')
-                                break
+            # Tüm geri yükleme tek transaction içinde (satır başına commit yok)
+            with self._toplu_yazma(), self._txn() as cursor:
+                # Yeni proje oluştur
+                project_id = self._create_project_cursor(
+                    cursor, project_name, project_data.get('aciklama', '')
+                )
+                
+                # Metraj kalemlerini geri yükle (tek executemany)
+                self._add_metraj_kalemleri_cursor(cursor, project_id, metraj_items)
+                
+                # poz_no -> kalem ID eşlemesini bir kez oluştur (aynı poz_no'da ilk kalem geçerli)
+                metraj_map: Dict[str, int] = {}
+                cursor.execute("""
+                    SELECT id, poz_no FROM metraj_kalemleri
+                    WHERE proje_id = ?
+                    ORDER BY kategori, tanim
+                """, (project_id,))
+                for row in cursor.fetchall():
+                    metraj_map.setdefault(row['poz_no'], row['id'])
+                
+                # Taşeron tekliflerini geri yükle
+                now = datetime.now().isoformat()
+                teklif_satirlari = []
+                for offer in taseron_offers:
+                    poz_no = offer.get('poz_no')
+                    kalem_id = metraj_map.get(poz_no) if poz_no else None
                     
-                    self.add_taseron_teklif(
-                        proje_id=project_id,
-                        firma_adi=offer.get('firma_adi', ''),
-                        kalem_id=kalem_id,
-                        fiyat=offer.get('fiyat', 0),
-                        poz_no=offer.get('poz_no', ''),
-                        tanim=offer.get('tanim', ''),
-                        miktar=offer.get('miktar', 0),
-                        birim=offer.get('birim', '')
-                    )
-                except Exception as e:
-                    print(f"Taşeron teklifi geri yükleme hatası: {e}")
-                    continue
+                    miktar = offer.get('miktar', 0) or 0
+                    fiyat = offer.get('fiyat', 0) or 0
+                    teklif_satirlari.append((
+                        project_id, offer.get('firma_adi', ''), kalem_id,
+                        offer.get('poz_no', ''), offer.get('tanim', ''), miktar,
+                        offer.get('birim', ''), fiyat,
+                        miktar * fiyat if miktar > 0 else fiyat, now
+                    ))
+                cursor.executemany(_TASERON_TEKLIF_INSERT_SQL, teklif_satirlari)
+                
+                # Proje toplamını döngü sonunda bir kez güncelle
+                self._update_project_total(cursor.connection, project_id)
             
             return project_id
             
@@ -1179,27 +1682,53 @@ class DatabaseManager:
             bool: Başarılı ise True
         """
         try:
-            projects = self.get_all_projects()
-            backup_data = {
+            zarf = {
                 'version': '1.0',
                 'backup_date': datetime.now().isoformat(),
                 'backup_type': 'all_projects',
-                'projects': []
             }
             
-            for project in projects:
-                project_id = project['id']
-                project_backup = {
-                    'project': dict(project),
-                    'metraj_items': [dict(item) for item in self.get_project_metraj(project_id)],
-                    'taseron_offers': [dict(offer) for offer in self.get_taseron_teklifleri(project_id)]
-                }
-                backup_data['projects'].append(project_backup)
-            
-            # JSON dosyasına kaydet
+            # Projeler ve alt tablolar aynı proje_id sırasıyla üç imleçte birlikte
+            # ilerletilir: her proje, satırları okunur okunmaz yazılır ve bırakılır.
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, ensure_ascii=False, indent=2)
+            with self.get_connection() as conn, open(backup_path, 'wb') as f:
+                projects = conn.execute("SELECT * FROM projects ORDER BY id")
+                metraj_gruplari = groupby(conn.execute("""
+                    SELECT * FROM metraj_kalemleri
+                    ORDER BY proje_id, kategori, tanim
+                """), key=itemgetter('proje_id'))
+                taseron_gruplari = groupby(conn.execute("""
+                    SELECT * FROM taseron_teklifleri
+                    ORDER BY proje_id, firma_adi, tanim
+                """), key=itemgetter('proje_id'))
+                
+                def proje_satirlari(gruplar, durum, project_id):
+                    """Gruplardan project_id'ye ait satırları al; projesiz (yetim) grupları atla."""
+                    while durum[0] is not None and durum[0] < project_id:
+                        durum[:] = next(gruplar, (None, ()))
+                    if durum[0] != project_id:
+                        return []
+                    satirlar = [dict(row) for row in durum[1]]
+                    durum[:] = next(gruplar, (None, ()))
+                    return satirlar
+                
+                metraj_durum = list(next(metraj_gruplari, (None, ())))
+                taseron_durum = list(next(taseron_gruplari, (None, ())))
+                
+                f.write(b'{\n')
+                _write_json_fields(f, zarf)
+                f.write(b'  "projects": [\n')
+                for i, row in enumerate(projects):
+                    if i:
+                        f.write(b',\n')
+                    project_id = row['id']
+                    project_backup = {
+                        'project': dict(row),
+                        'metraj_items': proje_satirlari(metraj_gruplari, metraj_durum, project_id),
+                        'taseron_offers': proje_satirlari(taseron_gruplari, taseron_durum, project_id)
+                    }
+                    f.write(_json_dumps(project_backup))
+                f.write(b'\n  ]\n}\n')
             
             return True
             
@@ -1219,14 +1748,17 @@ class DatabaseManager:
         Returns:
             int: Oluşturulan şablonun ID'si
         """
-        now = datetime.now().isoformat()
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO sablonlar (ad, aciklama, olusturma_tarihi, guncelleme_tarihi)
-                VALUES (?, ?, ?, ?)
-            """, (ad, aciklama, now, now))
-            return cursor.lastrowid
+            return self._create_template_cursor(conn.cursor(), ad, aciklama)
+    
+    def _create_template_cursor(self, cursor: sqlite3.Cursor, ad: str, aciklama: str = "") -> int:
+        """Verilen cursor (transaction) üzerinden şablon oluştur."""
+        now = datetime.now().isoformat()
+        cursor.execute("""
+            INSERT INTO sablonlar (ad, aciklama, olusturma_tarihi, guncelleme_tarihi)
+            VALUES (?, ?, ?, ?)
+        """, (ad, aciklama, now, now))
+        return cursor.lastrowid
     
     def get_all_templates(self) -> List[Dict[str, Any]]:
         """
@@ -1298,13 +1830,27 @@ class DatabaseManager:
             int: Eklenen kalemin ID'si
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO sablon_kalemleri 
-                (sablon_id, poz_no, tanim, kategori, miktar, birim, birim_fiyat, toplam)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (sablon_id, poz_no, tanim, kategori, miktar, birim, birim_fiyat, toplam))
-            return cursor.lastrowid
+            return self._add_template_item_cursor(
+                conn.cursor(), sablon_id, poz_no, tanim, kategori, miktar, birim, birim_fiyat, toplam
+            )
+    
+    def _add_template_item_cursor(self, cursor: sqlite3.Cursor, sablon_id: int, poz_no: str = "",
+                                  tanim: str = "", kategori: str = "", miktar: float = 0,
+                                  birim: str = "", birim_fiyat: float = 0, toplam: float = 0) -> int:
+        """Verilen cursor (transaction) üzerinden şablon kalemi ekle."""
+        cursor.execute(_SABLON_KALEM_INSERT_SQL,
+                       (sablon_id, poz_no, tanim, kategori, miktar, birim, birim_fiyat, toplam))
+        return cursor.lastrowid
+    
+    def _add_template_items_cursor(self, cursor: sqlite3.Cursor, sablon_id: int,
+                                   items: List[Dict[str, Any]]) -> None:
+        """Birden fazla şablon kalemini tek executemany çağrısıyla ekle."""
+        cursor.executemany(_SABLON_KALEM_INSERT_SQL, [
+            (sablon_id, item.get('poz_no', ''), item.get('tanim', ''),
+             item.get('kategori', ''), item.get('miktar', 0), item.get('birim', ''),
+             item.get('birim_fiyat', 0), item.get('toplam', 0))
+            for item in items
+        ])
     
     def create_project_from_template(self, template_id: int, project_name: str, 
                                     project_description: str = "") -> Optional[int]:
@@ -1320,24 +1866,17 @@ class DatabaseManager:
             Optional[int]: Oluşturulan projenin ID'si
         """
         try:
-            # Yeni proje oluştur
-            project_id = self.create_project(project_name, project_description)
-            
             # Şablon kalemlerini al
             template_items = self.get_template_items(template_id)
             
-            # Kalemleri projeye ekle
-            for item in template_items:
-                self.add_item(
-                    proje_id=project_id,
-                    poz_no=item.get('poz_no', ''),
-                    tanim=item.get('tanim', ''),
-                    kategori=item.get('kategori', ''),
-                    miktar=item.get('miktar', 0),
-                    birim=item.get('birim', ''),
-                    birim_fiyat=item.get('birim_fiyat', 0),
-                    toplam=item.get('toplam', 0)
-                )
+            with self._txn() as cursor:
+                # Yeni proje oluştur
+                project_id = self._create_project_cursor(cursor, project_name, project_description)
+                
+                # Kalemleri projeye ekle
+                self._add_metraj_kalemleri_cursor(cursor, project_id, template_items)
+                
+                self._update_project_total(cursor.connection, project_id)
             
             return project_id
             
@@ -1361,24 +1900,15 @@ class DatabaseManager:
             Optional[int]: Oluşturulan şablonun ID'si
         """
         try:
-            # Yeni şablon oluştur
-            template_id = self.create_template(template_name, template_description)
-            
             # Proje kalemlerini al
             project_items = self.get_project_metraj(project_id)
             
-            # Kalemleri şablona ekle
-            for item in project_items:
-                self.add_template_item(
-                    sablon_id=template_id,
-                    poz_no=item.get('poz_no', ''),
-                    tanim=item.get('tanim', ''),
-                    kategori=item.get('kategori', ''),
-                    miktar=item.get('miktar', 0),
-                    birim=item.get('birim', ''),
-                    birim_fiyat=item.get('birim_fiyat', 0),
-                    toplam=item.get('toplam', 0)
-                )
+            with self._txn() as cursor:
+                # Yeni şablon oluştur
+                template_id = self._create_template_cursor(cursor, template_name, template_description)
+                
+                # Kalemleri şablona ekle
+                self._add_template_items_cursor(cursor, template_id, project_items)
             
             return template_id
             
@@ -1416,15 +1946,18 @@ class DatabaseManager:
         """
         if not kwargs:
             return False
-            
+        
+        gecersiz = set(kwargs) - _SABLON_GUNCELLENEBILIR
+        if gecersiz:
+            raise ValueError(f"Geçersiz şablon alanı: {', '.join(sorted(gecersiz))}")
+        
+        kolonlar = tuple(sorted(kwargs))
         now = datetime.now().isoformat()
-        fields = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        fields += ", guncelleme_tarihi = ?"
-        values = list(kwargs.values()) + [now, template_id]
+        values = [kwargs[k] for k in kolonlar] + [now, template_id]
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(f"UPDATE sablonlar SET {fields} WHERE id = ?", values)
+            cursor.execute(_update_sql("sablonlar", kolonlar, "guncelleme_tarihi"), values)
             return cursor.rowcount > 0
     
     def get_template_item(self, item_id: int) -> Optional[Dict[str, Any]]:
@@ -1498,22 +2031,16 @@ class DatabaseManager:
             if not original_template:
                 return None
             
-            # Yeni şablon oluştur
-            new_template_id = self.create_template(new_name, new_description or original_template.get('aciklama', ''))
-            
-            # Kalemleri kopyala
             items = self.get_template_items(template_id)
-            for item in items:
-                self.add_template_item(
-                    sablon_id=new_template_id,
-                    poz_no=item.get('poz_no', ''),
-                    tanim=item.get('tanim', ''),
-                    kategori=item.get('kategori', ''),
-                    miktar=item.get('miktar', 0),
-                    birim=item.get('birim', ''),
-                    birim_fiyat=item.get('birim_fiyat', 0),
-                    toplam=item.get('toplam', 0)
+            
+            with self._txn() as cursor:
+                # Yeni şablon oluştur
+                new_template_id = self._create_template_cursor(
+                    cursor, new_name, new_description or original_template.get('aciklama', '')
                 )
+                
+                # Kalemleri kopyala
+                self._add_template_items_cursor(cursor, new_template_id, items)
             
             return new_template_id
             
@@ -1629,27 +2156,107 @@ class DatabaseManager:
             if poz:
                 poz_id = poz['id']
         
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            # Yeni fiyat eklendiğinde eski fiyatları pasif yap (aynı poz için)
-            if poz_id:
-                cursor.execute("""
-                    UPDATE birim_fiyatlar SET aktif = 0
-                    WHERE poz_id = ? AND aktif = 1
-                """, (poz_id,))
-            elif poz_no:
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # Yeni fiyat eklendiğinde eski fiyatları pasif yap (aynı poz için)
+                if poz_id:
+                    cursor.execute("""
+                        UPDATE birim_fiyatlar SET aktif = 0
+                        WHERE poz_id = ? AND aktif = 1
+                    """, (poz_id,))
+                elif poz_no:
+                    cursor.execute("""
+                        UPDATE birim_fiyatlar SET aktif = 0
+                        WHERE poz_no = ? AND aktif = 1
+                    """, (poz_no,))
+                
+                # Yeni fiyatı ekle
                 cursor.execute("""
-                    UPDATE birim_fiyatlar SET aktif = 0
-                    WHERE poz_no = ? AND aktif = 1
-                """, (poz_no,))
+                    INSERT INTO birim_fiyatlar 
+                    (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, aktif)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, 1 if aktif else 0))
+                return cursor.lastrowid
+        finally:
+            # Commit/rollback sonrasında temizlenir (bkz. add_poz)
+            self._birim_fiyat_cache.clear()
+    
+    def add_birim_fiyatlar(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Birden fazla birim fiyatı tek transaction'da ekle.
+        
+        add_birim_fiyat ile aynı kurallar geçerlidir (eski aktif fiyatlar
+        pasif yapılır), ancak satır başına UPDATE + INSERT yerine tüm eski
+        fiyatlar tek UPDATE ile pasifleştirilir ve yeni fiyatlar executemany
+        ile eklenir. Aynı poz birden fazla kez geçiyorsa yalnızca son satır
+        aktif kalır.
+        
+        Args:
+            rows: add_birim_fiyat parametreleriyle aynı anahtarlara sahip
+                  sözlükler (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, aktif)
             
-            # Yeni fiyatı ekle
-            cursor.execute("""
-                INSERT INTO birim_fiyatlar 
-                (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, aktif)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, 1 if aktif else 0))
-            return cursor.lastrowid
+        Returns:
+            List[int]: Eklenen fiyatların ID'leri (rows sırasıyla)
+        """
+        if not rows:
+            return []
+        
+        now = datetime.now().isoformat()
+        try:
+            with self._txn() as cursor:
+                # poz_id'si verilmemiş satırlar için poz_no -> id eşlemesini toplu al
+                eksik_nolar = list({r.get('poz_no') for r in rows
+                                    if not r.get('poz_id') and r.get('poz_no')})
+                poz_id_map: Dict[str, int] = {}
+                for i in range(0, len(eksik_nolar), _IN_PARCA_BOYUTU):
+                    parca = eksik_nolar[i:i + _IN_PARCA_BOYUTU]
+                    cursor.execute(
+                        f"SELECT id, poz_no FROM pozlar WHERE poz_no IN ({','.join('?' * len(parca))})",
+                        parca)
+                    poz_id_map.update((row['poz_no'], row['id']) for row in cursor.fetchall())
+                
+                # Satırları hazırla; poz başına yalnızca son satır aktif kalabilir
+                hazir = []
+                son_index: Dict[Any, int] = {}
+                for i, r in enumerate(rows):
+                    poz_no = r.get('poz_no', '')
+                    poz_id = r.get('poz_id') or poz_id_map.get(poz_no)
+                    anahtar = ('id', poz_id) if poz_id else ('no', poz_no)
+                    if poz_id or poz_no:
+                        son_index[anahtar] = i
+                    hazir.append([poz_id, poz_no, r.get('birim_fiyat', 0), r.get('tarih') or now,
+                                  r.get('kaynak', ''), r.get('aciklama', ''),
+                                  1 if r.get('aktif', True) else 0, anahtar])
+                
+                for i, satir in enumerate(hazir):
+                    anahtar = satir.pop()
+                    if son_index.get(anahtar, i) != i:
+                        satir[6] = 0
+                
+                # Eski aktif fiyatları tek UPDATE ile pasif yap (parça parça)
+                poz_idler = list({k[1] for k in son_index if k[0] == 'id'})
+                poz_nolar = list({k[1] for k in son_index if k[0] == 'no'})
+                for degerler, kolon in ((poz_idler, 'poz_id'), (poz_nolar, 'poz_no')):
+                    for i in range(0, len(degerler), _IN_PARCA_BOYUTU):
+                        parca = degerler[i:i + _IN_PARCA_BOYUTU]
+                        cursor.execute(
+                            f"UPDATE birim_fiyatlar SET aktif = 0 "
+                            f"WHERE aktif = 1 AND {kolon} IN ({','.join('?' * len(parca))})",
+                            parca)
+                
+                # Yeni fiyatları ekle. Yazma kilidi transaction boyunca bizde olduğundan
+                # AUTOINCREMENT ID'ler ardışıktır; son ID'den geriye hesaplanır.
+                cursor.executemany("""
+                    INSERT INTO birim_fiyatlar 
+                    (poz_id, poz_no, birim_fiyat, tarih, kaynak, aciklama, aktif)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, hazir)
+                son_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                return list(range(son_id - len(hazir) + 1, son_id + 1))
+        finally:
+            # Commit/rollback sonrasında temizlenir (bkz. add_poz)
+            self._birim_fiyat_cache.clear()
     
     def get_birim_fiyat(self, poz_id: Optional[int] = None, poz_no: str = "",
                         aktif_only: bool = True) -> Optional[Dict[str, Any]]:
@@ -1664,8 +2271,15 @@ class DatabaseManager:
         Returns:
             Optional[Dict]: Birim fiyat bilgisi
         """
+        cache_key = (poz_id, poz_no, aktif_only)
+        hit, fiyat = self._cache_get(self._birim_fiyat_cache, cache_key)
+        if hit:
+            return fiyat
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # aktif = 1 sabit olarak yazılır: (poz_id|poz_no, aktif, tarih DESC) indeksinde
+            # iki sütunla arama yapılır ve ORDER BY için sıralama gerekmez
             if poz_id:
                 if aktif_only:
                     cursor.execute("""
@@ -1700,7 +2314,10 @@ class DatabaseManager:
                 return None
             
             row = cursor.fetchone()
-            return dict(row) if row else None
+            fiyat = dict(row) if row else None
+        
+        self._birim_fiyat_cache[cache_key] = (time.monotonic(), fiyat)
+        return dict(fiyat) if fiyat else None
     
     def get_birim_fiyat_gecmisi(self, poz_id: Optional[int] = None, poz_no: str = "",
                                 limit: int = 50) -> List[Dict[str, Any]]:
@@ -1765,61 +2382,69 @@ class DatabaseManager:
                 """)
             return [dict(row) for row in cursor.fetchall()]
     
-    def compare_birim_fiyatlar(self, poz_no: str) -> Dict[str, Any]:
+    def compare_birim_fiyatlar(self, poz_no: str,
+                               fiyatlari_dahil: bool = False) -> Dict[str, Any]:
         """
         Poz için fiyat karşılaştırması yap.
         
+        En düşük/en yüksek/ortalama değerler son 100 fiyat kaydı üzerinden
+        SQL içinde hesaplanır; Python'a yalnızca kaynak-fiyat çiftleri gelir.
+        
         Args:
             poz_no: Poz numarası
+            fiyatlari_dahil: True ise sonuca tam fiyat kayıtları ('fiyatlar') eklenir
             
         Returns:
             Dict: Karşılaştırma sonuçları (en düşük, en yüksek, ortalama, kaynaklar)
         """
-        fiyatlar = self.get_birim_fiyat_gecmisi(poz_no=poz_no, limit=100)
-        
-        if not fiyatlar:
-            return {
-                'poz_no': poz_no,
-                'fiyat_sayisi': 0,
-                'en_dusuk': None,
-                'en_yuksek': None,
-                'ortalama': None,
-                'kaynaklar': []
-            }
-        
-        fiyat_degerleri = [f['birim_fiyat'] for f in fiyatlar if f.get('birim_fiyat')]
-        
-        if not fiyat_degerleri:
-            return {
-                'poz_no': poz_no,
-                'fiyat_sayisi': 0,
-                'en_dusuk': None,
-                'en_yuksek': None,
-                'ortalama': None,
-                'kaynaklar': []
-            }
-        
-        en_dusuk = min(fiyat_degerleri)
-        en_yuksek = max(fiyat_degerleri)
-        ortalama = sum(fiyat_degerleri) / len(fiyat_degerleri)
-        
-        # Kaynakları topla
-        kaynaklar = {}
-        for f in fiyatlar:
-            kaynak = f.get('kaynak', 'Belirtilmemiş')
-            if kaynak not in kaynaklar:
-                kaynaklar[kaynak] = []
-            kaynaklar[kaynak].append(f['birim_fiyat'])
+        with self.get_connection() as conn:
+            # Sıfır/boş fiyatlar istatistiğe katılmaz (NULLIF)
+            ozet = conn.execute("""
+                WITH son AS (
+                    SELECT birim_fiyat FROM birim_fiyatlar
+                    WHERE poz_no = ?
+                    ORDER BY tarih DESC
+                    LIMIT 100
+                )
+                SELECT COUNT(*) AS fiyat_sayisi,
+                       MIN(NULLIF(birim_fiyat, 0)) AS en_dusuk,
+                       MAX(NULLIF(birim_fiyat, 0)) AS en_yuksek,
+                       AVG(NULLIF(birim_fiyat, 0)) AS ortalama
+                FROM son
+            """, (poz_no,)).fetchone()
+            
+            if ozet['en_dusuk'] is None:
+                return {
+                    'poz_no': poz_no,
+                    'fiyat_sayisi': 0,
+                    'en_dusuk': None,
+                    'en_yuksek': None,
+                    'ortalama': None,
+                    'kaynaklar': []
+                }
+            
+            # Kaynakları topla
+            kaynaklar: Dict[str, List[float]] = {}
+            for kaynak, birim_fiyat in conn.execute("""
+                SELECT COALESCE(kaynak, 'Belirtilmemiş'), birim_fiyat
+                FROM birim_fiyatlar
+                WHERE poz_no = ?
+                ORDER BY tarih DESC
+                LIMIT 100
+            """, (poz_no,)):
+                kaynaklar.setdefault(kaynak, []).append(birim_fiyat)
         
-        return {
+        sonuc = {
             'poz_no': poz_no,
-            'fiyat_sayisi': len(fiyatlar),
-            'en_dusuk': en_dusuk,
-            'en_yuksek': en_yuksek,
-            'ortalama': ortalama,
-            'kaynaklar': kaynaklar,
-            'fiyatlar': fiyatlar
+            'fiyat_sayisi': ozet['fiyat_sayisi'],
+            'en_dusuk': ozet['en_dusuk'],
+            'en_yuksek': ozet['en_yuksek'],
+            'ortalama': ozet['ortalama'],
+            'kaynaklar': kaynaklar
         }
+        if fiyatlari_dahil:
+            sonuc['fiyatlar'] = self.get_birim_fiyat_gecmisi(poz_no=poz_no, limit=100)
+        return sonuc
     
     def delete_pdf_imported_data(self) -> Dict[str, int]:
         """
@@ -1828,51 +2453,42 @@ class DatabaseManager:
         Returns:
             Dict: Silinen kayıt sayıları {'pozlar': int, 'birim_fiyatlar': int}
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 1. Önce PDF Import kaynaklı birim fiyatların poz_no'larını topla
-            cursor.execute("""
-                SELECT DISTINCT poz_no 
-                FROM birim_fiyatlar 
-                WHERE kaynak = 'PDF Import' AND poz_no IS NOT NULL
-            """)
-            pdf_poz_nos = [row['poz_no'] for row in cursor.fetchall()]
-            
-            # 2. Bu poz numaralarına sahip pozları sil (sadece PDF'den eklenenleri)
-            # PDF'den eklenen pozlar genellikle tanımında "PDF'den içe aktarıldı" içerir
-            # veya sadece PDF Import kaynaklı birim fiyatları vardır
-            deleted_poz_count = 0
-            for poz_no in pdf_poz_nos:
-                # Pozun başka kaynaklı birim fiyatı var mı kontrol et
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 1. PDF Import kaynaklı birim fiyatı olan ve başka kaynaktan fiyatı
+                # olmayan pozları tek sorguda sil (sadece PDF'den eklenenleri).
+                # PDF'den eklenen pozlar genellikle tanımında "PDF'den içe aktarıldı" içerir
+                # veya sadece PDF Import kaynaklı birim fiyatları vardır
                 cursor.execute("""
-                    SELECT COUNT(*) as count 
-                    FROM birim_fiyatlar 
-                    WHERE poz_no = ? AND (kaynak != 'PDF Import' OR kaynak IS NULL)
-                """, (poz_no,))
-                other_sources = cursor.fetchone()['count']
+                    DELETE FROM pozlar 
+                    WHERE poz_no IN (
+                        SELECT poz_no FROM birim_fiyatlar WHERE kaynak = 'PDF Import'
+                    )
+                    AND (tanim LIKE '%PDF%içe aktarıldı%' OR tanim LIKE '%PDF Import%' OR tanim = '' OR tanim IS NULL)
+                    AND NOT EXISTS (
+                        SELECT 1 FROM birim_fiyatlar bf
+                        WHERE bf.poz_no = pozlar.poz_no
+                        AND (bf.kaynak != 'PDF Import' OR bf.kaynak IS NULL)
+                    )
+                """)
+                deleted_poz_count = cursor.rowcount
                 
-                # Eğer başka kaynak yoksa, pozun PDF'den eklenmiş olma ihtimali yüksek
-                # Pozu sil (tanımı "PDF'den içe aktarıldı" içeriyorsa veya başka kaynak yoksa)
-                if other_sources == 0:
-                    cursor.execute("""
-                        DELETE FROM pozlar 
-                        WHERE poz_no = ? 
-                        AND (tanim LIKE '%PDF%içe aktarıldı%' OR tanim LIKE '%PDF Import%' OR tanim = '' OR tanim IS NULL)
-                    """, (poz_no,))
-                    deleted_poz_count += cursor.rowcount
-            
-            # 3. PDF Import kaynaklı tüm birim fiyatları sil
-            cursor.execute("""
-                DELETE FROM birim_fiyatlar 
-                WHERE kaynak = 'PDF Import'
-            """)
-            deleted_fiyat_count = cursor.rowcount
-            
-            return {
-                'pozlar': deleted_poz_count,
-                'birim_fiyatlar': deleted_fiyat_count
-            }
+                # 2. PDF Import kaynaklı tüm birim fiyatları sil
+                cursor.execute("""
+                    DELETE FROM birim_fiyatlar 
+                    WHERE kaynak = 'PDF Import'
+                """)
+                deleted_fiyat_count = cursor.rowcount
+                
+                return {
+                    'pozlar': deleted_poz_count,
+                    'birim_fiyatlar': deleted_fiyat_count
+                }
+        finally:
+            # Commit/rollback sonrasında temizlenir (bkz. add_poz)
+            self.invalidate_cache()
     
     def get_poz_by_no(self, poz_no: str) -> Optional[Dict[str, Any]]:
         """
@@ -1884,11 +2500,18 @@ class DatabaseManager:
         Returns:
             Optional[Dict]: Poz bilgisi
         """
+        hit, poz = self._cache_get(self._poz_by_no_cache, poz_no)
+        if hit:
+            return poz
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM pozlar WHERE poz_no = ?", (poz_no,))
+            cursor.execute(_POZ_BY_NO_SQL, (poz_no,))
             row = cursor.fetchone()
-            return dict(row) if row else None
+            poz = dict(row) if row else None
+        
+        self._poz_by_no_cache[poz_no] = (time.monotonic(), poz)
+        return dict(poz) if poz else None
     
     # İhale İşlemleri
     def create_ihale(self, ad: str, aciklama: str = "") -> int:
@@ -1932,13 +2555,7 @@ class DatabaseManager:
     def get_ihale_kalemleri(self, ihale_id: int) -> List[Dict[str, Any]]:
         """İhale kalemlerini getir"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM ihale_kalemleri
-                WHERE ihale_id = ?
-                ORDER BY sira_no, id
-            """, (ihale_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_to_dicts(conn.execute(_IHALE_KALEMLERI_SQL, (ihale_id,)))
     
     def add_ihale_kalem(self, ihale_id: int, poz_no: str = "", poz_tanim: str = "",
                        kategori: str = "", birim_miktar: float = 0, birim: str = "",
@@ -1960,45 +2577,86 @@ class DatabaseManager:
         Returns:
             int: Eklenen kalemin ID'si
         """
-        # Sıra numarası yoksa, mevcut maksimum + 1
-        if sira_no is None:
-            kalemler = self.get_ihale_kalemleri(ihale_id)
-            sira_no = len(kalemler) + 1
-        
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO ihale_kalemleri 
-                (ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no))
+            if sira_no is None:
+                # Sıra numarası yoksa, mevcut maksimum + 1 (INSERT içinde, indeksten)
+                cursor = conn.execute(_IHALE_KALEM_INSERT_SIRALI_SQL, (
+                    ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, ihale_id
+                ))
+            else:
+                cursor = conn.execute(_IHALE_KALEM_INSERT_SQL, (
+                    ihale_id, poz_no, poz_tanim, kategori, birim_miktar, birim, birim_fiyat, toplam, sira_no
+                ))
             return cursor.lastrowid
     
+    def add_ihale_kalemler_bulk(self, ihale_id: int, kalemler: List[Dict[str, Any]]) -> List[int]:
+        """
+        İhaleye birden fazla kalemi tek transaction'da ekle.
+        
+        Sıra numarası verilmeyen kalemler, ihaledeki mevcut en büyük
+        sira_no'dan itibaren sırayla numaralanır.
+        
+        Args:
+            ihale_id: İhale ID'si
+            kalemler: add_ihale_kalem parametreleriyle aynı anahtarlara sahip sözlükler
+            
+        Returns:
+            List[int]: Eklenen kalemlerin ID'leri (kalemler sırasıyla)
+        """
+        if not kalemler:
+            return []
+        
+        with self._txn() as cursor:
+            cursor.execute(
+                "SELECT COALESCE(MAX(sira_no), 0) FROM ihale_kalemleri WHERE ihale_id = ?",
+                (ihale_id,))
+            sira = cursor.fetchone()[0]
+            
+            satirlar = []
+            for kalem in kalemler:
+                sira_no = kalem.get('sira_no')
+                if sira_no is None:
+                    sira += 1
+                    sira_no = sira
+                satirlar.append((
+                    ihale_id, kalem.get('poz_no', ''), kalem.get('poz_tanim', ''),
+                    kalem.get('kategori', ''), kalem.get('birim_miktar', 0),
+                    kalem.get('birim', ''), kalem.get('birim_fiyat', 0),
+                    kalem.get('toplam', 0), sira_no
+                ))
+            cursor.executemany(_IHALE_KALEM_INSERT_SQL, satirlar)
+            
+            # Yazma kilidi bizde: AUTOINCREMENT ID'ler ardışık
+            son_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            return list(range(son_id - len(satirlar) + 1, son_id + 1))
+    
     def update_ihale_kalem(self, kalem_id: int, **kwargs) -> bool:
         """İhale kalemini güncelle"""
         if not kwargs:
             return False
         
-        fields = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [kalem_id]
+        gecersiz = set(kwargs) - _KALEM_COLS
+        if gecersiz:
+            raise ValueError(f"Geçersiz ihale kalemi alanı: {', '.join(sorted(gecersiz))}")
+        
+        # Aynı kolon kümesi için SQL metni bir kez üretilir (sorgu önbelleği isabeti)
+        kolonlar = tuple(sorted(kwargs))
+        values = [kwargs[k] for k in kolonlar] + [kalem_id]
         
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(f"UPDATE ihale_kalemleri SET {fields} WHERE id = ?", values)
+            cursor = conn.execute(_update_sql("ihale_kalemleri", kolonlar), values)
             return cursor.rowcount > 0
     
     def delete_ihale_kalem(self, kalem_id: int) -> bool:
         """İhale kalemini sil"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM ihale_kalemleri WHERE id = ?", (kalem_id,))
+            cursor = conn.execute(_IHALE_KALEM_DELETE_SQL, (kalem_id,))
             return cursor.rowcount > 0
     
     def delete_ihale(self, ihale_id: int) -> bool:
         """İhaleyi sil (kalemleri de silinir - CASCADE)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM ihaleler WHERE id = ?", (ihale_id,))
+            cursor = conn.execute(_IHALE_DELETE_SQL, (ihale_id,))
             return cursor.rowcount > 0
     
     def search_pozlar(self, search_text: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -2011,47 +2669,57 @@ class DatabaseManager:
             limit: Maksimum sonuç sayısı
             
         Returns:
-            List[Dict]: Bulunan pozlar
+            List[Dict]: Bulunan pozlar (id, poz_no, tanim, birim, resmi_fiyat, kategori)
+        """
+        return list(self.iter_search_pozlar(search_text, limit))
+    
+    def iter_search_pozlar(self, search_text: str, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        search_pozlar ile aynı aramayı sonuçları biriktirmeden satır satır döndür.
+        
+        Büyük limitli dışa aktarımlarda (CSV/Excel) tüm sonuç listesi
+        bellekte tutulmadan yazılabilir.
+        
+        Args:
+            search_text: Arama metni
+            limit: Maksimum sonuç sayısı
+            
+        Yields:
+            Dict: Bulunan poz
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
             search_text = search_text.strip()
             
             # Eğer arama metni tam poz numarası formatındaysa (nokta içeriyorsa)
             # önce tam eşleşme dene, sonra kısmi eşleşme
             if '.' in search_text:
-                # Tam poz numarası araması - önce tam eşleşme
-                cursor.execute("""
-                    SELECT * FROM pozlar
-                    WHERE poz_no = ?
-                    ORDER BY poz_no
-                    LIMIT ?
-                """, (search_text, limit))
-                exact_matches = [dict(row) for row in cursor.fetchall()]
-                
-                # Eğer tam eşleşme varsa onları döndür
-                if exact_matches:
-                    return exact_matches
+                # Tam poz numarası araması - önce tam eşleşme (poz_no UNIQUE: en fazla 1 satır)
+                tam = conn.execute(_POZ_ARAMA_TAM_SQL, (search_text,)) if limit > 0 else None
+                row = tam.fetchone() if tam else None
                 
-                # Tam eşleşme yoksa, başlangıçtan eşleşenleri ara (15.250.1011 -> 15.250 ile başlayanlar)
-                search_pattern = f"{search_text}%"
-                cursor.execute("""
-                    SELECT * FROM pozlar
-                    WHERE poz_no LIKE ? OR tanim LIKE ?
-                    ORDER BY poz_no
-                    LIMIT ?
-                """, (search_pattern, f"%{search_text}%", limit))
-                return [dict(row) for row in cursor.fetchall()]
+                if row:
+                    # Eğer tam eşleşme varsa onu döndür
+                    rows = [dict(zip((d[0] for d in tam.description), row))]
+                else:
+                    # Tam eşleşme yoksa, başlangıçtan eşleşenleri ara (15.250.1011 -> 15.250 ile başlayanlar).
+                    # İki dal birleştirilip sıralandığından sonuç (en fazla 2 × limit) önce toplanır.
+                    cursor = conn.execute(_POZ_ONEK_ARAMA_SQL, (
+                        f"{search_text}%", limit,
+                        f"%{search_text}%", limit
+                    ))
+                    sonuc: Dict[int, Dict[str, Any]] = {}
+                    for poz in _iter_dicts(cursor):
+                        sonuc.setdefault(poz['id'], poz)
+                    rows = sorted(sonuc.values(), key=lambda p: p['poz_no'])[:limit]
+            elif self._fts_aktif and len(search_text) >= 3:
+                # Nokta yoksa trigram indeksinde alt dizi (phrase) araması yap
+                ifade = '"' + search_text.replace('"', '""') + '"'
+                rows = _iter_dicts(conn.execute(_POZ_FTS_ARAMA_SQL, (ifade, limit)))
             else:
-                # Nokta yoksa, normal LIKE araması yap
+                # Kısa aramalarda (trigram için < 3 karakter) normal LIKE araması yap
                 search_pattern = f"%{search_text}%"
-                cursor.execute("""
-                    SELECT * FROM pozlar
-                    WHERE poz_no LIKE ? OR tanim LIKE ?
-                    ORDER BY poz_no
-                    LIMIT ?
-                """, (search_pattern, search_pattern, limit))
-                return [dict(row) for row in cursor.fetchall()]
+                rows = _iter_dicts(conn.execute(_POZ_ARAMA_SQL, (search_pattern, search_pattern, limit)))
+        yield from rows
     
     # Taşeron İşlemleri
     def create_taseron_is(self, is_adi: str, aciklama: str = "") -> int:
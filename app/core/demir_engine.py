@@ -8,11 +8,25 @@ from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import logging
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Demir text desenleri (DXF okumasında varlık başına çağrılır; bir kez derlenir)
+# 56Ø12 l=1200, 56@12 l=1200, 56 Ø 12 l=1200 (boşluk toleranslı tek desen)
+_DEMIR_RE = re.compile(r'(\d+)\s*[Ø@]\s*(\d+).*?l=(\d+)')
+# Tablo donatısı: 12Ø10/20
+_TABLO_DONATI_RE = re.compile(r'(\d+)[Ø@](\d+)')
+
 
 class TemelTipi(Enum):
     """Temel tiplerileri"""
@@ -22,9 +36,21 @@ class TemelTipi(Enum):
     KIRIŞ_LI_TEMEL = "kirişli_temel"
 
 
-@dataclass
+# hesaplar_dizisi() çıktısının NumPy yapılandırılmış dizi tipi
+DEMIR_DIZI_DTYPE = [
+    ('poz_no', 'U16'), ('eleman_tipi', 'U16'), ('adet', 'i4'), ('demir_capi', 'i2'),
+    ('uzunluk', 'f4'), ('toplam_uzunluk', 'f4'), ('birim_agirlik', 'f4'), ('toplam_agirlik', 'f4'),
+]
+
+
+@dataclass(frozen=True)
 class DemirHesap:
     """Demir hesaplama sonuçları"""
+    # Binlerce kayıt tutulduğundan örnek başına __dict__ oluşturulmaz
+    # (dataclass(slots=True) Python 3.10 gerektirir; README 3.8+ destekliyor)
+    __slots__ = ('poz_no', 'eleman_tipi', 'eleman_adi', 'adet', 'demir_capi',
+                 'uzunluk', 'toplam_uzunluk', 'birim_agirlik', 'toplam_agirlik')
+    
     poz_no: str  # Poz numarası
     eleman_tipi: str  # "temel_kesit", "temel_ilave", "sehpa", "kolon_filizi", "kolon_etriye", "hatil"
     eleman_adi: str
@@ -55,9 +81,113 @@ class DemirEngine:
         32: 6.313,
     }
     
+    # Çap/ağırlık tabloları (toplu hesap için sıralı)
+    _CAPLAR = tuple(sorted(DEMIR_ORANLAR))
+    _AGIRLIKLAR = tuple(map(DEMIR_ORANLAR.__getitem__, _CAPLAR))
+    # Komşu çapların orta noktaları: en yakın çap ikili arama ile bulunur.
+    # Tam orta noktada küçük çap seçilir (bisect_left / searchsorted 'left').
+    _CAP_SINIRLARI = tuple((a + b) / 2 for a, b in zip(_CAPLAR, _CAPLAR[1:]))
+    
     def __init__(self):
         """Demir Engine'i başlat"""
         self.hesaplamalar: List[DemirHesap] = []
+        
+        # Özetler için artımlı toplamlar: demir_ekle / demir_ekle_toplu / hesap_ekle
+        # her kaydı eklerken hemen katar. hesaplamalar listesi dışarıdan
+        # değiştirilirse (clear, atama, eleman değişimi) toplamlar baştan kurulur.
+        self._toplamlari_sifirla()
+    
+    def _toplamlari_sifirla(self) -> None:
+        """Artımlı toplamları boşalt"""
+        self._toplanan = 0
+        self._son_hesap: Optional[DemirHesap] = None
+        self._tip_hesaplar: Dict[str, List[DemirHesap]] = {}
+        self._tip_agirlik: Dict[str, float] = {}
+        self._tip_uzunluk: Dict[str, float] = {}
+        self._genel_agirlik = 0.0
+        self._genel_uzunluk = 0.0
+    
+    def _toplamlara_ekle(self, hesaplar) -> None:
+        """
+        Hesapları artımlı toplamlara kat
+        
+        Args:
+            hesaplar: hesaplamalar listesinin sonuna yeni eklenmiş hesaplar
+        """
+        for h in hesaplar:
+            tip = h.eleman_tipi
+            if tip not in self._tip_hesaplar:
+                self._tip_hesaplar[tip] = []
+                self._tip_agirlik[tip] = 0.0
+                self._tip_uzunluk[tip] = 0.0
+            self._tip_hesaplar[tip].append(h)
+            self._tip_agirlik[tip] += h.toplam_agirlik
+            self._tip_uzunluk[tip] += h.toplam_uzunluk
+            self._genel_agirlik += h.toplam_agirlik
+            self._genel_uzunluk += h.toplam_uzunluk
+            self._son_hesap = h
+        self._toplanan = len(self.hesaplamalar)
+    
+    def _toplamlari_guncelle(self) -> None:
+        """
+        hesaplamalar listesi dışarıdan değiştirildiyse toplamları baştan kur
+        
+        Uzunluk ve son toplanan kaydın kimliği karşılaştırılır; yalnızca
+        uzunluğa bakmak clear() sonrası aynı sayıda eklemeyi kaçırır.
+        """
+        hesaplar = self.hesaplamalar
+        if len(hesaplar) == self._toplanan and (
+                not hesaplar or hesaplar[-1] is self._son_hesap):
+            return
+        self._toplamlari_sifirla()
+        self._toplamlara_ekle(hesaplar)
+    
+    def demir_sil(self, hesap: DemirHesap) -> bool:
+        """
+        Demir hesabını kaldır ve özet toplamlarından düş
+        
+        Args:
+            hesap: demir_ekle / demir_ekle_toplu ile dönen hesap nesnesi
+            
+        Returns:
+            bool: Hesap bulunup silindiyse True
+        """
+        self._toplamlari_guncelle()
+        
+        for i, h in enumerate(self.hesaplamalar):
+            if h is hesap:
+                break
+        else:
+            return False
+        
+        del self.hesaplamalar[i]
+        self._toplanan -= 1
+        self._son_hesap = self.hesaplamalar[-1] if self.hesaplamalar else None
+        
+        tip = hesap.eleman_tipi
+        tip_listesi = self._tip_hesaplar[tip]
+        for j, h in enumerate(tip_listesi):
+            if h is hesap:
+                del tip_listesi[j]
+                break
+        if tip_listesi:
+            self._tip_agirlik[tip] -= hesap.toplam_agirlik
+            self._tip_uzunluk[tip] -= hesap.toplam_uzunluk
+        else:
+            del self._tip_hesaplar[tip], self._tip_agirlik[tip], self._tip_uzunluk[tip]
+        if self.hesaplamalar:
+            self._genel_agirlik -= hesap.toplam_agirlik
+            self._genel_uzunluk -= hesap.toplam_uzunluk
+        else:
+            self._genel_agirlik = 0.0
+            self._genel_uzunluk = 0.0
+        
+        return True
+    
+    @classmethod
+    def en_yakin_cap(cls, demir_capi: float) -> int:
+        """Verilen çapa en yakın standart demir çapını döndür (O(log n))"""
+        return cls._CAPLAR[bisect_left(cls._CAP_SINIRLARI, demir_capi)]
     
     def demir_ekle(self, poz_no: str, eleman_tipi: str, eleman_adi: str,
                    adet: int, demir_capi: int, uzunluk: float) -> DemirHesap:
@@ -74,7 +204,7 @@ class DemirEngine:
         """
         if demir_capi not in self.DEMIR_ORANLAR:
             logger.warning(f"Bilinmeyen demir çapı: {demir_capi}mm, en yakın değer kullanılıyor")
-            demir_capi = min(self.DEMIR_ORANLAR.keys(), key=lambda x: abs(x - demir_capi))
+            demir_capi = self.en_yakin_cap(demir_capi)
         
         toplam_uzunluk = adet * uzunluk
         birim_agirlik = self.DEMIR_ORANLAR[demir_capi]
@@ -92,24 +222,116 @@ class DemirEngine:
             toplam_agirlik=toplam_agirlik
         )
         
-        self.hesaplamalar.append(hesap)
-        logger.debug(f"Demir eklendi: {poz_no} - {adet}Ø{demir_capi} l={uzunluk}cm")
+        self.hesap_ekle(hesap)
+        logger.debug("Demir eklendi: %s - %sØ%s l=%scm", poz_no, adet, demir_capi, uzunluk)
         
         return hesap
     
+    def hesap_ekle(self, hesap: DemirHesap) -> None:
+        """
+        Hazır bir demir hesabını listeye ekle ve özet toplamlarına kat
+        
+        Args:
+            hesap: Eklenecek demir hesabı
+        """
+        self._toplamlari_guncelle()
+        self.hesaplamalar.append(hesap)
+        self._toplamlara_ekle((hesap,))
+    
+    def demir_ekle_toplu(self, kayitlar: List[Tuple[str, str, str, int, int, float]]) -> List[DemirHesap]:
+        """
+        Birden fazla demir hesabını tek seferde ekle
+        
+        NumPy varsa çap eşleme ve ağırlık hesapları tüm kayıtlar için tek
+        vektörel geçişte yapılır; yoksa her kayıt için demir_ekle çağrılır.
+        
+        Args:
+            kayitlar: (poz_no, eleman_tipi, eleman_adi, adet, demir_capi, uzunluk) listesi
+            
+        Returns:
+            List[DemirHesap]: Eklenen hesaplar (kayitlar sırasıyla)
+        """
+        if not kayitlar:
+            return []
+        
+        if not NUMPY_AVAILABLE:
+            return [self.demir_ekle(*kayit) for kayit in kayitlar]
+        
+        poz_nolar, tipler, adlar, adetler, caplar, uzunluklar = zip(*kayitlar)
+        adet_arr = np.asarray(adetler, dtype=np.int64)
+        # float64: kesirli çaplar (ör. 13.5) tam sayıya kırpılmadan en yakın çapa eşlenir
+        cap_arr = np.asarray(caplar, dtype=np.float64)
+        uzunluk_arr = np.asarray(uzunluklar, dtype=np.float64)
+        
+        # Her kayıt için en yakın standart çap (eşitlikte küçük çap, demir_ekle ile aynı)
+        idx = np.searchsorted(self._CAP_SINIRLARI, cap_arr, side='left')
+        eslenen_caplar = np.asarray(self._CAPLAR)[idx]
+        bilinmeyen = (eslenen_caplar != cap_arr).tolist()
+        for cap in dict.fromkeys(cap for cap, b in zip(caplar, bilinmeyen) if b):
+            logger.warning("Bilinmeyen demir çapı: %smm, en yakın değer kullanılıyor", cap)
+        
+        birim_agirliklar = np.asarray(self._AGIRLIKLAR)[idx]
+        toplam_uzunluklar = adet_arr * uzunluk_arr
+        toplam_agirliklar = (toplam_uzunluklar / 100) * birim_agirliklar  # cm'den m'ye çevir
+        
+        yeni = [
+            DemirHesap(
+                poz_no=poz_no,
+                eleman_tipi=tip,
+                eleman_adi=ad,
+                adet=adet,
+                demir_capi=cap,
+                uzunluk=uzunluk,
+                toplam_uzunluk=toplam_uzunluk,
+                birim_agirlik=birim_agirlik,
+                toplam_agirlik=toplam_agirlik
+            )
+            for poz_no, tip, ad, adet, cap, uzunluk, toplam_uzunluk, birim_agirlik, toplam_agirlik in zip(
+                poz_nolar, tipler, adlar, adet_arr.tolist(), eslenen_caplar.tolist(),
+                uzunluk_arr.tolist(), toplam_uzunluklar.tolist(),
+                birim_agirliklar.tolist(), toplam_agirliklar.tolist()
+            )
+        ]
+        self._toplamlari_guncelle()
+        self.hesaplamalar.extend(yeni)
+        self._toplamlara_ekle(yeni)
+        logger.debug("%s demir hesabı toplu eklendi", len(yeni))
+        
+        return yeni
+    
+    def hesaplar_dizisi(self):
+        """
+        Hesapları NumPy yapılandırılmış dizisi olarak döndür
+        
+        Toplu analizlerde kolon bazlı işlem için kullanılır,
+        ör. dizi['toplam_agirlik'].sum()
+        
+        Returns:
+            numpy.ndarray: DEMIR_DIZI_DTYPE tipinde dizi (NumPy yoksa None)
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        
+        return np.array(
+            [(h.poz_no, h.eleman_tipi, h.adet, h.demir_capi, h.uzunluk,
+              h.toplam_uzunluk, h.birim_agirlik, h.toplam_agirlik)
+             for h in self.hesaplamalar],
+            dtype=DEMIR_DIZI_DTYPE
+        )
+    
     def ozet_by_type(self) -> Dict[str, Dict[str, Any]]:
-        """Eleman tipi bazında özet hesaplama yap"""
-        ozet = {}
+        """
+        Eleman tipi bazında özet hesaplama yap
         
-        tiplar = {}
-        for h in self.hesaplamalar:
-            if h.eleman_tipi not in tiplar:
-                tiplar[h.eleman_tipi] = []
-            tiplar[h.eleman_tipi].append(h)
+        Tip toplamları 2 haneye yuvarlanır; detay satırlarındaki değerler
+        ham bırakılır, gösterimde biçimlendirilir (ör. f"{x:.2f}").
+        """
+        self._toplamlari_guncelle()
+        ozet = {}
         
-        for tip, hesaplar in tiplar.items():
-            toplam_agirlik = sum(h.toplam_agirlik for h in hesaplar)
-            toplam_uzunluk = sum(h.toplam_uzunluk for h in hesaplar)
+        for tip, hesaplar in self._tip_hesaplar.items():
+            toplam_agirlik = self._tip_agirlik[tip]
+            toplam_uzunluk = self._tip_uzunluk[tip]
             
             ozet[tip] = {
                 "toplam_agirlik_kg": round(toplam_agirlik, 2),
@@ -122,9 +344,9 @@ class DemirEngine:
                         "adi": h.eleman_adi,
                         "adet": h.adet,
                         "cap": h.demir_capi,
-                        "uzunluk": round(h.uzunluk, 2),
-                        "toplam_uzunluk": round(h.toplam_uzunluk, 2),
-                        "agirlik": round(h.toplam_agirlik, 2)
+                        "uzunluk": h.uzunluk,
+                        "toplam_uzunluk": h.toplam_uzunluk,
+                        "agirlik": h.toplam_agirlik
                     }
                     for h in hesaplar
                 ]
@@ -134,8 +356,9 @@ class DemirEngine:
     
     def ozet_genel(self) -> Dict[str, Any]:
         """Tüm demirler için genel özet"""
-        toplam_agirlik = sum(h.toplam_agirlik for h in self.hesaplamalar)
-        toplam_uzunluk = sum(h.toplam_uzunluk for h in self.hesaplamalar)
+        self._toplamlari_guncelle()
+        toplam_agirlik = self._genel_agirlik
+        toplam_uzunluk = self._genel_uzunluk
         
         return {
             "toplam_agirlik_kg": round(toplam_agirlik, 2),
@@ -152,19 +375,12 @@ class DemirEngine:
         
         Returns: (adet, çap, uzunluk) veya None
         """
-        # Çeşitli format desteği
-        patterns = [
-            r'(\d+)[Ø@](\d+).*?l=(\d+)',  # 56Ø12 l=1200 veya 56@12 l=1200
-            r'(\d+)\s*[Ø@]\s*(\d+).*?l=(\d+)',  # Boşluk toleransı
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                adet = int(match.group(1))
-                cap = int(match.group(2))
-                uzunluk = float(match.group(3))
-                return (adet, cap, uzunluk)
+        match = _DEMIR_RE.search(text)
+        if match:
+            adet = int(match.group(1))
+            cap = int(match.group(2))
+            uzunluk = float(match.group(3))
+            return (adet, cap, uzunluk)
         
         return None
     
@@ -177,20 +393,19 @@ class DemirEngine:
         Returns: ((boyuna_list), (enine_list)) veya None
         """
         try:
-            parts = donati_text.split('|')
+            parts = [part.strip() for part in donati_text.split('|')]
             
             boyuna_list = []
             enine_list = []
             
-            for part in parts:
-                part = part.strip()
+            for i, part in enumerate(parts):
                 # Pattern: 12Ø10/20
-                match = re.search(r'(\d+)[Ø@](\d+)', part)
+                match = _TABLO_DONATI_RE.search(part)
                 if match:
                     adet = int(match.group(1))
                     cap = int(match.group(2))
                     
-                    if parts.index(part) == 0:  # Boyuna
+                    if i == 0:  # Boyuna
                         boyuna_list.append((adet, cap))
                     else:  # Enine
                         enine_list.append((adet, cap))
@@ -3,16 +3,72 @@ DXF Demir Analiz Modülü
 DXF dosyasındaki yapı elemanlarını otomatik tanıyıp demir hesaplamalarını yapan modül
 """
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 from pathlib import Path
 import logging
 import re
+from functools import cached_property
+
+try:
+    from ezdxf import bbox as ezdxf_bbox
+    EZDXF_BBOX_AVAILABLE = True
+except ImportError:
+    EZDXF_BBOX_AVAILABLE = False
+    ezdxf_bbox = None
 
 from app.core.dxf_engine import DXFAnaliz
 from app.core.demir_engine import DemirEngine, TemelTipi
 
 logger = logging.getLogger(__name__)
 
+# Katman adlarında temel türünü belirleyen anahtar kelimeler (tek geçişte aranır)
+_TEMEL_KATMAN_RE = re.compile(r'radye|kiriş|mütemadi')
+# str.lower() 'İ' harfini 'i̇' (i + birleşik nokta) yapar; önce düz 'i'ye çevrilir
+_TR_KUCUK_HARF = str.maketrans({'İ': 'i'})
+# (radye, kiriş, mütemadi) bayraklarından temel tipi
+_TEMEL_TIPI_TABLOSU = {
+    (True, True, False): TemelTipi.KIRIŞ_LI_RADYE,
+    (True, True, True): TemelTipi.KIRIŞ_LI_RADYE,
+    (True, False, False): TemelTipi.RADYE,
+    (True, False, True): TemelTipi.RADYE,
+    (False, True, True): TemelTipi.KIRIŞ_LI_TEMEL,
+    (False, False, True): TemelTipi.MUTEMADI_TEMEL,
+}
+
+# ezdxf.bbox yokken sınırlara katılan tek nokta öznitelikleri
+_NOKTA_OZNITELIKLERI = ('start', 'end', 'insert', 'location')
+
+
+def _entity_noktalari(entity) -> Iterator[Tuple[float, float, float]]:
+    """
+    ezdxf.bbox olmadan sınır hesabı için entity'nin tanım noktaları.
+    
+    Çoklu çizgilerde köşeler, daire/yay/elipslerde yarıçapla genişletilmiş
+    merkez, diğerlerinde başlangıç/bitiş/ekleme noktaları döndürülür.
+    """
+    dxftype = entity.dxftype()
+    if dxftype == 'LWPOLYLINE':
+        z = float(entity.dxf.get('elevation', 0.0))
+        for x, y in entity.get_points('xy'):
+            yield float(x), float(y), z
+    elif dxftype == 'POLYLINE':
+        for nokta in entity.points():
+            yield float(nokta[0]), float(nokta[1]), float(nokta[2])
+    elif dxftype == 'MLINE':
+        for nokta in entity.get_locations():
+            yield float(nokta[0]), float(nokta[1]), float(nokta[2])
+    elif dxftype in ('CIRCLE', 'ARC', 'ELLIPSE'):
+        cx, cy, cz = entity.dxf.center
+        # Elipste yarıçap yerine büyük eksen uzunluğu (yaylar tam daire kabul edilir)
+        r = entity.dxf.major_axis.magnitude if dxftype == 'ELLIPSE' else entity.dxf.radius
+        yield cx - r, cy - r, cz
+        yield cx + r, cy + r, cz
+    else:
+        for ad in _NOKTA_OZNITELIKLERI:
+            if entity.dxf.hasattr(ad):
+                nokta = entity.dxf.get(ad)
+                yield nokta[0], nokta[1], nokta[2]
+
 
 class DXFDemirAnalyzer:
     """DXF dosyasından yapı elemanlarını tanıyıp demir hesaplamalarını yapan sınıf"""
@@ -40,6 +96,8 @@ class DXFDemirAnalyzer:
         """DXF dosyasını analiz için yükle"""
         try:
             self.dxf_analiz = DXFAnaliz(self.dxf_yolu, cizim_birimi="cm")
+            # Yeni çizim yüklendi; önbellekteki ölçüler geçersiz
+            self.__dict__.pop('ölçüler', None)
             logger.info(f"DXF dosyası yüklendi: {self.dxf_yolu}")
         except Exception as e:
             logger.error(f"DXF yükleme hatası: {e}")
@@ -47,9 +105,9 @@ class DXFDemirAnalyzer:
     
     def katman_adlarini_getir(self) -> List[str]:
         """DXF dosyasındaki tüm katmanları getir"""
-        if self.dxf_analiz and self.dxf_analiz.doc:
-            katmanlar = [l.dxf.name for l in self.dxf_analiz.doc.layers]
-            return katmanlar
+        if self.dxf_analiz:
+            # Akış modunda (doc yok) katmanlar varlıklardan çıkarılır
+            return self.dxf_analiz.katmanlari_listele()
         return []
     
     def temel_ozelliklerini_tanı(self) -> Dict[str, Any]:
@@ -58,20 +116,14 @@ class DXFDemirAnalyzer:
         
         Katman adlarından veya blok isminden temel türünü belirler
         """
-        temel_tipi = None
         katmanlar = self.katman_adlarini_getir()
         
-        # Katman adlarında ara
-        katman_text = " ".join(katmanlar).lower()
-        
-        if "radye" in katman_text and "kiriş" in katman_text:
-            temel_tipi = TemelTipi.KIRIŞ_LI_RADYE
-        elif "radye" in katman_text:
-            temel_tipi = TemelTipi.RADYE
-        elif "mütemadi" in katman_text and "kiriş" in katman_text:
-            temel_tipi = TemelTipi.KIRIŞ_LI_TEMEL
-        elif "mütemadi" in katman_text:
-            temel_tipi = TemelTipi.MUTEMADI_TEMEL
+        # Katman adlarında anahtar kelimeleri tek regex taramasıyla bul
+        katman_text = " ".join(katmanlar).translate(_TR_KUCUK_HARF).lower()
+        bulunan = set(_TEMEL_KATMAN_RE.findall(katman_text))
+        temel_tipi = _TEMEL_TIPI_TABLOSU.get(
+            ("radye" in bulunan, "kiriş" in bulunan, "mütemadi" in bulunan)
+        )
         
         return {
             "temel_tipi": temel_tipi,
@@ -83,6 +135,17 @@ class DXFDemirAnalyzer:
         DXF'den ölçüleri çıkar
         Blok ve entity boyutlarından yapı elemanı ölçülerini belirler
         """
+        return dict(self.ölçüler)
+    
+    @cached_property
+    def ölçüler(self) -> Dict[str, Any]:
+        """
+        Çizim ölçüleri (yükleme başına bir kez hesaplanır)
+        
+        ezdxf.bbox varsa tüm modelspace sınırları tek geçişte alınır;
+        yoksa entity noktalarından min/max biriktirilir. Koordinatlar cm
+        kabul edilir (alan m²'ye çevrilir).
+        """
         ölçüler = {
             "uzunluk": 0,
             "eni": 0,
@@ -92,25 +155,37 @@ class DXFDemirAnalyzer:
         
         try:
             if self.dxf_analiz and self.dxf_analiz.msp:
-                # Bounding box'ı kullan
-                bounding_box = None
-                for entity in self.dxf_analiz.msp:
-                    if hasattr(entity, 'dxf'):
+                # Sınırlar: (min x, min y, min z), (max x, max y, max z)
+                extmin = extmax = None
+                if EZDXF_BBOX_AVAILABLE:
+                    bbox = ezdxf_bbox.extents(self.dxf_analiz.msp, fast=True)
+                    if bbox.has_data:
+                        extmin = tuple(bbox.extmin)
+                        extmax = tuple(bbox.extmax)
+                else:
+                    # ezdxf.bbox yoksa tüm entity noktalarından min/max biriktirilir
+                    inf = float('inf')
+                    min_x = min_y = min_z = inf
+                    max_x = max_y = max_z = -inf
+                    for entity in self.dxf_analiz.msp:
                         try:
-                            bbox = entity.bbox()
-                            if bbox.has_data:
-                                bounding_box = bbox
-                                break
-                        except:
-                            pass
+                            for x, y, z in _entity_noktalari(entity):
+                                min_x = min(min_x, x)
+                                min_y = min(min_y, y)
+                                min_z = min(min_z, z)
+                                max_x = max(max_x, x)
+                                max_y = max(max_y, y)
+                                max_z = max(max_z, z)
+                        except Exception:
+                            continue
+                    if min_x != inf:
+                        extmin = (min_x, min_y, min_z)
+                        extmax = (max_x, max_y, max_z)
                 
-                if bounding_box:
-                    extmin = bounding_box.extmin
-                    extmax = bounding_box.extmax
-                    
-                    ölçüler['uzunluk'] = abs(extmax.x - extmin.x)
-                    ölçüler['eni'] = abs(extmax.y - extmin.y)
-                    ölçüler['yükseklik'] = abs(extmax.z - extmin.z) if extmax.z else 50  # Default 50cm
+                if extmin is not None:
+                    ölçüler['uzunluk'] = abs(extmax[0] - extmin[0])
+                    ölçüler['eni'] = abs(extmax[1] - extmin[1])
+                    ölçüler['yükseklik'] = abs(extmax[2] - extmin[2]) if extmax[2] else 50  # Default 50cm
                     ölçüler['alan'] = (ölçüler['uzunluk'] * ölçüler['eni']) / 10000  # m²'ye çevir
         
         except Exception as e:
@@ -127,7 +202,7 @@ class DXFDemirAnalyzer:
         try:
             # Temel özelliklerini tanı
             temel_info = self.temel_ozelliklerini_tanı()
-            ölçüler = self.ölçüleri_ekstrak_et()
+            ölçüler = self.ölçüler
             
             # Temel demiri hesapla
             if temel_info['temel_tipi']:
@@ -139,7 +214,7 @@ class DXFDemirAnalyzer:
                     demir_capi=12,
                     aralık=15.0
                 )
-                self.demir_engine.hesaplamalar.append(temel_hesap)
+                self.demir_engine.hesap_ekle(temel_hesap)
                 sonuc['temel'] = self._hesap_to_dict(temel_hesap)
             
             # Kolon demiri (örnek)
@@ -149,7 +224,7 @@ class DXFDemirAnalyzer:
                     eni=30,
                     demir_capi=12
                 )
-                self.demir_engine.hesaplamalar.append(kolon_hesap)
+                self.demir_engine.hesap_ekle(kolon_hesap)
                 sonuc['kolon'] = self._hesap_to_dict(kolon_hesap)
             
             # Kiriş demiri (örnek)
@@ -158,7 +233,7 @@ class DXFDemirAnalyzer:
                 yukseklik=60,
                 demir_capi=14
             )
-            self.demir_engine.hesaplamalar.append(kiris_hesap)
+            self.demir_engine.hesap_ekle(kiris_hesap)
             sonuc['kiris'] = self._hesap_to_dict(kiris_hesap)
             
             # Döşeme demiri (örnek)
@@ -166,7 +241,7 @@ class DXFDemirAnalyzer:
                 alan=100,  # 100 m²
                 demir_capi=10
             )
-            self.demir_engine.hesaplamalar.append(doseme_hesap)
+            self.demir_engine.hesap_ekle(doseme_hesap)
             sonuc['doseme'] = self._hesap_to_dict(doseme_hesap)
             
             # Özet
@@ -3,9 +3,16 @@ DXF Engine
 DXF dosyaları için gelişmiş işleme motoru
 """
 
-import sys
+import io
+import mmap
+import os
 import math
 import re
+import sys
+from array import array
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import logging
@@ -18,10 +25,306 @@ except ImportError:
     EZDXF_AVAILABLE = False
     ezdxf = None
 
+try:
+    from ezdxf.addons import iterdxf
+    ITERDXF_AVAILABLE = True
+except ImportError:
+    ITERDXF_AVAILABLE = False
+    iterdxf = None
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    prange = range
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SCIPY_AVAILABLE = False
+    cKDTree = None
+
 logger = logging.getLogger(__name__)
 # Logger seviyesini açıkça DEBUG'a ayarla (modül import edilirken logging konfigürasyonu aktif olmalı)
 logger.setLevel(logging.DEBUG)
 
+# Numba derlenmiş kodu kaynak dosyanın yanındaki __pycache__ içine önbellekler (cache=True).
+# PyInstaller ile dondurulmuş sürümde kaynak yolu paket içinde çözülemeyebilir (önbellek
+# yeri bulunamazsa Numba import sırasında RuntimeError verir) ve tek dosyalı pakette
+# geçici açma dizini (_MEIPASS) her açılışta değiştiğinden önbellek zaten yeniden
+# kullanılamaz. Bu yüzden dondurulmuş sürümde önbellek kapalıdır; çekirdekler her
+# açılışta _shoelace_isit ile bir kez derlenir.
+_NUMBA_CACHE = not getattr(sys, 'frozen', False)
+
+if NUMBA_AVAILABLE:
+    # Not: Kahan telafisi yeniden sıralamaya izin veren fastmath ile derleyici
+    # tarafından silinebileceğinden bu çekirdeklerde fastmath kullanılmaz.
+    # nogil: katman başına iş parçacıklarında (alan_hesapla_batch vb.) çekirdekler GIL'i bırakır.
+    @njit(cache=_NUMBA_CACHE, nogil=True)
+    def _shoelace_nb(x, y):
+        """Shoelace alanı (derlenmiş döngü, Kahan toplamı; x ve y ardışık float64 dizileri)."""
+        n = x.shape[0]
+        if n == 0:
+            return 0.0
+        s = 0.0
+        c = 0.0
+        # Yamuk biçimi: (x[i] - x[i+1]) * (y[i] + y[i+1]) - kenar başına tek çarpma,
+        # fark alındığı için büyük koordinat ötelemelerinde de hassas
+        for i in range(n - 1):
+            t = (x[i] - x[i + 1]) * (y[i] + y[i + 1]) - c
+            u = s + t
+            c = (u - s) - t
+            s = u
+        s += (x[n - 1] - x[0]) * (y[n - 1] + y[0]) - c
+        return 0.5 * abs(s)
+    
+    @njit(parallel=True, cache=_NUMBA_CACHE, nogil=True)
+    def _shoelace_batch(all_xy, offs, out):
+        """Birleştirilmiş köşe dizisindeki her çokgenin alanı (çokgenler paralel)."""
+        for k in prange(offs.shape[0] - 1):
+            s = 0.0
+            c = 0.0
+            a = offs[k]
+            b = offs[k + 1]
+            if b - a == 4:
+                # Eksenlere paralel dikdörtgen (karo, kapı vb.): alan = en × boy
+                x0 = all_xy[a, 0]
+                y0 = all_xy[a, 1]
+                x2 = all_xy[a + 2, 0]
+                y2 = all_xy[a + 2, 1]
+                x1 = all_xy[a + 1, 0]
+                y1 = all_xy[a + 1, 1]
+                x3 = all_xy[a + 3, 0]
+                y3 = all_xy[a + 3, 1]
+                if ((x0 == x1 and y1 == y2 and x2 == x3 and y3 == y0) or
+                        (y0 == y1 and x1 == x2 and y2 == y3 and x3 == x0)):
+                    out[k] = abs((x2 - x0) * (y2 - y0))
+                    continue
+            for i in range(a, b - 1):
+                # Kahan toplamı: binlerce küçük çapraz çarpımda yuvarlama hatası birikmez
+                t = (all_xy[i, 0] - all_xy[i + 1, 0]) * (all_xy[i, 1] + all_xy[i + 1, 1]) - c
+                u = s + t
+                c = (u - s) - t
+                s = u
+            # Kapanış kenarı: son köşe -> ilk köşe
+            s += (all_xy[b - 1, 0] - all_xy[a, 0]) * (all_xy[b - 1, 1] + all_xy[a, 1]) - c
+            out[k] = 0.5 * abs(s)
+    
+    @njit(cache=_NUMBA_CACHE, fastmath=True, nogil=True)
+    def _cizgi_uzunlugu_nb(x, y, kapali):
+        """Çoklu çizgi uzunluğu (derlenmiş döngü); kapali ise son -> ilk kenar eklenir."""
+        n = x.shape[0]
+        s = 0.0
+        for i in range(n - 1):
+            dx = x[i + 1] - x[i]
+            dy = y[i + 1] - y[i]
+            s += math.sqrt(dx * dx + dy * dy)
+        if kapali and n > 1:
+            dx = x[0] - x[n - 1]
+            dy = y[0] - y[n - 1]
+            s += math.sqrt(dx * dx + dy * dy)
+        return s
+    
+    @njit(parallel=True, cache=_NUMBA_CACHE, fastmath=True, nogil=True)
+    def _cizgi_uzunluklari_batch(all_xy, offs, kapali, out):
+        """Birleştirilmiş köşe dizisindeki her çoklu çizginin uzunluğu (çizgiler paralel)."""
+        for k in prange(offs.shape[0] - 1):
+            a = offs[k]
+            b = offs[k + 1]
+            s = 0.0
+            for i in range(a, b - 1):
+                dx = all_xy[i + 1, 0] - all_xy[i, 0]
+                dy = all_xy[i + 1, 1] - all_xy[i, 1]
+                s += math.sqrt(dx * dx + dy * dy)
+            if kapali[k] and b - a > 1:
+                dx = all_xy[a, 0] - all_xy[b - 1, 0]
+                dy = all_xy[a, 1] - all_xy[b - 1, 1]
+                s += math.sqrt(dx * dx + dy * dy)
+            out[k] = s
+else:
+    _shoelace_nb = None
+    _shoelace_batch = None
+    _cizgi_uzunlugu_nb = None
+    _cizgi_uzunluklari_batch = None
+
+# Numba derlemesi ilk çağrıda yapılır; süreç başına bir kez DXFAnaliz açılışında tetiklenir
+_shoelace_isindi = False
+
+
+def _shoelace_isit() -> None:
+    """
+    Derlenmiş shoelace ve çizgi uzunluğu fonksiyonlarını küçük bir çokgenle ısıt.
+    
+    Paralel çekirdeğin iş parçacığı havuzu da burada başlatılır; havuz ilk kez
+    bir işçi iş parçacığından (ör. alan_hesapla_batch) açılırsa süreç
+    kapanışında takılabiliyor.
+    """
+    global _shoelace_isindi
+    if NUMBA_AVAILABLE and not _shoelace_isindi:
+        _shoelace_isindi = True
+        _shoelace_nb(np.array([0.0, 1.0, 1.0, 0.0]), np.array([0.0, 0.0, 1.0, 1.0]))
+        _cizgi_uzunlugu_nb(np.array([0.0, 1.0, 1.0, 0.0]), np.array([0.0, 0.0, 1.0, 1.0]), True)
+        _shoelace_batch(np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+                        np.array([0, 4], dtype=np.int64), np.empty(1, dtype=np.float64))
+        _cizgi_uzunluklari_batch(np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+                                 np.array([0, 4], dtype=np.int64), np.array([True]),
+                                 np.empty(1, dtype=np.float64))
+
+
+# Ayrıştırılmış DXF dokümanları: (mutlak yol, mtime_ns, boyut, kodlama) -> Document (LRU)
+_DOC_CACHE: "OrderedDict[Tuple[str, int, int, Optional[str]], Any]" = OrderedDict()
+_DOC_CACHE_BOYUTU = 4
+_DOC_CACHE_KILIDI = threading.Lock()
+
+# Büyük DXF dosyalarında okuma sistem çağrılarını azaltmak için varsayılan tampon (1 MB)
+_DXF_OKUMA_TAMPONU = 1 << 20
+# Bu boyutun üzerindeki ASCII DXF dosyaları tam doküman kurulmadan akışla okunur
+_AKIS_ESIGI = 100 * 1024 * 1024
+# Akış modunda modelspace'ten tutulan varlık tipleri (analiz metotlarının kullandıkları)
+_AKIS_TIPLERI = ('LWPOLYLINE', 'POLYLINE', 'LINE', 'ARC', 'MLINE', 'TEXT', 'MTEXT', 'INSERT')
+# Binary DXF dosyalarının başındaki imza
+_BINARY_DXF_IMZASI = b"AutoCAD Binary DXF\r\n\x1a\x00"
+# LWPOLYLINE dxf.flags içindeki "kapalı" biti
+_LWPOLYLINE_KAPALI = 1
+# uzunluk_hesapla() içinde ölçülen çizgi tipleri
+_UZUNLUK_TIPLERI = ('LINE', 'POLYLINE', 'LWPOLYLINE', 'ARC', 'MLINE')
+# Açıklık katmanı adı kalıpları (küçük harfe çevrilmiş katman adında aranır)
+_PENCERE_RE = re.compile(r'pencere|window|win|w-|p-|fenster')
+_KAPI_RE = re.compile(r'kap[ıi]|door|d-|k-|t[uü]r')
+# Katman adı / text içindeki "sayı + birim" kalıpları (büyük harfe çevrilmiş metinde aranır)
+_SAYI_CM_RE = re.compile(r'(\d+\.?\d*)\s*CM')
+_SAYI_M_RE = re.compile(r'(\d+\.?\d*)\s*M')
+_SAYI_MM_RE = re.compile(r'(\d+\.?\d*)\s*MM')
+_SAYI_RE = re.compile(r'(\d+\.?\d*)')
+_UC_DORT_HANE_RE = re.compile(r'(\d{3,4})')
+# Yükseklik kalıpları: (kalıp, metreye bölen, birim) - deneme sırası önemlidir
+_YUKSEKLIK_KALIPLARI = ((_SAYI_CM_RE, 100.0, 'cm'), (_SAYI_M_RE, 1.0, 'm'), (_SAYI_MM_RE, 1000.0, 'mm'))
+# Kalınlık kalıpları: (kalıp, cm'ye bölen); birimsiz sayı cm kabul edilir
+_KALINLIK_KALIPLARI = ((_SAYI_CM_RE, 1.0), (_SAYI_MM_RE, 10.0), (_SAYI_RE, 1.0))
+
+
+def _anahtar_kelime_re(kelimeler: Tuple[str, ...]) -> "re.Pattern":
+    """Büyük harfe çevrilmiş anahtar kelimelerden tek alternasyon kalıbı kurar (metin tek taranır)."""
+    return re.compile('|'.join(re.escape(k.upper()) for k in kelimeler))
+
+
+# Text anahtar kelimeleri (büyük harfe çevrilmiş text içinde aranır)
+_YUKSEKLIK_ANAHTAR_RE = _anahtar_kelime_re(('yükseklik', 'yukseklik', 'yük', 'yuk', 'height', 'h=', 'h ='))
+_KALINLIK_ANAHTAR_RE = _anahtar_kelime_re(('kalınlık', 'kalinlik', 'kalın', 'kalin', 'thickness',
+                                            't=', 't =', 'cm', 'mm'))
+_CINS_ANAHTAR_RE = _anahtar_kelime_re(('tuğla', 'tugla', 'beton', 'gazbeton', 'bims', 'ahşap', 'ahsap',
+                                       'çelik', 'celik', 'brick', 'concrete', 'aerated', 'wood', 'steel'))
+# Duvar cinsleri öncelik sırasıyla: (büyük harf, sonuçta kullanılan ad)
+_DUVAR_CINSLERI = tuple((c.upper(), c.title()) for c in
+                        ('tuğla', 'tugla', 'beton', 'gazbeton', 'bims', 'ahşap', 'ahsap', 'çelik', 'celik'))
+# 1 metredeki çizim birimi sayısı (bilinmeyen birim metre kabul edilir)
+_METRE_BASINA_BIRIM = {"m": 1.0, "cm": 100.0, "mm": 1000.0}
+# Çizim birimi² -> m² çarpanları (bilinmeyen birimde alan olduğu gibi bırakılır)
+_ALAN_OLCEKLERI = {"m": 1.0, "cm": 1e-4, "mm": 1e-6}
+
+
+class _MmapOkuyucu(io.RawIOBase):
+    """Salt okunur bellek eşlemesini (mmap) kendi konumuyla okuyan ham akış."""
+    
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._konum = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        veri = self._mm[self._konum:self._konum + len(b)]
+        n = len(veri)
+        b[:n] = veri
+        self._konum += n
+        return n
+
+
+def _dxf_dosyadan_oku(dosya_yolu: str, encoding: Optional[str] = None,
+                      buffer_size: int = _DXF_OKUMA_TAMPONU) -> Any:
+    """
+    DXF dosyasını belleğe eşleyip (mmap) ayrıştır.
+    
+    Dosya bir kez açılır; binary imza kontrolü, kodlama tespiti ve ayrıştırma
+    aynı eşlemeden okunur (sayfalar işletim sisteminin önbelleğinden gelir).
+    Eşleme ayrıştırmadan hemen sonra kapatılır, dosya kilitli kalmaz.
+    Binary DXF (DXB) dosyaları imzasından tanınır ve ASCII ayrıştırmaya
+    girmeden ezdxf'in binary yükleyicisine verilir.
+    """
+    with open(dosya_yolu, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Boş dosya eşlenemez; hatayı ezdxf'in kendi okuyucusu üretsin
+            mm = None
+    if mm is None:
+        return ezdxf.readfile(dosya_yolu, encoding=encoding)
+    
+    with mm:
+        if mm[:len(_BINARY_DXF_IMZASI)] == _BINARY_DXF_IMZASI:
+            return ezdxf.readfile(dosya_yolu)
+        
+        if encoding is None:
+            # Sürüm ve kod sayfası yalnızca başlıktan okunur
+            with io.TextIOWrapper(io.BufferedReader(_MmapOkuyucu(mm)), encoding='utf-8', errors='ignore') as f:
+                encoding = ezdxf.filemanagement.dxf_stream_info(f).encoding
+        with io.TextIOWrapper(io.BufferedReader(_MmapOkuyucu(mm), buffer_size),
+                              encoding=encoding, errors='surrogateescape') as f:
+            doc = ezdxf.read(f)
+    doc.filename = dosya_yolu
+    return doc
+
+
+def _dxf_oku(dosya_yolu, encoding: Optional[str] = None, buffer_size: int = _DXF_OKUMA_TAMPONU) -> Any:
+    """
+    DXF dosyasını oku; dosya değişmediyse önceden ayrıştırılmış dokümanı döndür.
+    
+    Aynı çizim için tekrarlanan analizlerde (katman başına alan, blok sayımı vb.)
+    ezdxf ayrıştırıcısı yalnızca bir kez çalışır. Dokümanlar salt okunur kullanılır.
+    
+    Args:
+        dosya_yolu: DXF dosyasının yolu
+        encoding: Metin kodlaması (None ise dosya başlığından tespit edilir)
+        buffer_size: Okuma tamponu boyutu (byte)
+    """
+    yol = os.path.abspath(dosya_yolu)
+    st = os.stat(yol)
+    anahtar = (yol, st.st_mtime_ns, st.st_size, encoding)
+    
+    with _DOC_CACHE_KILIDI:
+        doc = _DOC_CACHE.get(anahtar)
+        if doc is not None:
+            _DOC_CACHE.move_to_end(anahtar)
+            return doc
+    
+    doc = _dxf_dosyadan_oku(str(dosya_yolu), encoding, buffer_size)
+    
+    with _DOC_CACHE_KILIDI:
+        # Aynı dosyanın eski sürümlerini at
+        for eski in [k for k in _DOC_CACHE if k[0] == yol]:
+            del _DOC_CACHE[eski]
+        _DOC_CACHE[anahtar] = doc
+        while len(_DOC_CACHE) > _DOC_CACHE_BOYUTU:
+            _DOC_CACHE.popitem(last=False)
+    return doc
+
+
+def _dxf_onbellek_temizle() -> None:
+    """Ayrıştırılmış DXF doküman önbelleğini boşalt."""
+    with _DOC_CACHE_KILIDI:
+        _DOC_CACHE.clear()
+
 
 class DXFEngine:
     """
@@ -38,12 +341,20 @@ class DXFEngine:
                 "CAD işlemleri için: pip install ezdxf"
             )
     
-    def load_dxf(self, file_path: Path) -> Optional[Any]:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Ayrıştırılmış DXF doküman önbelleğini temizle."""
+        _dxf_onbellek_temizle()
+    
+    def load_dxf(self, file_path: Path, encoding: Optional[str] = None,
+                 buffer_size: int = _DXF_OKUMA_TAMPONU) -> Optional[Any]:
         """
         DXF dosyasını yükle.
         
         Args:
             file_path: DXF dosyasının yolu
+            encoding: Metin kodlaması (None ise otomatik tespit)
+            buffer_size: Okuma tamponu boyutu (byte)
             
         Returns:
             ezdxf.Document: Yüklenen DXF dokümanı veya None
@@ -56,7 +367,7 @@ class DXFEngine:
             raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
         
         try:
-            doc = ezdxf.readfile(str(file_path))
+            doc = _dxf_oku(file_path, encoding, buffer_size)
             logger.info(f"DXF dosyası başarıyla yüklendi: {file_path}")
             return doc
         except Exception as e:
@@ -73,7 +384,9 @@ class DXFAnaliz:
     Çizim birimi desteği ile farklı birimlerdeki dosyaları işleyebilir.
     """
     
-    def __init__(self, dosya_yolu: str, cizim_birimi: str = "cm") -> None:
+    def __init__(self, dosya_yolu: str = "", cizim_birimi: str = "cm", *, doc: Any = None,
+                 encoding: Optional[str] = None, buffer_size: int = _DXF_OKUMA_TAMPONU,
+                 streaming: Optional[bool] = None) -> None:
         """
         DXFAnaliz sınıfını başlat.
         
@@ -81,32 +394,143 @@ class DXFAnaliz:
             dosya_yolu: DXF dosyasının yolu
             cizim_birimi: Çizim birimi ('m', 'cm', 'mm')
                          Varsayılan: 'cm' (mimaride en yaygını)
+            doc: Önceden yüklenmiş ezdxf dokümanı (ör. DXFEngine.load_dxf çıktısı).
+                 Verilirse dosya yeniden okunmaz.
+            encoding: Metin kodlaması (None ise dosya başlığından tespit edilir)
+            buffer_size: Dosya okuma tamponu boyutu (byte)
+            streaming: True ise dosya tam doküman kurulmadan akışla okunur
+                       (yalnızca modelspace varlıkları; katmanlar varlıklardan çıkarılır).
+                       None ise 100 MB üzerindeki ASCII DXF dosyalarında otomatik seçilir.
         """
         if not EZDXF_AVAILABLE:
             raise ImportError("ezdxf kütüphanesi gerekli")
         
         self.dosya_yolu = dosya_yolu
         self.birim = cizim_birimi
+        # Birim dönüşüm çarpanları örnek başına sabit: varlık başına birim dallanması yapılmaz
+        self._birim_katsayisi = _METRE_BASINA_BIRIM.get(cizim_birimi, 1.0)  # metre -> çizim birimi
+        self._uzunluk_olcegi = 1.0 / self._birim_katsayisi  # çizim birimi -> metre
+        self._alan_olcegi = _ALAN_OLCEKLERI.get(cizim_birimi, 1.0)
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.streaming = streaming
         self.doc = None
         self.msp = None
-        self.yukle()
+        # Katman -> tip -> varlıklar ve tip -> varlıklar dizinleri; ilk sorguda kurulur
+        self._katman_kovalari: Optional[Dict[str, Dict[str, List[Any]]]] = None
+        self._tip_kovalari: Optional[Dict[str, List[Any]]] = None
+        _shoelace_isit()
+        
+        if doc is not None:
+            self.doc = doc
+            self.msp = doc.modelspace()
+        else:
+            self.yukle()
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Ayrıştırılmış DXF doküman önbelleğini temizle."""
+        _dxf_onbellek_temizle()
+    
+    def _akis_kullan(self) -> bool:
+        """Dosyanın akış (iterdxf) moduyla okunup okunmayacağını belirle."""
+        if not ITERDXF_AVAILABLE or self.streaming is False:
+            return False
+        with open(self.dosya_yolu, 'rb') as f:
+            if f.read(len(_BINARY_DXF_IMZASI)) == _BINARY_DXF_IMZASI:
+                return False  # iterdxf yalnızca ASCII DXF okur
+        return self.streaming or os.path.getsize(self.dosya_yolu) > _AKIS_ESIGI
     
     def yukle(self) -> None:
         """DXF dosyasını hafızaya yükler."""
         try:
-            self.doc = ezdxf.readfile(self.dosya_yolu)
-            self.msp = self.doc.modelspace()
+            if self._akis_kullan():
+                # Tablolar, bloklar ve nesneler kurulmaz; yalnızca gerekli modelspace varlıkları tutulur
+                dxf = iterdxf.opendxf(self.dosya_yolu)
+                try:
+                    self.msp = list(dxf.modelspace(types=_AKIS_TIPLERI))
+                finally:
+                    dxf.close()
+                self.doc = None
+            else:
+                self.doc = _dxf_oku(self.dosya_yolu, self.encoding, self.buffer_size)
+                self.msp = self.doc.modelspace()
+            # Yeni modelspace için dizinler ilk sorguda yeniden kurulur
+            self._katman_kovalari = None
+            self._tip_kovalari = None
             logger.info(f"✅ Başarılı: '{self.dosya_yolu}' yüklendi. Birim: {self.birim}")
         except Exception as e:
             error_msg = f"Hata: {e}"
             logger.error(error_msg)
-            print(error_msg)
-            sys.exit(1)
+            # Süreç sonlandırılmaz; çağıran (arayüz, toplu işlem) hatayı yakalayıp devam edebilir
+            raise RuntimeError(error_msg) from e
+    
+    def _varliklari_grupla(self) -> None:
+        """
+        Modelspace varlıklarını tek geçişte katman/tip ve tip bazında grupla.
+        
+        Her katman/tip sorgusunda msp.query() ile tüm çizimi yeniden taramak
+        yerine hesaplama metotları bu gruplardan okur.
+        """
+        katman_kovalari: Dict[str, Dict[str, List[Any]]] = {}
+        tip_kovalari: Dict[str, List[Any]] = {}
+        for entity in self.msp:
+            tip = entity.dxftype()
+            katman_kovalari.setdefault(entity.dxf.layer, {}).setdefault(tip, []).append(entity)
+            tip_kovalari.setdefault(tip, []).append(entity)
+        self._tip_kovalari = tip_kovalari
+        self._katman_kovalari = katman_kovalari
+    
+    def _kovalar(self) -> Tuple[Dict[str, Dict[str, List[Any]]], Dict[str, List[Any]]]:
+        """
+        Varlık dizinlerini döndür; yükleme sonrası ilk çağrıda tek geçişte kurulur.
+        
+        Yalnızca katman listesi veya ölçüler için açılan dosyalarda modelspace
+        hiç gruplanmaz.
+        
+        Returns:
+            Tuple: (katman -> tip -> varlıklar, tip -> varlıklar)
+        """
+        if self._katman_kovalari is None:
+            self._varliklari_grupla()
+        return self._katman_kovalari, self._tip_kovalari
+    
+    def _katman_varliklari(self, tip: str, katman_adi: str) -> List[Any]:
+        """
+        Katmandaki belirli tipteki varlıkları döndür (TIP[layer=="katman"] sorgusunun karşılığı).
+        
+        Args:
+            tip: DXF varlık tipi ('LINE', 'LWPOLYLINE', ...)
+            katman_adi: Katman adı
+            
+        Returns:
+            List: Varlıklar (çağıranın değiştirebileceği yeni liste)
+        """
+        return list(self._kovalar()[0].get(katman_adi, {}).get(tip, ()))
+    
+    def _katman_tipleri(self, katman_adi: str, tipler: Tuple[str, ...]) -> Dict[str, List[Any]]:
+        """
+        Katmandaki birden fazla tipin varlıklarını tek çağrıda döndür.
+        
+        Args:
+            katman_adi: Katman adı
+            tipler: DXF varlık tipleri
+            
+        Returns:
+            Dict: {tip: varlıklar} (her tip için yeni liste; katmanda yoksa boş)
+        """
+        kovalar = self._kovalar()[0].get(katman_adi, {})
+        return {tip: list(kovalar.get(tip, ())) for tip in tipler}
+    
+    def _tip_varliklari(self, tip: str) -> List[Any]:
+        """Tüm katmanlardaki belirli tipteki varlıkları döndür (yeni liste)."""
+        return list(self._kovalar()[1].get(tip, ()))
     
     def katmanlari_listele(self) -> List[str]:
         """Dosyadaki tüm katman isimlerini döndürür."""
         if not self.doc:
-            return []
+            # Akış modunda katman tablosu okunmaz; varlıkların katmanları kullanılır
+            return sorted(self._kovalar()[0])
         return [layer.dxf.name for layer in self.doc.layers]
     
     def acikliklari_tespit_et(self) -> Dict[str, List[str]]:
@@ -123,35 +547,15 @@ class DXFAnaliz:
         pencere_katmanlari = []
         kapi_katmanlari = []
         
-        # Pencere pattern'leri
-        pencere_patterns = [
-            'pencere', 'window', 'win', 'w-', 'p-', 'fenster',
-            'pencere_', 'window_', 'win_', 'pencere_', 'pencere_'
-        ]
-        
-        # Kapı pattern'leri
-        kapi_patterns = [
-            'kapı', 'kapi', 'door', 'd-', 'k-', 'tür', 'tur',
-            'kapı_', 'kapi_', 'door_', 'kapı_', 'kapi_'
-        ]
-        
+        # Her katman adı tek bir derlenmiş kalıpla taranır (pattern başına `in` döngüsü yok)
         for katman in tum_katmanlar:
             katman_lower = katman.lower()
-            
-            # Pencere kontrolü
-            for pattern in pencere_patterns:
-                if pattern in katman_lower:
-                    pencere_katmanlari.append(katman)
-                    logger.debug(f"🔍 Pencere katmanı tespit edildi: {katman}")
-                    break
-            
-            # Kapı kontrolü
-            for pattern in kapi_patterns:
-                if pattern in katman_lower:
-                    kapi_katmanlari.append(katman)
-                    logger.debug(f"🚪 Kapı katmanı tespit edildi: {katman}")
-                    break
+            if _PENCERE_RE.search(katman_lower):
+                pencere_katmanlari.append(katman)
+            if _KAPI_RE.search(katman_lower):
+                kapi_katmanlari.append(katman)
         
+        logger.debug("🔍 Pencere katmanları: %s, 🚪 Kapı katmanları: %s", pencere_katmanlari, kapi_katmanlari)
         logger.info(f"📊 Açıklık tespiti: {len(pencere_katmanlari)} pencere, {len(kapi_katmanlari)} kapı katmanı bulundu")
         
         return {
@@ -176,41 +580,42 @@ class DXFAnaliz:
         # Eğer alan bulunamadıysa, dikdörtgen/çizgi bazlı hesaplama yap
         if alan_m2 == 0:
             # LINE veya LWPOLYLINE (açık) entity'lerinden dikdörtgen alanı hesapla
-            line_query = f'LINE[layer=="{katman_adi}"]'
-            lines = list(self.msp.query(line_query))
-            
-            lwpolyline_query = f'LWPOLYLINE[layer=="{katman_adi}"]'
-            lwpolylines = list(self.msp.query(lwpolyline_query))
+            varliklar = self._katman_tipleri(katman_adi, ('LINE', 'LWPOLYLINE'))
+            lines = varliklar['LINE']
+            lwpolylines = varliklar['LWPOLYLINE']
             
             # Basit dikdörtgen alanı hesapla (min-max koordinatlar)
             if lines or lwpolylines:
-                min_x = float('inf')
-                max_x = float('-inf')
-                min_y = float('inf')
-                max_y = float('-inf')
-                
-                for entity in lines + lwpolylines:
+                # Tüm uç/köşe noktaları toplanır, sınırlar tek indirgemede bulunur
+                parcalar = []
+                for entity in lines:
                     try:
-                        if hasattr(entity, 'start') and hasattr(entity, 'end'):
-                            # LINE entity
-                            points = [entity.start, entity.end]
-                        elif hasattr(entity, 'points'):
-                            # LWPOLYLINE entity
-                            with entity.points("xy") as pts:
-                                points = list(pts)
-                        else:
-                            continue
-                        
-                        for point in points:
-                            x, y = point[0], point[1]
-                            min_x = min(min_x, x)
-                            max_x = max(max_x, x)
-                            min_y = min(min_y, y)
-                            max_y = max(max_y, y)
-                    except:
+                        start = entity.dxf.start
+                        end = entity.dxf.end
+                        parcalar.append(((start.x, start.y), (end.x, end.y)))
+                    except Exception:
                         continue
+                for entity in lwpolylines:
+                    try:
+                        noktalar = self._lw_noktalari(entity)
+                        if noktalar is not None and len(noktalar) > 0:
+                            parcalar.append(noktalar)
+                    except Exception:
+                        continue
+                
+                sinirlar = None
+                if parcalar and NUMPY_AVAILABLE:
+                    tum_noktalar = np.concatenate([np.asarray(p, dtype=np.float64) for p in parcalar])
+                    mins = tum_noktalar.min(axis=0)
+                    maxs = tum_noktalar.max(axis=0)
+                    sinirlar = (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+                elif parcalar:
+                    xs = [p[0] for parca in parcalar for p in parca]
+                    ys = [p[1] for parca in parcalar for p in parca]
+                    sinirlar = (min(xs), min(ys), max(xs), max(ys))
                 
-                if min_x != float('inf'):
+                if sinirlar is not None:
+                    min_x, min_y, max_x, max_y = sinirlar
                     # Dikdörtgen alanı hesapla
                     genislik = max_x - min_x
                     yukseklik = max_y - min_y
@@ -221,6 +626,36 @@ class DXFAnaliz:
         logger.info(f"📊 Açıklık alanı toplam: {alan_m2:.4f} m² (katman: {katman_adi})")
         return alan_m2
     
+    def aciklik_alanlari_hesapla(self, katmanlar: List[str],
+                                 max_workers: Optional[int] = None) -> Dict[str, float]:
+        """
+        Birden fazla açıklık katmanının alanını iş parçacığı havuzunda paralel hesaplar.
+        
+        Hesaplanamayan katman uyarı loglanarak 0.0 alanla döner; diğer
+        katmanların sonucu etkilenmez.
+        
+        Args:
+            katmanlar: Açıklık (pencere/kapı) katman adları
+            max_workers: İş parçacığı sayısı (None ise CPU sayısı)
+            
+        Returns:
+            Dict: katman adı -> açıklık alanı (m²)
+        """
+        def hesapla(katman: str) -> float:
+            try:
+                return self.aciklik_alani_hesapla(katman)
+            except Exception as e:
+                logger.warning(f"⚠️ Açıklık alanı hesaplanamadı ({katman}): {e}")
+                return 0.0
+        
+        if len(katmanlar) <= 1:
+            return {k: hesapla(k) for k in katmanlar}
+        
+        # Dizinler işçiler başlamadan kurulur (her iş parçacığı ayrı ayrı kurmasın)
+        self._kovalar()
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+            return dict(zip(katmanlar, ex.map(hesapla, katmanlar)))
+    
     def alan_hesapla(self, katman_adi: str, tolerans: float = 0.20) -> Dict[str, Any]:
         """
         Belirtilen katmandaki KAPALI poligonların (LWPOLYLINE) alanını hesaplar.
@@ -237,81 +672,106 @@ class DXFAnaliz:
         Returns:
             Dict: Hesaplama sonuçları (m² cinsinden)
         """
-        toplam_alan = 0.0
-        parca_sayisi = 0
+        # Katmanda LWPOLYLINE yoksa (yanlış/boş katman) hesaplama adımlarına girme
+        if 'LWPOLYLINE' not in self._kovalar()[0].get(katman_adi, {}):
+            logger.info(f"🔍 alan_hesapla() - Katman: {katman_adi}, LWPOLYLINE yok")
+            return {
+                "katman": katman_adi,
+                "toplam_miktar": 0.0,
+                "birim": "m²",
+                "parca_sayisi": 0,
+                "not": "0 parça AI ile birleştirildi."
+            }
+        
         tamir_edilen = 0
         
         # Birime göre toleransı ayarla (boşluk kapatma hassasiyeti)
         # Eğer çizim CM ise ve biz 20cm boşluk kapatacaksak, tolerans 20 olmalı.
-        gercek_tolerans = tolerans
-        if self.birim == "cm":
-            gercek_tolerans = tolerans * 100  # 0.2m -> 20cm
-        elif self.birim == "mm":
-            gercek_tolerans = tolerans * 1000  # 0.2m -> 200mm
-        
-        sorgu = f'LWPOLYLINE[layer=="{katman_adi}"]'
-        entities = list(self.msp.query(sorgu))
+        gercek_tolerans = tolerans * self._birim_katsayisi  # 0.2m -> 20cm / 200mm
+        # Uç noktalar arası mesafe karesiyle karşılaştırılır (varlık başına karekök yok)
+        tolerans_kare = gercek_tolerans * gercek_tolerans
+        
+        entities = self._katman_varliklari('LWPOLYLINE', katman_adi)
         logger.info(f"🔍 alan_hesapla() - Katman: {katman_adi}, Birim: {self.birim}, Bulunan LWPOLYLINE sayısı: {len(entities)}")
         
+        # En az 3 noktalı tüm poligonlar toplanır; kapatma kontrolü ve alanlar döngüden
+        # sonra tek geçişte hesaplanır
+        aday_idx = []
+        aday_noktalar = []
+        aday_kapali = []
+        # Döngü içinde traceback biçimlenmez; yalnızca ilk hata döngüden sonra ayrıntılı loglanır
+        ilk_hata = None
+        
         for idx, entity in enumerate(entities):
             try:
-                # Kapalı mı kontrol et
-                is_closed = getattr(entity, 'is_closed', False)
-                logger.info(f"📐 LWPOLYLINE #{idx+1} (alan): is_closed={is_closed}")
+                # Kapalı mı kontrol et (LWPOLYLINE bayraklarının 0. biti)
+                is_closed = bool(entity.dxf.flags & _LWPOLYLINE_KAPALI)
                 
-                # Noktaları okumak için entity.points() context manager kullan
-                noktalar = None
-                try:
-                    with entity.points("xy") as pts:
-                        noktalar = list(pts)
-                        logger.info(f"✅ LWPOLYLINE #{idx+1} (alan) noktaları points() ile okundu: {len(noktalar)} nokta")
-                except (AttributeError, TypeError) as e1:
-                    logger.warning(f"⚠️ LWPOLYLINE #{idx+1} (alan) points() hatası: {e1}, alternatif yöntem deneniyor...")
-                    # Alternatif: vertices kullan
-                    try:
-                        noktalar = [(v[0], v[1]) for v in entity.vertices]
-                        logger.info(f"✅ LWPOLYLINE #{idx+1} (alan) noktaları vertices ile okundu: {len(noktalar)} nokta")
-                    except Exception as e2:
-                        logger.error(f"❌ LWPOLYLINE #{idx+1} (alan) nokta okuma hatası: {e2}")
-                        continue
-                
-                if not noktalar or len(noktalar) < 3:
-                    logger.warning(f"⚠️ LWPOLYLINE #{idx+1} (alan) yeterli nokta yok: {len(noktalar) if noktalar else 0} nokta (en az 3 gerekli)")
+                noktalar = self._lw_noktalari(entity)
+                if noktalar is None or len(noktalar) < 3:
+                    logger.warning("⚠️ LWPOLYLINE #%d (alan) yeterli nokta yok: %d nokta (en az 3 gerekli)",
+                                   idx + 1, 0 if noktalar is None else len(noktalar))
                     continue
                 
-                # Kapalı mı veya kapatılabilir mi?
-                kapatildi = False
-                if is_closed:
-                    kapatildi = True
-                    logger.info(f"✅ LWPOLYLINE #{idx+1} (alan) kapalı olarak işaretlenmiş")
-                else:
-                    baslangic = noktalar[0]
-                    bitis = noktalar[-1]
-                    mesafe = math.hypot(bitis[0] - baslangic[0], bitis[1] - baslangic[1])
-                    logger.info(f"📏 LWPOLYLINE #{idx+1} (alan) başlangıç-bitiş mesafesi: {mesafe:.4f} (birim: {self.birim}), tolerans: {gercek_tolerans:.4f}")
-                    if mesafe <= gercek_tolerans:
-                        kapatildi = True
-                        tamir_edilen += 1
-                        logger.info(f"✅ LWPOLYLINE #{idx+1} (alan) tolerans içinde, kapatıldı")
-                
-                if kapatildi:
-                    ham_alan = self._shoelace_formulu(noktalar)
-                    logger.info(f"📐 LWPOLYLINE #{idx+1} (alan) ham alan (shoelace): {ham_alan:.4f} (birim²: {self.birim}²)")
-                    
-                    # HAM ALANI METREKAREYE ÇEVİR
-                    gercek_alan = self._birim_cevir(ham_alan)
-                    logger.info(f"✅ LWPOLYLINE #{idx+1} (alan) dönüştürülmüş alan: {gercek_alan:.4f} m² (ham: {ham_alan:.4f} {self.birim}²)")
-                    
-                    toplam_alan += gercek_alan
-                    parca_sayisi += 1
-                    logger.info(f"📊 LWPOLYLINE #{idx+1} (alan) eklendi. Toplam alan: {toplam_alan:.4f} m²")
-                else:
-                    logger.info(f"⏭️ LWPOLYLINE #{idx+1} (alan) açık ve tolerans dışında, atlandı")
+                aday_idx.append(idx)
+                aday_noktalar.append(noktalar)
+                aday_kapali.append(bool(is_closed))
             
             except Exception as e:
-                logger.error(f"❌ LWPOLYLINE #{idx+1} (alan) işleme hatası: {e}", exc_info=True)
+                logger.warning("⚠️ LWPOLYLINE #%d (alan) işleme hatası: %r", idx + 1, e)
+                if ilk_hata is None:
+                    ilk_hata = e
                 continue
         
+        if ilk_hata is not None:
+            logger.error("❌ LWPOLYLINE (alan) ilk işleme hatası ayrıntısı:", exc_info=ilk_hata)
+            ilk_hata = None
+        
+        if NUMPY_AVAILABLE and aday_noktalar:
+            # Uç nokta mesafeleri ve alanlar aynı (M, 2) tampondan tek NumPy geçişiyle
+            all_xy, offs = self._koordinat_tamponu(aday_noktalar)
+            bas = offs[:-1]
+            son = offs[1:] - 1
+            dx = all_xy[son, 0] - all_xy[bas, 0]
+            dy = all_xy[son, 1] - all_xy[bas, 1]
+            kapali = np.fromiter(aday_kapali, dtype=bool, count=len(aday_kapali))
+            kullan = kapali | (dx * dx + dy * dy <= tolerans_kare)
+            tamir_edilen = int((~kapali & kullan).sum())
+            kapali_idx = [aday_idx[i] for i in np.flatnonzero(kullan)]
+            ham_dizi = self._tampon_alanlari(all_xy, offs)[kullan]
+            # HAM ALANLARI METREKAREYE ÇEVİR (tüm vektöre tek çarpma)
+            gercek_dizi = ham_dizi * self._alan_olcegi
+            toplam_alan = float(gercek_dizi.sum())
+            ham_alanlar = ham_dizi.tolist()
+            gercek_alanlar = gercek_dizi.tolist()
+        else:
+            kapali_idx = []
+            kapali_noktalar = []
+            for idx, noktalar, is_closed in zip(aday_idx, aday_noktalar, aday_kapali):
+                if not is_closed:
+                    dx = float(noktalar[-1][0]) - float(noktalar[0][0])
+                    dy = float(noktalar[-1][1]) - float(noktalar[0][1])
+                    if dx * dx + dy * dy > tolerans_kare:
+                        continue
+                    tamir_edilen += 1
+                kapali_idx.append(idx)
+                kapali_noktalar.append(noktalar)
+            ham_alanlar = self._shoelace_toplu(kapali_noktalar)
+            # HAM ALANLARI METREKAREYE ÇEVİR
+            olcek = self._alan_olcegi
+            gercek_alanlar = [ham_alan * olcek for ham_alan in ham_alanlar]
+            toplam_alan = sum(gercek_alanlar, 0.0)
+        parca_sayisi = len(kapali_idx)
+        
+        atlanan = len(aday_idx) - len(kapali_idx)
+        if atlanan:
+            logger.info(f"⏭️ alan_hesapla() - {atlanan} LWPOLYLINE açık ve tolerans dışında, atlandı (tolerans²: {tolerans_kare:.4f} {self.birim}²)")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, ham_alan, gercek_alan in zip(kapali_idx, ham_alanlar, gercek_alanlar):
+                logger.debug("✅ LWPOLYLINE #%d (alan) alan: %.4f m² (ham, shoelace: %.4f %s²)",
+                             idx + 1, gercek_alan, ham_alan, self.birim)
+        
         logger.info(f"📊 alan_hesapla() ÖZET - Katman: {katman_adi}, Toplam alan: {toplam_alan:.4f} m², Parça sayısı: {parca_sayisi}, Tamir edilen: {tamir_edilen}")
         
         return {
@@ -322,6 +782,53 @@ class DXFAnaliz:
             "not": f"{tamir_edilen} parça AI ile birleştirildi."
         }
     
+    def alan_hesapla_batch(self, katmanlar: List[str], tolerans: float = 0.20,
+                           max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Birden fazla katmanın alanını iş parçacığı havuzunda paralel hesaplar.
+        
+        Katmanlar birbirinden bağımsızdır ve yüklemeden sonra varlık grupları
+        yalnızca okunduğundan aynı doküman üzerinde eşzamanlı okuma güvenlidir.
+        
+        Args:
+            katmanlar: Hesaplanacak katman adları
+            tolerans: alan_hesapla ile aynı boşluk kapatma toleransı (metre)
+            max_workers: İş parçacığı sayısı (None ise CPU sayısı)
+            
+        Returns:
+            Dict: katman adı -> alan_hesapla sonucu
+        """
+        if len(katmanlar) <= 1:
+            return {k: self.alan_hesapla(k, tolerans) for k in katmanlar}
+        
+        # Dizinler işçiler başlamadan kurulur (her iş parçacığı ayrı ayrı kurmasın)
+        self._kovalar()
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+            return dict(zip(katmanlar, ex.map(lambda k: self.alan_hesapla(k, tolerans), katmanlar)))
+    
+    def uzunluk_hesapla_batch(self, katmanlar: List[str],
+                              max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Birden fazla katmanın uzunluğunu iş parçacığı havuzunda paralel hesaplar.
+        
+        Katmanların varlık kümeleri ayrıktır; ağır kısımlar (NumPy ve GIL'i bırakan
+        derlenmiş çekirdekler) iş parçacıkları arasında gerçekten paralel çalışır.
+        
+        Args:
+            katmanlar: Hesaplanacak katman adları
+            max_workers: İş parçacığı sayısı (None ise CPU sayısı)
+            
+        Returns:
+            Dict: katman adı -> uzunluk_hesapla sonucu
+        """
+        if len(katmanlar) <= 1:
+            return {k: self.uzunluk_hesapla(k) for k in katmanlar}
+        
+        # Dizinler işçiler başlamadan kurulur (her iş parçacığı ayrı ayrı kurmasın)
+        self._kovalar()
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+            return dict(zip(katmanlar, ex.map(self.uzunluk_hesapla, katmanlar)))
+    
     def uzunluk_hesapla(self, katman_adi: str) -> Dict[str, Any]:
         """
         Belirtilen katmandaki çizgilerin (LINE, LWPOLYLINE, POLYLINE, ARC, MLINE) toplam uzunluğunu hesaplar.
@@ -338,29 +845,37 @@ class DXFAnaliz:
         parca_sayisi = 0
         detay_bilgi = []
         
+        # Katmanın tüm çizgi tipleri yüklemede kurulan kovalardan tek seferde alınır
+        varliklar = self._katman_tipleri(katman_adi, _UZUNLUK_TIPLERI)
+        
         # LINE entity'lerini hesapla
-        line_query = f'LINE[layer=="{katman_adi}"]'
-        line_entities = list(self.msp.query(line_query))
+        line_entities = varliklar['LINE']
         line_sayisi = len(line_entities)
         line_toplam = 0.0
+        # Birime göre metreye çevirme çarpanı (mimari projeler genelde m cinsindendir)
+        olcek = self._uzunluk_olcegi
         
-        for entity in line_entities:
+        # Uç noktalar tek (N, 4) dizisine okunur, uzunluklar tek np.hypot çağrısıyla toplanır;
+        # okunamayan bir varlık varsa varlık başına döngüye dönülür
+        vektorel = False
+        if NUMPY_AVAILABLE and line_entities:
+            try:
+                uclar = np.array([(e.dxf.start.x, e.dxf.start.y, e.dxf.end.x, e.dxf.end.y)
+                                  for e in line_entities], dtype=np.float64)
+                line_toplam = float(np.hypot(uclar[:, 2] - uclar[:, 0], uclar[:, 3] - uclar[:, 1]).sum()) * olcek
+                parca_sayisi += line_sayisi
+                vektorel = True
+            except Exception as e:
+                logger.debug("LINE toplu okuma yapılamadı, varlık başına okunuyor: %s", e)
+        
+        for entity in ([] if vektorel else line_entities):
             try:
                 start = entity.dxf.start
                 end = entity.dxf.end
                 uzunluk = math.hypot(
                     end.x - start.x,
                     end.y - start.y
-                )
-                # Birime göre metreye çevir (mimari projeler genelde m cinsindendir)
-                if self.birim == "cm":
-                    uzunluk = uzunluk / 100.0  # cm -> m
-                    logger.debug(f"LINE: {uzunluk*100:.2f}cm -> {uzunluk:.4f}m")
-                elif self.birim == "mm":
-                    uzunluk = uzunluk / 1000.0  # mm -> m
-                    logger.debug(f"LINE: {uzunluk*1000:.2f}mm -> {uzunluk:.4f}m")
-                else:  # m veya başka bir değer - zaten metre kabul et
-                    logger.debug(f"LINE: {uzunluk:.4f}m (birim: {self.birim}, dönüşüm yok)")
+                ) * olcek
                 line_toplam += uzunluk
                 parca_sayisi += 1
             except Exception as e:
@@ -372,33 +887,21 @@ class DXFAnaliz:
         toplam_uzunluk += line_toplam
         
         # POLYLINE entity'lerini hesapla (eski format)
-        polyline_query = f'POLYLINE[layer=="{katman_adi}"]'
-        polyline_entities = list(self.msp.query(polyline_query))
+        polyline_entities = varliklar['POLYLINE']
         polyline_sayisi = len(polyline_entities)
         polyline_toplam = 0.0
         
         for entity in polyline_entities:
             try:
-                uzunluk = 0.0
-                vertices = list(entity.vertices)
+                # ezdxf köşeleri zaten liste olarak tutar; kopyalanmaz
+                vertices = entity.vertices
                 if len(vertices) < 2:
                     continue
                 
-                for i in range(len(vertices) - 1):
-                    v1 = vertices[i].dxf.location
-                    v2 = vertices[i + 1].dxf.location
-                    segment_uzunluk = math.hypot(v2.x - v1.x, v2.y - v1.y)
-                    uzunluk += segment_uzunluk
+                uzunluk = self._vertex_uzunlugu(vertices)
                 
                 # Birime göre metreye çevir
-                if self.birim == "cm":
-                    uzunluk = uzunluk / 100.0
-                    logger.debug(f"POLYLINE: {uzunluk*100:.2f}cm -> {uzunluk:.4f}m")
-                elif self.birim == "mm":
-                    uzunluk = uzunluk / 1000.0
-                    logger.debug(f"POLYLINE: {uzunluk*1000:.2f}mm -> {uzunluk:.4f}m")
-                else:  # m veya başka bir değer - zaten metre kabul et
-                    logger.debug(f"POLYLINE: {uzunluk:.4f}m (birim: {self.birim}, dönüşüm yok)")
+                uzunluk *= olcek
                 
                 polyline_toplam += uzunluk
                 parca_sayisi += 1
@@ -413,8 +916,7 @@ class DXFAnaliz:
         # LWPOLYLINE entity'lerini hesapla
         # NOT: İç içe kapalı LWPOLYLINE'lar varsa (duvar kalınlığı göstermek için), 
         # sadece en büyük olanı (dış duvar) kullanmalıyız
-        lwpolyline_query = f'LWPOLYLINE[layer=="{katman_adi}"]'
-        lwpolyline_entities = list(self.msp.query(lwpolyline_query))
+        lwpolyline_entities = varliklar['LWPOLYLINE']
         lwpolyline_sayisi = len(lwpolyline_entities)
         lwpolyline_toplam = 0.0
         
@@ -422,139 +924,93 @@ class DXFAnaliz:
         # İç içe olanları gruplamak için: (entity, uzunluk, merkez_nokta, alan) tuple'ları
         kapali_bilgiler = []  # İç içe duvarlar için: [(entity, uzunluk, merkez, alan), ...]
         acik_uzunluklar = []    # Açık çizgiler için
+        # Varlık başına ayrıntı logları yalnızca DEBUG açıksa biçimlenir
+        dbg = logger.isEnabledFor(logging.DEBUG)
+        # En az 2 noktalı çizgiler: lwpolyline_entities indeksi, noktalar, kapalı mı
+        aday_idx = []
+        aday_noktalar = []
+        aday_kapali = []
+        ilk_hata = None
         
         for idx, entity in enumerate(lwpolyline_entities):
             try:
-                # Kapalı mı kontrol et
-                is_closed = getattr(entity, 'is_closed', False)
-                logger.info(f"🔍 LWPOLYLINE #{idx+1}: is_closed={is_closed}")
-                
-                # Noktaları okumayı dene
-                noktalar = None
-                try:
-                    with entity.points("xy") as pts:
-                        noktalar = list(pts)
-                        logger.info(f"✅ LWPOLYLINE #{idx+1} noktaları points() ile okundu: {len(noktalar)} nokta")
-                        if len(noktalar) > 0:
-                            logger.info(f"   İlk nokta: {noktalar[0]}, Son nokta: {noktalar[-1]}")
-                except (AttributeError, TypeError) as e1:
-                    logger.warning(f"⚠️ LWPOLYLINE #{idx+1} points() hatası: {e1}, alternatif yöntem deneniyor...")
-                    try:
-                        noktalar = [(v[0], v[1]) for v in entity.vertices]
-                        logger.info(f"✅ LWPOLYLINE #{idx+1} noktaları vertices ile okundu: {len(noktalar)} nokta")
-                        if len(noktalar) > 0:
-                            logger.info(f"   İlk nokta: {noktalar[0]}, Son nokta: {noktalar[-1]}")
-                    except Exception as e2:
-                        logger.error(f"❌ LWPOLYLINE #{idx+1} nokta okuma hatası (hem points hem vertices): {e1}, {e2}")
-                        continue
+                # Kapalı mı kontrol et (LWPOLYLINE bayraklarının 0. biti)
+                is_closed = bool(entity.dxf.flags & _LWPOLYLINE_KAPALI)
                 
-                if not noktalar or len(noktalar) < 2:
-                    logger.warning(f"⚠️ LWPOLYLINE #{idx+1} yeterli nokta yok: {len(noktalar) if noktalar else 0} nokta (en az 2 gerekli)")
+                noktalar = self._lw_noktalari(entity)
+                if noktalar is None or len(noktalar) < 2:
+                    logger.warning("⚠️ LWPOLYLINE #%d yeterli nokta yok: %d nokta (en az 2 gerekli)",
+                                   idx + 1, 0 if noktalar is None else len(noktalar))
                     continue
                 
-                # Noktalar arası mesafeleri topla
-                uzunluk = 0.0
-                
+                # Noktalar arası mesafeler döngüden sonra tüm çizgiler için tek geçişte toplanır
+                # Kapalı poligon: tüm çevre uzunluğu (son nokta -> ilk nokta da dahil)
+                # Açık çizgi: başlangıç -> bitiş
+                if dbg:
+                    segment_sayisi = len(noktalar) if is_closed else len(noktalar) - 1
+                    logger.debug("📏 LWPOLYLINE #%d (%s): %d segment hesaplanıyor...",
+                                 idx + 1, 'kapalı' if is_closed else 'açık', segment_sayisi)
+                aday_idx.append(idx)
+                aday_noktalar.append(noktalar)
+                aday_kapali.append(bool(is_closed))
+            except Exception as e:
+                logger.warning("⚠️ LWPOLYLINE #%d okuma hatası: %r", idx + 1, e)
+                if ilk_hata is None:
+                    ilk_hata = e
+                continue
+        
+        # Traceback yalnızca ilk hata için bir kez biçimlenir
+        if ilk_hata is not None:
+            logger.error("❌ LWPOLYLINE ilk okuma hatası ayrıntısı:", exc_info=ilk_hata)
+            ilk_hata = None
+        
+        # Uzunluklar, kapalı halkaların merkezleri ve alanları aynı (M, 2) tampondan hesaplanır
+        merkezler = alanlar = None
+        if NUMPY_AVAILABLE and aday_noktalar:
+            all_xy, offs = self._koordinat_tamponu(aday_noktalar)
+            kapali = np.fromiter(aday_kapali, dtype=bool, count=len(aday_kapali))
+            ham_uzunluklar = self._tampon_uzunluklari(all_xy, offs, kapali).tolist()
+            if kapali.any():
+                nokta_sayilari = np.diff(offs).astype(np.float64)
+                merkezler = (np.add.reduceat(all_xy, offs[:-1], axis=0) / nokta_sayilari[:, None]).tolist()
+                alanlar = (self._tampon_alanlari(all_xy, offs) * self._alan_olcegi).tolist()
+        else:
+            ham_uzunluklar = [self._cizgi_uzunlugu(n, k) for n, k in zip(aday_noktalar, aday_kapali)]
+        
+        for k, (idx, noktalar, is_closed) in enumerate(zip(aday_idx, aday_noktalar, aday_kapali)):
+            uzunluk = ham_uzunluklar[k]
+            logger.debug("📐 LWPOLYLINE #%d ham uzunluk: %.4f (birim: %s)", idx + 1, uzunluk, self.birim)
+            
+            # Birime göre metreye çevir
+            uzunluk *= olcek
+            if dbg:
+                logger.debug("✅ LWPOLYLINE #%d (%s): %.4fm", idx + 1, 'kapalı' if is_closed else 'açık', uzunluk)
+            
+            if uzunluk > 0:
+                entity = lwpolyline_entities[idx]
                 if is_closed:
-                    # Kapalı poligon: tüm çevre uzunluğu
-                    segment_sayisi = len(noktalar)  # Son nokta -> ilk nokta da dahil
-                    logger.info(f"📏 LWPOLYLINE #{idx+1} (kapalı): {segment_sayisi} segment hesaplanıyor (çevre uzunluğu)...")
-                    
-                    for i in range(segment_sayisi):
-                        p1 = noktalar[i]
-                        p2 = noktalar[(i + 1) % len(noktalar)]  # Son nokta -> ilk nokta
-                        segment_uzunluk = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-                        uzunluk += segment_uzunluk
-                        logger.info(f"   Segment {i+1}/{segment_sayisi}: {segment_uzunluk:.4f} (birim: {self.birim}) - P1: {p1}, P2: {p2}")
-                else:
-                    # Açık çizgi: başlangıç -> bitiş
-                    segment_sayisi = len(noktalar) - 1
-                    logger.info(f"📏 LWPOLYLINE #{idx+1} (açık): {segment_sayisi} segment hesaplanıyor...")
-                    
-                    for i in range(segment_sayisi):
-                        p1 = noktalar[i]
-                        p2 = noktalar[i + 1]
-                        segment_uzunluk = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-                        uzunluk += segment_uzunluk
-                        logger.info(f"   Segment {i+1}/{segment_sayisi}: {segment_uzunluk:.4f} (birim: {self.birim}) - P1: {p1}, P2: {p2}")
-                
-                logger.info(f"📐 LWPOLYLINE #{idx+1} ham uzunluk: {uzunluk:.4f} (birim: {self.birim})")
-                
-                # Birime göre metreye çevir
-                if self.birim == "cm":
-                    uzunluk = uzunluk / 100.0  # cm -> m
-                    durum = "kapalı" if is_closed else "açık"
-                    logger.info(f"✅ LWPOLYLINE #{idx+1} ({durum}): {uzunluk*100:.2f}cm -> {uzunluk:.4f}m")
-                elif self.birim == "mm":
-                    uzunluk = uzunluk / 1000.0  # mm -> m
-                    durum = "kapalı" if is_closed else "açık"
-                    logger.info(f"✅ LWPOLYLINE #{idx+1} ({durum}): {uzunluk*1000:.2f}mm -> {uzunluk:.4f}m")
-                else:  # m veya başka bir değer - zaten metre kabul et
-                    durum = "kapalı" if is_closed else "açık"
-                    logger.info(f"✅ LWPOLYLINE #{idx+1} ({durum}): {uzunluk:.4f}m (birim: {self.birim}, dönüşüm yok)")
-                
-                if uzunluk > 0:
-                    if is_closed:
-                        # Merkez noktayı ve alanı hesapla (iç içe olanları gruplamak için)
-                        try:
-                            # Merkez nokta (ağırlık merkezi)
-                            merkez_x = sum(p[0] for p in noktalar) / len(noktalar)
-                            merkez_y = sum(p[1] for p in noktalar) / len(noktalar)
-                            merkez = (merkez_x, merkez_y)
-                            
-                            # Alan (iç içe olanları tespit etmek için)
-                            alan = self._shoelace_formulu(noktalar)
-                            if self.birim == "cm":
-                                alan = alan / 10000.0  # cm² -> m²
-                            elif self.birim == "mm":
-                                alan = alan / 1000000.0  # mm² -> m²
-                            
-                            kapali_bilgiler.append((entity, uzunluk, merkez, alan))
-                            logger.info(f"📝 LWPOLYLINE #{idx+1} (kapalı) bilgileri eklendi: uzunluk={uzunluk:.4f}m, alan={alan:.4f}m², merkez={merkez}")
-                        except Exception as e:
-                            logger.warning(f"⚠️ LWPOLYLINE #{idx+1} merkez/alan hesaplama hatası: {e}, sadece uzunluk kullanılıyor")
-                            kapali_bilgiler.append((entity, uzunluk, None, None))
+                    # Merkez noktayı ve alanı hesapla (iç içe olanları gruplamak için)
+                    if merkezler is not None:
+                        merkez = tuple(merkezler[k])
+                        alan = alanlar[k]
                     else:
-                        acik_uzunluklar.append(uzunluk)
-                        logger.info(f"📝 LWPOLYLINE #{idx+1} (açık) uzunluk listeye eklendi: {uzunluk:.4f}m")
+                        merkez, alan = self._merkez_ve_alan(noktalar)
+                    
+                    kapali_bilgiler.append((entity, uzunluk, merkez, alan))
+                    logger.debug("📝 LWPOLYLINE #%d (kapalı) bilgileri eklendi: uzunluk=%.4fm, alan=%.4fm², merkez=%s",
+                                 idx + 1, uzunluk, alan, merkez)
                 else:
-                    logger.warning(f"⚠️ LWPOLYLINE #{idx+1} uzunluk 0, eklenmedi (ham uzunluk: {uzunluk:.4f})")
-            except Exception as e:
-                logger.error(f"❌ LWPOLYLINE entity okuma hatası: {e}", exc_info=True)
-                continue
+                    acik_uzunluklar.append(uzunluk)
+                    logger.debug("📝 LWPOLYLINE #%d (açık) uzunluk listeye eklendi: %.4fm", idx + 1, uzunluk)
+            else:
+                logger.warning(f"⚠️ LWPOLYLINE #{idx+1} uzunluk 0, eklenmedi (ham uzunluk: {uzunluk:.4f})")
         
         # İç içe kapalı LWPOLYLINE'ları grupla ve her grubun en büyüğünü kullan
         if len(kapali_bilgiler) > 0:
             # İç içe olanları grupla (birbirine yakın merkez noktalara sahip olanlar = aynı duvar)
-            gruplar = []
-            kullanildi = set()
-            
-            for i, (entity1, uzunluk1, merkez1, alan1) in enumerate(kapali_bilgiler):
-                if i in kullanildi:
-                    continue
-                
-                # Yeni grup oluştur
-                grup = [(entity1, uzunluk1, merkez1, alan1)]
-                kullanildi.add(i)
-                
-                # Bu gruba yakın olanları bul
-                if merkez1:
-                    for j, (entity2, uzunluk2, merkez2, alan2) in enumerate(kapali_bilgiler):
-                        if j in kullanildi or not merkez2:
-                            continue
-                        
-                        # Merkez noktalar arası mesafe
-                        mesafe = math.hypot(merkez2[0] - merkez1[0], merkez2[1] - merkez1[1])
-                        # Birime göre tolerans (1m içinde = aynı duvar)
-                        tolerans = 1.0 if self.birim == 'm' else (100.0 if self.birim == 'cm' else 1000.0)
-                        
-                        # Veya alan kontrolü: bir alan diğerinin içindeyse (alan farkı küçükse)
-                        if mesafe <= tolerans or (alan1 and alan2 and abs(alan1 - alan2) / max(alan1, alan2) < 0.1):
-                            grup.append((entity2, uzunluk2, merkez2, alan2))
-                            kullanildi.add(j)
-                            logger.info(f"🔗 LWPOLYLINE #{i+1} ve #{j+1} aynı gruba eklendi (mesafe: {mesafe:.4f}, alan farkı: {abs(alan1 - alan2) if alan1 and alan2 else 'N/A'})")
-                
-                gruplar.append(grup)
+            # Birime göre tolerans (1m içinde = aynı duvar)
+            gruplar = [[kapali_bilgiler[k] for k in grup]
+                       for grup in self._ic_ice_gruplari(kapali_bilgiler, self._birim_katsayisi)]
             
             # Her grubun en büyük uzunluğunu kullan (dış duvar)
             for grup_idx, grup in enumerate(gruplar):
@@ -563,20 +1019,21 @@ class DXFAnaliz:
                     en_buyuk = max(grup, key=lambda x: x[1])  # Uzunluğa göre
                     lwpolyline_toplam += en_buyuk[1]
                     parca_sayisi += 1
-                    logger.info(f"📦 Grup #{grup_idx+1}: {len(grup)} adet iç içe LWPOLYLINE bulundu (kalınlık göstermek için)")
-                    logger.info(f"   ✅ Sadece en büyük olanı (dış duvar) kullanılıyor: {en_buyuk[1]:.4f}m")
-                    logger.info(f"   ⏭️ Diğer uzunluklar atlandı: {[f'{u:.4f}m' for _, u, _, _ in grup if u != en_buyuk[1]]}")
+                    if dbg:
+                        logger.debug("📦 Grup #%d: %d adet iç içe LWPOLYLINE bulundu (kalınlık göstermek için)", grup_idx + 1, len(grup))
+                        logger.debug("   ✅ Sadece en büyük olanı (dış duvar) kullanılıyor: %.4fm", en_buyuk[1])
+                        logger.debug("   ⏭️ Diğer uzunluklar atlandı: %s", [f'{u:.4f}m' for _, u, _, _ in grup if u != en_buyuk[1]])
                 else:
                     # Tek başına duvar
                     lwpolyline_toplam += grup[0][1]
                     parca_sayisi += 1
-                    logger.info(f"✅ Grup #{grup_idx+1}: Tek LWPOLYLINE uzunluğu: {grup[0][1]:.4f}m")
+                    logger.debug("✅ Grup #%d: Tek LWPOLYLINE uzunluğu: %.4fm", grup_idx + 1, grup[0][1])
         
         # Açık LWPOLYLINE'ları ekle
         for acik_uzunluk in acik_uzunluklar:
             lwpolyline_toplam += acik_uzunluk
             parca_sayisi += 1
-            logger.info(f"✅ Açık LWPOLYLINE uzunluğu eklendi: {acik_uzunluk:.4f}m (toplam: {lwpolyline_toplam:.4f}m)")
+            logger.debug("✅ Açık LWPOLYLINE uzunluğu eklendi: %.4fm (toplam: %.4fm)", acik_uzunluk, lwpolyline_toplam)
         
         if lwpolyline_sayisi > 0:
             kapali_sayisi = len(kapali_bilgiler)
@@ -594,12 +1051,25 @@ class DXFAnaliz:
         toplam_uzunluk += lwpolyline_toplam
         
         # ARC entity'lerini hesapla (yay çizgileri)
-        arc_query = f'ARC[layer=="{katman_adi}"]'
-        arc_entities = list(self.msp.query(arc_query))
+        arc_entities = varliklar['ARC']
         arc_sayisi = len(arc_entities)
         arc_toplam = 0.0
         
-        for entity in arc_entities:
+        # Yarıçap ve açılar tek (N, 3) dizisine okunur, yay uzunlukları vektörel hesaplanır
+        vektorel = False
+        if NUMPY_AVAILABLE and arc_entities:
+            try:
+                yaylar = np.array([(e.dxf.radius, e.dxf.start_angle, e.dxf.end_angle)
+                                   for e in arc_entities], dtype=np.float64)
+                aci_farki = np.abs(np.radians(yaylar[:, 2]) - np.radians(yaylar[:, 1]))
+                aci_farki = np.where(aci_farki > math.pi, 2 * math.pi - aci_farki, aci_farki)
+                arc_toplam = float((yaylar[:, 0] * aci_farki).sum()) * olcek
+                parca_sayisi += arc_sayisi
+                vektorel = True
+            except Exception as e:
+                logger.debug("ARC toplu okuma yapılamadı, varlık başına okunuyor: %s", e)
+        
+        for entity in ([] if vektorel else arc_entities):
             try:
                 radius = entity.dxf.radius
                 start_angle = math.radians(entity.dxf.start_angle)
@@ -614,14 +1084,7 @@ class DXFAnaliz:
                 uzunluk = radius * angle_diff
                 
                 # Birime göre metreye çevir
-                if self.birim == "cm":
-                    uzunluk = uzunluk / 100.0
-                    logger.debug(f"ARC: {uzunluk*100:.2f}cm -> {uzunluk:.4f}m")
-                elif self.birim == "mm":
-                    uzunluk = uzunluk / 1000.0
-                    logger.debug(f"ARC: {uzunluk*1000:.2f}mm -> {uzunluk:.4f}m")
-                else:  # m veya başka bir değer - zaten metre kabul et
-                    logger.debug(f"ARC: {uzunluk:.4f}m (birim: {self.birim}, dönüşüm yok)")
+                uzunluk *= olcek
                 
                 arc_toplam += uzunluk
                 parca_sayisi += 1
@@ -634,62 +1097,54 @@ class DXFAnaliz:
         toplam_uzunluk += arc_toplam
         
         # MLINE entity'lerini hesapla (MultiLine - AutoCAD MLINE komutu)
-        mline_query = f'MLINE[layer=="{katman_adi}"]'
-        mline_entities = list(self.msp.query(mline_query))
+        mline_entities = varliklar['MLINE']
         mline_sayisi = len(mline_entities)
         mline_toplam = 0.0
         
         for entity in mline_entities:
             try:
-                uzunluk = 0.0
                 # MLINE vertex'lerini al
-                vertices = list(entity.vertices)
+                vertices = entity.vertices
                 if len(vertices) < 2:
                     continue
                 
-                # Her vertex'teki merkez noktayı kullan (MLINE çoklu çizgi olduğu için)
-                for i in range(len(vertices) - 1):
-                    v1 = vertices[i].dxf.location  # Merkez nokta
-                    v2 = vertices[i + 1].dxf.location
-                    segment_uzunluk = math.hypot(v2.x - v1.x, v2.y - v1.y)
-                    uzunluk += segment_uzunluk
+                # Her vertex'teki merkez noktayı kullan (MLINE çoklu çizgi olduğu için).
+                # MLINE köşeleri DXF varlığı değildir; konum doğrudan v.location'dadır.
+                # Koordinatlar tek (n, 2) dizisine alınır, kenarlar tek geçişte toplanır.
+                n = len(vertices)
+                if NUMPY_AVAILABLE:
+                    noktalar = np.fromiter(
+                        (c for v in vertices for c in (v.location.x, v.location.y)),
+                        dtype=np.float64, count=2 * n
+                    ).reshape(n, 2)
+                else:
+                    noktalar = [(v.location.x, v.location.y) for v in vertices]
+                uzunluk = self._cizgi_uzunlugu(noktalar)
                 
                 # Birime göre metreye çevir
-                if self.birim == "cm":
-                    uzunluk = uzunluk / 100.0
-                    logger.debug(f"MLINE: {uzunluk*100:.2f}cm -> {uzunluk:.4f}m")
-                elif self.birim == "mm":
-                    uzunluk = uzunluk / 1000.0
-                    logger.debug(f"MLINE: {uzunluk*1000:.2f}mm -> {uzunluk:.4f}m")
-                else:  # m veya başka bir değer - zaten metre kabul et
-                    logger.debug(f"MLINE: {uzunluk:.4f}m (birim: {self.birim}, dönüşüm yok)")
+                uzunluk *= olcek
                 
                 mline_toplam += uzunluk
                 parca_sayisi += 1
             except Exception as e:
-                logger.warning(f"MLINE entity okuma hatası: {e}")
+                logger.warning("MLINE entity okuma hatası: %r", e)
                 # Alternatif yöntem dene: geometry kullan
                 try:
                     # MLINE'ın geometry'sini al
                     if hasattr(entity, 'flattening'):
                         points = list(entity.flattening(distance=0.01))
                         if len(points) >= 2:
-                            uzunluk = 0.0
-                            for i in range(len(points) - 1):
-                                p1 = points[i]
-                                p2 = points[i + 1]
-                                segment_uzunluk = math.hypot(p2.x - p1.x, p2.y - p1.y)
-                                uzunluk += segment_uzunluk
+                            # Vec3 noktaları ara tuple listesi kurulmadan diziye alınır
+                            if NUMPY_AVAILABLE:
+                                points = np.asarray(points, dtype=np.float64)
+                            uzunluk = self._cizgi_uzunlugu(points)
                             
                             # Birime göre metreye çevir
-                            if self.birim == "cm":
-                                uzunluk = uzunluk / 100.0
-                            elif self.birim == "mm":
-                                uzunluk = uzunluk / 1000.0
+                            uzunluk *= olcek
                             
                             mline_toplam += uzunluk
                             parca_sayisi += 1
-                            logger.debug(f"MLINE (alternatif yöntem): {uzunluk:.4f}m")
+                            logger.debug("MLINE (alternatif yöntem): %.4fm", uzunluk)
                 except Exception as e2:
                     logger.warning(f"MLINE alternatif okuma hatası: {e2}")
                 continue
@@ -721,24 +1176,379 @@ class DXFAnaliz:
             "detay": detay_bilgi
         }
     
-    def _shoelace_formulu(self, points: List[Tuple[float, float]]) -> float:
+    # Bu köşe sayısının altında NumPy dizisi kurma maliyeti döngüden pahalı
+    _SHOELACE_NUMPY_ESIGI = 8
+    
+    def _shoelace_formulu(self, points) -> float:
         """
         Koordinatları bilinen çokgenin alanını hesaplayan matematiksel formül.
         
         Args:
-            points: (x, y) koordinat çiftleri listesi
+            points: (x, y) koordinat çiftleri listesi veya (n, 2) boyutlu dizi
             
         Returns:
             float: Hesaplanan alan (çizim birimi cinsinden)
         """
         n = len(points)
-        area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += points[i][0] * points[j][1]
-            area -= points[j][0] * points[i][1]
+        if NUMPY_AVAILABLE and n >= self._SHOELACE_NUMPY_ESIGI:
+            arr = np.asarray(points, dtype=np.float64)
+            x = np.ascontiguousarray(arr[:, 0])
+            y = np.ascontiguousarray(arr[:, 1])
+            if NUMBA_AVAILABLE:
+                return float(_shoelace_nb(x, y))
+            # Birim adımlı sütunlarda iki BLAS ddot; np.roll kopyası yerine kaydırılmış
+            # dilimler (görünüm) ve kapanış kenarı ayrıca eklenir
+            s = np.dot(x[:-1], y[1:]) - np.dot(y[:-1], x[1:]) + (x[-1] * y[0] - y[-1] * x[0])
+            return 0.5 * abs(float(s))
+        
+        # Koordinatlar iki ayrı double dizisine alınır (nokta başına tuple indeksleme yok)
+        xs = array('d', (p[0] for p in points))
+        ys = array('d', (p[1] for p in points))
+        if n == 0:
+            return 0.0
+        if n == 4 and ((xs[0] == xs[1] and ys[1] == ys[2] and xs[2] == xs[3] and ys[3] == ys[0]) or
+                       (ys[0] == ys[1] and xs[1] == xs[2] and ys[2] == ys[3] and xs[3] == xs[0])):
+            # Eksenlere paralel dikdörtgen: alan = en × boy
+            return abs((xs[2] - xs[0]) * (ys[2] - ys[0]))
+        # Yamuk biçimi: j bir önceki köşe; kapanış kenarı (son -> ilk) başlangıç değeridir,
+        # modülo ve kenar başına ikinci çarpma yok
+        area = (xs[-1] - xs[0]) * (ys[-1] + ys[0])
+        j = 0
+        for i in range(1, n):
+            area += (xs[j] - xs[i]) * (ys[j] + ys[i])
+            j = i
         return abs(area) / 2.0
     
+    @staticmethod
+    def _ic_ice_gruplari(kapali_bilgiler: List[Tuple[Any, float, Optional[Tuple[float, float]], Optional[float]]],
+                         tolerans: float) -> List[List[int]]:
+        """
+        Kapalı poligonları iç içe duvar gruplarına ayırır.
+        
+        Sırayla her kullanılmamış poligon bir grup açar; merkezi tolerans içinde
+        olan veya alanı %10'dan az farklı olan kullanılmamış poligonlar bu gruba
+        katılır. Merkez komşuları KD-ağacıyla (scipy yoksa NumPy mesafe
+        vektörüyle), alan adayları sıralı alan dizisinde ikili aramayla bulunur;
+        ikili çift döngüsü yapılmaz.
+        
+        Args:
+            kapali_bilgiler: (entity, uzunluk, merkez, alan) demetleri
+            tolerans: Aynı duvar sayılacak en büyük merkez mesafesi (çizim birimi)
+            
+        Returns:
+            List[List[int]]: kapali_bilgiler indekslerinden oluşan gruplar (artan sırada)
+        """
+        n = len(kapali_bilgiler)
+        if not NUMPY_AVAILABLE:
+            gruplar = []
+            kullanildi = set()
+            for i, (_, _, merkez1, alan1) in enumerate(kapali_bilgiler):
+                if i in kullanildi:
+                    continue
+                grup = [i]
+                kullanildi.add(i)
+                if merkez1:
+                    for j, (_, _, merkez2, alan2) in enumerate(kapali_bilgiler):
+                        if j in kullanildi or not merkez2:
+                            continue
+                        mesafe = math.hypot(merkez2[0] - merkez1[0], merkez2[1] - merkez1[1])
+                        if mesafe <= tolerans or (alan1 and alan2 and abs(alan1 - alan2) / max(alan1, alan2) < 0.1):
+                            grup.append(j)
+                            kullanildi.add(j)
+                gruplar.append(grup)
+            return gruplar
+        
+        # Yalnızca merkezi hesaplanabilmiş poligonlar başka gruplara katılabilir
+        gecerli = np.array([k for k, bilgi in enumerate(kapali_bilgiler) if bilgi[2]], dtype=np.int64)
+        yerel = {int(k): p for p, k in enumerate(gecerli)}
+        merkezler = np.array([kapali_bilgiler[k][2] for k in gecerli], dtype=np.float64).reshape(-1, 2)
+        alanlar = np.array([kapali_bilgiler[k][3] or 0.0 for k in gecerli], dtype=np.float64)
+        alan_sirasi = np.argsort(alanlar, kind='stable')
+        sirali_alanlar = alanlar[alan_sirasi]
+        komsular = cKDTree(merkezler).query_ball_point(merkezler, r=tolerans) if SCIPY_AVAILABLE and len(gecerli) else None
+        
+        gruplar = []
+        kullanildi = np.zeros(n, dtype=bool)
+        for i in range(n):
+            if kullanildi[i]:
+                continue
+            kullanildi[i] = True
+            p = yerel.get(i)
+            if p is None:
+                gruplar.append([i])
+                continue
+            
+            # Merkez mesafesi tolerans içinde olanlar
+            if komsular is not None:
+                adaylar = [gecerli[komsular[p]]]
+            else:
+                fark = merkezler - merkezler[p]
+                adaylar = [gecerli[np.hypot(fark[:, 0], fark[:, 1]) <= tolerans]]
+            
+            # Alan farkı %10'dan az olanlar: |a1 - a2| / max(a1, a2) < 0.1 ⇔ 0.9·a1 < a2 < a1 / 0.9
+            a1 = alanlar[p]
+            if a1:
+                alt = np.searchsorted(sirali_alanlar, 0.9 * a1 * (1 - 1e-9), 'left')
+                ust = np.searchsorted(sirali_alanlar, a1 / 0.9 * (1 + 1e-9), 'right')
+                aday = alan_sirasi[alt:ust]
+                a2 = alanlar[aday]
+                uygun = (a2 != 0) & (np.abs(a1 - a2) / np.maximum(a1, a2) < 0.1)
+                adaylar.append(gecerli[aday[uygun]])
+            
+            uyeler = np.unique(np.concatenate(adaylar))
+            uyeler = uyeler[~kullanildi[uyeler]]
+            kullanildi[uyeler] = True
+            gruplar.append([i] + uyeler.tolist())
+        return gruplar
+    
+    def _cizgi_uzunlugu(self, points, kapali: bool = False) -> float:
+        """
+        Ardışık noktalar arasındaki kenarların toplam uzunluğunu hesaplar.
+        
+        Args:
+            points: (x, y) koordinat çiftleri listesi veya (n, 2) boyutlu dizi
+            kapali: True ise son nokta -> ilk nokta kenarı da eklenir
+            
+        Returns:
+            float: Toplam uzunluk (çizim birimi cinsinden)
+        """
+        n = len(points)
+        if NUMPY_AVAILABLE and n >= self._SHOELACE_NUMPY_ESIGI:
+            arr = np.asarray(points, dtype=np.float64)
+            if NUMBA_AVAILABLE:
+                return float(_cizgi_uzunlugu_nb(np.ascontiguousarray(arr[:, 0]),
+                                                np.ascontiguousarray(arr[:, 1]), kapali))
+            if kapali:
+                arr = np.vstack((arr, arr[:1]))
+            farklar = np.diff(arr, axis=0)
+            return float(np.hypot(farklar[:, 0], farklar[:, 1]).sum())
+        
+        uzunluk = 0.0
+        for i in range(n - 1):
+            uzunluk += math.hypot(points[i + 1][0] - points[i][0], points[i + 1][1] - points[i][1])
+        if kapali and n > 1:
+            # Kapanış kenarı: son nokta -> ilk nokta
+            uzunluk += math.hypot(points[0][0] - points[-1][0], points[0][1] - points[-1][1])
+        return float(uzunluk)
+    
+    @staticmethod
+    def _nokta_ortalamasi(noktalar) -> Tuple[float, float]:
+        """
+        Noktaların (x, y) ortalamasını (ağırlık merkezi yaklaşımı) döndür.
+        
+        Args:
+            noktalar: Boş olmayan (x, y) listesi veya (n, 2) dizisi
+        """
+        if NUMPY_AVAILABLE:
+            x, y = np.asarray(noktalar, dtype=np.float64)[:, :2].mean(axis=0).tolist()
+            return (x, y)
+        return (sum(p[0] for p in noktalar) / len(noktalar),
+                sum(p[1] for p in noktalar) / len(noktalar))
+    
+    def _merkez_ve_alan(self, noktalar) -> Tuple[Tuple[float, float], float]:
+        """
+        Kapalı halkanın merkez noktasını ve alanını köşeler üzerinde tek geçişte hesaplar.
+        
+        Toplu NumPy yolu kullanılamadığında çağrılır; ortalama ve yamuk biçimindeki
+        shoelace toplamı aynı döngüde birikir, alan doğrudan m²'ye çevrilir.
+        
+        Args:
+            noktalar: Boş olmayan (x, y) listesi veya (n, 2) dizisi
+            
+        Returns:
+            Tuple: ((merkez_x, merkez_y), alan_m2)
+        """
+        n = len(noktalar)
+        onceki_x, onceki_y = noktalar[-1][0], noktalar[-1][1]
+        sx = sy = toplam = 0.0
+        for p in noktalar:
+            x, y = p[0], p[1]
+            sx += x
+            sy += y
+            toplam += (onceki_x - x) * (onceki_y + y)
+            onceki_x, onceki_y = x, y
+        return (sx / n, sy / n), 0.5 * abs(toplam) * self._alan_olcegi
+    
+    @staticmethod
+    def _lw_xy_dizisi(entity):
+        """
+        LWPOLYLINE köşelerinin (x, y) sütunlarını NumPy dizisi olarak döndür.
+        
+        ezdxf köşeleri (x, y, başlangıç genişliği, bitiş genişliği, bulge)
+        şeklinde düz bir dizide tutar; nokta başına tuple üretmek yerine bu
+        dizi (n, 2) boyutuna dilimlenir.
+        
+        Returns:
+            numpy.ndarray veya None (NumPy yoksa ya da lwpoints desteklenmiyorsa)
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        try:
+            return np.asarray(entity.lwpoints.values, dtype=np.float64).reshape(-1, 5)[:, :2]
+        except AttributeError:
+            return None
+    
+    def _lw_noktalari(self, entity):
+        """
+        LWPOLYLINE köşelerini (x, y) olarak okur.
+        
+        Önce ham lwpoints dizisinin (n, 2) görünümü, olmazsa entity.points("xy"),
+        o da olmazsa entity.vertices denenir. Tüm hesaplama yolları bu tek
+        okuma sırasını kullanır.
+        
+        Args:
+            entity: LWPOLYLINE varlığı
+            
+        Returns:
+            numpy.ndarray (n, 2), (x, y) listesi veya None (noktalar okunamazsa)
+        """
+        noktalar = self._lw_xy_dizisi(entity)
+        if noktalar is not None:
+            return noktalar
+        try:
+            with entity.points("xy") as pts:
+                if NUMPY_AVAILABLE:
+                    # Nokta sayısı bilindiğinden dizi tek seferde ayrılır; ara tuple listesi yok
+                    n = len(pts)
+                    return np.fromiter((c for p in pts for c in (p[0], p[1])),
+                                       dtype=np.float64, count=2 * n).reshape(n, 2)
+                return list(pts)
+        except (AttributeError, TypeError):
+            pass
+        try:
+            return [(v[0], v[1]) for v in entity.vertices]
+        except Exception as e:
+            logger.debug("LWPOLYLINE nokta okuma hatası (points ve vertices): %r", e)
+            return None
+    
+    def _vertex_uzunlugu(self, vertices) -> float:
+        """
+        POLYLINE köşe listesinin (dxf.location) toplam kenar uzunluğunu hesaplar.
+        
+        Büyük çizgilerde köşe sayısı bilindiği için (n, 2) dizisi np.fromiter(count=...)
+        ile tek seferde ayrılır; küçüklerde ara nokta listesi kurulmaz, yalnızca
+        önceki ve güncel konum tutularak kenarlar döngüde toplanır.
+        
+        Args:
+            vertices: dxf.location özniteliği olan köşe listesi (POLYLINE VERTEX varlıkları)
+            
+        Returns:
+            float: Toplam uzunluk (çizim birimi cinsinden)
+        """
+        n = len(vertices)
+        if NUMPY_AVAILABLE and n >= self._SHOELACE_NUMPY_ESIGI:
+            noktalar = np.fromiter(
+                (c for v in vertices for c in (v.dxf.location.x, v.dxf.location.y)),
+                dtype=np.float64, count=2 * n
+            ).reshape(n, 2)
+            return self._cizgi_uzunlugu(noktalar)
+        
+        uzunluk = 0.0
+        onceki = None
+        for v in vertices:
+            konum = v.dxf.location
+            if onceki is not None:
+                uzunluk += math.hypot(konum.x - onceki.x, konum.y - onceki.y)
+            onceki = konum
+        return uzunluk
+    
+    def _shoelace_toplu(self, poligonlar: List[List[Tuple[float, float]]]) -> List[float]:
+        """
+        Birden fazla çokgenin alanını tek vektörel geçişte hesaplar.
+        
+        Tüm köşeler önceden ayrılmış tek bir (M, 2) dizisine yazılır; her kenarın çapraz
+        çarpımı bir kerede hesaplanıp çokgen sınırlarına göre np.add.reduceat
+        ile toplanır.
+        
+        Args:
+            poligonlar: Her biri en az 3 noktalı (x, y) listeleri
+            
+        Returns:
+            List[float]: Çokgen alanları (çizim birimi cinsinden, poligonlar sırasıyla)
+        """
+        if not poligonlar:
+            return []
+        if not NUMPY_AVAILABLE or len(poligonlar) == 1:
+            return [self._shoelace_formulu(p) for p in poligonlar]
+        
+        all_xy, offs = self._koordinat_tamponu(poligonlar)
+        return self._tampon_alanlari(all_xy, offs).tolist()
+    
+    @staticmethod
+    def _koordinat_tamponu(poligonlar: List[List[Tuple[float, float]]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Çokgen köşelerini önceden ayrılmış tek bir (M, 2) dizisine yazar.
+        
+        Args:
+            poligonlar: (x, y) nokta listeleri veya (n, 2) dizileri
+            
+        Returns:
+            Tuple: (all_xy, offs) - k. çokgen all_xy[offs[k]:offs[k + 1]] dilimindedir
+        """
+        uzunluklar = np.fromiter((len(p) for p in poligonlar), dtype=np.int64, count=len(poligonlar))
+        offs = np.zeros(len(poligonlar) + 1, dtype=np.int64)
+        np.cumsum(uzunluklar, out=offs[1:])
+        # Tampon bir kez ayrılır, her çokgen kendi dilimine kopyalanır (concatenate ara kopyası yok)
+        all_xy = np.empty((offs[-1], 2), dtype=np.float64)
+        for k, p in enumerate(poligonlar):
+            all_xy[offs[k]:offs[k + 1]] = p
+        return all_xy, offs
+    
+    @staticmethod
+    def _tampon_alanlari(all_xy: "np.ndarray", offs: "np.ndarray") -> "np.ndarray":
+        """
+        Koordinat tamponundaki her çokgenin alanını shoelace formülüyle hesaplar.
+        
+        Args:
+            all_xy: (M, 2) köşe dizisi
+            offs: Çokgen sınırları (uzunluk: çokgen sayısı + 1)
+            
+        Returns:
+            np.ndarray: Çokgen alanları (çizim birimi cinsinden)
+        """
+        if NUMBA_AVAILABLE:
+            # Çokgenler birbirinden bağımsız: her iş parçacığı bir dilimi hesaplar
+            out = np.empty(len(offs) - 1, dtype=np.float64)
+            _shoelace_batch(all_xy, offs, out)
+            return out
+        
+        # Her köşenin bir sonraki köşesi; çokgenin son köşesi kendi ilk köşesine bağlanır
+        sonraki = np.arange(1, offs[-1] + 1)
+        sonraki[offs[1:] - 1] = offs[:-1]
+        x = all_xy[:, 0]
+        y = all_xy[:, 1]
+        capraz = (x - x[sonraki]) * (y + y[sonraki])
+        return 0.5 * np.abs(np.add.reduceat(capraz, offs[:-1]))
+    
+    @staticmethod
+    def _tampon_uzunluklari(all_xy: "np.ndarray", offs: "np.ndarray", kapali: "np.ndarray") -> "np.ndarray":
+        """
+        Koordinat tamponundaki her çoklu çizginin toplam kenar uzunluğunu hesaplar.
+        
+        Args:
+            all_xy: (M, 2) köşe dizisi
+            offs: Çizgi sınırları (uzunluk: çizgi sayısı + 1, her çizgi en az 2 nokta)
+            kapali: Çizgi başına bool dizisi; True ise son -> ilk kenar da eklenir
+            
+        Returns:
+            np.ndarray: Çizgi uzunlukları (çizim birimi cinsinden)
+        """
+        out = np.empty(len(offs) - 1, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            _cizgi_uzunluklari_batch(all_xy, offs, kapali, out)
+            return out
+        
+        # Ardışık köşe mesafeleri; bir çizginin sonundan sonrakinin başına geçen kenar sıfırlanır
+        kenarlar = np.zeros(offs[-1], dtype=np.float64)
+        farklar = np.diff(all_xy, axis=0)
+        kenarlar[:-1] = np.hypot(farklar[:, 0], farklar[:, 1])
+        kenarlar[offs[1:] - 1] = 0.0
+        np.add.reduceat(kenarlar, offs[:-1], out=out)
+        bas = all_xy[offs[:-1]]
+        son = all_xy[offs[1:] - 1]
+        out += np.where(kapali, np.hypot(bas[:, 0] - son[:, 0], bas[:, 1] - son[:, 1]), 0.0)
+        return out
+    
     def _birim_cevir(self, alan_degeri: float) -> float:
         """
         Çizim biriminden m²'ye dönüşüm yapar.
@@ -749,14 +1559,8 @@ class DXFAnaliz:
         Returns:
             float: m² cinsinden alan değeri
         """
-        if self.birim == "m":
-            return alan_degeri  # Zaten m²
-        # Eğer birim CM ise, çıkan devasa sayıyı 10.000'e bölüp m2 yaparız.
-        elif self.birim == "cm":
-            return alan_degeri / 10000.0  # cm² -> m² (100x100 = 10000)
-        elif self.birim == "mm":
-            return alan_degeri / 1000000.0  # mm² -> m² (1000x1000 = 1000000)
-        return alan_degeri
+        # cm² -> m²: 1e-4 (100x100), mm² -> m²: 1e-6 (1000x1000)
+        return alan_degeri * self._alan_olcegi
     
     def duvar_yuksekligi_tahmin_et(self, katman_adi: str, db_manager=None) -> Optional[Dict[str, Any]]:
         """
@@ -790,12 +1594,8 @@ class DXFAnaliz:
                 learning = db_manager.get_ai_learning(katman_adi)
                 if learning:
                     yukseklik = learning['duvar_yuksekligi']
-                    birim = learning.get('birim', 'm')
-                    # Birimi metreye çevir
-                    if birim == 'cm':
-                        yukseklik = yukseklik / 100.0
-                    elif birim == 'mm':
-                        yukseklik = yukseklik / 1000.0
+                    # Birimi metreye çevir (tanınmayan birim metre kabul edilir)
+                    yukseklik = yukseklik / _METRE_BASINA_BIRIM.get(learning.get('birim', 'm'), 1.0)
                     
                     result['yukseklik'] = yukseklik
                     result['kaynak'] = 'ogrenme_veritabani'
@@ -858,28 +1658,16 @@ class DXFAnaliz:
         
         katman_adi_upper = katman_adi.upper()
         
-        # Pattern 1: "280cm", "2.80m" gibi açık birim belirtilmiş
-        patterns = [
-            r'(\d+\.?\d*)\s*CM',  # 280cm, 2.80cm
-            r'(\d+\.?\d*)\s*M',   # 2.80m, 280m
-            r'(\d+\.?\d*)\s*MM',  # 2800mm
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, katman_adi_upper)
+        # Pattern 1: "280cm", "2.80m", "2800mm" gibi açık birim belirtilmiş
+        for kalip, bolen, _ in _YUKSEKLIK_KALIPLARI:
+            match = kalip.search(katman_adi_upper)
             if match:
-                deger = float(match.group(1))
                 # Birime göre metreye çevir
-                if 'CM' in pattern:
-                    return deger / 100.0  # cm -> m
-                elif 'MM' in pattern:
-                    return deger / 1000.0  # mm -> m
-                else:
-                    return deger  # zaten metre
+                return float(match.group(1)) / bolen
         
         # Pattern 2: Sadece sayı var, cm varsayılır (örn: "DIS_DUVAR_280")
         # 3-4 haneli sayılar cm olarak yorumlanır (100-9999cm = 1-99.99m)
-        number_match = re.search(r'(\d{3,4})', katman_adi_upper)
+        number_match = _UC_DORT_HANE_RE.search(katman_adi_upper)
         if number_match:
             deger = int(number_match.group(1))
             # 100-9999 arası ise cm olarak yorumla
@@ -903,18 +1691,13 @@ class DXFAnaliz:
         
         try:
             # Katman içindeki tüm text entity'leri al
-            text_query = f'TEXT[layer=="{katman_adi}"]'
-            text_entities = self.msp.query(text_query)
+            text_entities = self._katman_varliklari('TEXT', katman_adi)
             
             # MTEXT entity'leri de kontrol et
-            mtext_query = f'MTEXT[layer=="{katman_adi}"]'
-            mtext_entities = self.msp.query(mtext_query)
+            mtext_entities = self._katman_varliklari('MTEXT', katman_adi)
             
             all_texts = list(text_entities) + list(mtext_entities)
             
-            # Yükseklik ile ilgili anahtar kelimeler
-            keywords = ['yükseklik', 'yukseklik', 'yük', 'yuk', 'height', 'h=', 'h =']
-            
             for entity in all_texts:
                 try:
                     # Text içeriğini al
@@ -924,44 +1707,31 @@ class DXFAnaliz:
                         text_content = str(entity)
                     
                     text_upper = text_content.upper()
-                    logger.debug(f"Text entity okunuyor: '{text_content}' (katman: {katman_adi})")
+                    logger.debug("Text entity okunuyor: '%s' (katman: %s)", text_content, katman_adi)
                     
-                    # Anahtar kelime var mı kontrol et
-                    for keyword in keywords:
-                        if keyword.upper() in text_upper:
-                            # Sayıyı çıkar
-                            # Pattern: "yükseklik: 2.80m" veya "h=280cm"
-                            number_patterns = [
-                                r'(\d+\.?\d*)\s*CM',
-                                r'(\d+\.?\d*)\s*M',
-                                r'(\d+\.?\d*)\s*MM',
-                                r'(\d+\.?\d*)',  # Sadece sayı
-                            ]
-                            
-                            for pattern in number_patterns:
-                                match = re.search(pattern, text_upper)
-                                if match:
-                                    deger = float(match.group(1))
-                                    # Birime göre metreye çevir
-                                    if 'CM' in pattern:
-                                        result = deger / 100.0
-                                        logger.info(f"✅ Text'ten yükseklik bulundu: {deger}cm = {result}m")
-                                        return result
-                                    elif 'MM' in pattern:
-                                        result = deger / 1000.0
-                                        logger.info(f"✅ Text'ten yükseklik bulundu: {deger}mm = {result}m")
-                                        return result
-                                    elif 'M' in pattern:
-                                        logger.info(f"✅ Text'ten yükseklik bulundu: {deger}m")
-                                        return deger
-                                    else:
-                                        # Sadece sayı varsa, 100-9999 arası ise cm varsay
-                                        if 100 <= deger <= 9999:
-                                            result = deger / 100.0
-                                            logger.info(f"✅ Text'ten yükseklik bulundu (cm varsayıldı): {deger} = {result}m")
-                                            return result
+                    # Anahtar kelime var mı kontrol et (tüm kelimeler tek taramada)
+                    if _YUKSEKLIK_ANAHTAR_RE.search(text_upper):
+                        # Sayıyı çıkar
+                        # Pattern: "yükseklik: 2.80m" veya "h=280cm"
+                        for kalip, bolen, birim in _YUKSEKLIK_KALIPLARI:
+                            match = kalip.search(text_upper)
+                            if match:
+                                deger = float(match.group(1))
+                                # Birime göre metreye çevir
+                                result = deger / bolen
+                                logger.info(f"✅ Text'ten yükseklik bulundu: {deger}{birim} = {result}m")
+                                return result
+                        
+                        # Sadece sayı varsa, 100-9999 arası ise cm varsay
+                        match = _SAYI_RE.search(text_upper)
+                        if match:
+                            deger = float(match.group(1))
+                            if 100 <= deger <= 9999:
+                                result = deger / 100.0
+                                logger.info(f"✅ Text'ten yükseklik bulundu (cm varsayıldı): {deger} = {result}m")
+                                return result
                 except Exception as e:
-                    logger.debug(f"Text entity işleme hatası: {e}")
+                    logger.debug("Text entity işleme hatası: %s", e)
                     continue
             
             return None
@@ -987,48 +1757,32 @@ class DXFAnaliz:
         try:
             # Tüm katmanlardaki text entity'leri kontrol et (duvar katmanına yakın olabilir)
             # Önce aynı katmandaki text'leri kontrol et
-            text_query = f'TEXT[layer=="{katman_adi}"]'
-            text_entities = list(self.msp.query(text_query))
+            text_entities = self._katman_varliklari('TEXT', katman_adi)
             
             # MTEXT entity'leri de kontrol et
-            mtext_query = f'MTEXT[layer=="{katman_adi}"]'
-            mtext_entities = list(self.msp.query(mtext_query))
-            
-            # Ayrıca tüm text entity'leri kontrol et (duvar katmanına yakın olabilir)
-            all_text_query = 'TEXT'
-            all_mtext_query = 'MTEXT'
-            all_texts = list(self.msp.query(all_text_query)) + list(self.msp.query(all_mtext_query))
+            mtext_entities = self._katman_varliklari('MTEXT', katman_adi)
             
             # Duvar katmanındaki çizgilerin konumunu al (yakın text'leri bulmak için)
-            duvar_entities = list(self.msp.query(f'LWPOLYLINE[layer=="{katman_adi}"]'))
-            duvar_entities += list(self.msp.query(f'LINE[layer=="{katman_adi}"]'))
-            duvar_entities += list(self.msp.query(f'MLINE[layer=="{katman_adi}"]'))
+            duvar_entities = [e for grup in self._katman_tipleri(katman_adi, ('LWPOLYLINE', 'LINE', 'MLINE')).values()
+                              for e in grup]
             
-            # Duvar çizgilerinin orta noktalarını hesapla
-            duvar_orta_noktalari = []
+            # Duvar çizgilerinin noktalarını topla
+            duvar_noktalari = []
             for entity in duvar_entities:
                 try:
-                    if hasattr(entity, 'points'):
-                        with entity.points("xy") as pts:
-                            noktalar = list(pts)
-                    elif hasattr(entity, 'vertices'):
-                        noktalar = [(v[0], v[1]) for v in entity.vertices]
-                    else:
-                        continue
-                    
-                    if len(noktalar) > 0:
-                        # Orta noktayı hesapla
-                        orta_x = sum(p[0] for p in noktalar) / len(noktalar)
-                        orta_y = sum(p[1] for p in noktalar) / len(noktalar)
-                        duvar_orta_noktalari.append((orta_x, orta_y))
+                    noktalar = self._lw_noktalari(entity)
+                    if noktalar is not None and len(noktalar) > 0:
+                        duvar_noktalari.append(noktalar)
                 except:
                     continue
             
-            # Kalınlık ile ilgili anahtar kelimeler
-            kalinlik_keywords = ['kalınlık', 'kalinlik', 'kalın', 'kalin', 'thickness', 't=', 't =', 'cm', 'mm']
-            # Duvar cinsi ile ilgili anahtar kelimeler
-            cins_keywords = ['tuğla', 'tugla', 'beton', 'gazbeton', 'bims', 'ahşap', 'ahsap', 'çelik', 'celik', 
-                           'brick', 'concrete', 'aerated', 'wood', 'steel']
+            # Orta noktalar: tüm duvarlar tek (M, 2) tampona yazılır, ortalamalar tek
+            # reduceat indirgemesiyle (W, 2) dizisi olarak bulunur
+            if NUMPY_AVAILABLE and duvar_noktalari:
+                all_xy, offs = self._koordinat_tamponu(duvar_noktalari)
+                duvar_orta_noktalari = np.add.reduceat(all_xy, offs[:-1], axis=0) / np.diff(offs)[:, None]
+            else:
+                duvar_orta_noktalari = [self._nokta_ortalamasi(noktalar) for noktalar in duvar_noktalari]
             
             # Önce aynı katmandaki text'leri kontrol et
             for entity in text_entities + mtext_entities:
@@ -1039,48 +1793,60 @@ class DXFAnaliz:
                         text_content = str(entity)
                     
                     text_upper = text_content.upper()
-                    logger.debug(f"Text entity okunuyor (kalınlık/cins): '{text_content}' (katman: {katman_adi})")
+                    logger.debug("Text entity okunuyor (kalınlık/cins): '%s' (katman: %s)", text_content, katman_adi)
                     
                     # Kalınlık kontrolü
-                    if not result.get('kalinlik'):
-                        for keyword in kalinlik_keywords:
-                            if keyword.upper() in text_upper:
-                                # Sayıyı çıkar (cm veya mm olabilir)
-                                number_patterns = [
-                                    r'(\d+\.?\d*)\s*CM',
-                                    r'(\d+\.?\d*)\s*MM',
-                                    r'(\d+\.?\d*)',  # Sadece sayı
-                                ]
-                                
-                                for pattern in number_patterns:
-                                    match = re.search(pattern, text_upper)
-                                    if match:
-                                        deger = float(match.group(1))
-                                        # MM ise cm'ye çevir
-                                        if 'MM' in pattern:
-                                            deger = deger / 10.0  # mm -> cm
-                                        result['kalinlik'] = deger
-                                        logger.info(f"✅ Text'ten kalınlık bulundu: {deger}cm")
-                                        break
+                    if not result.get('kalinlik') and _KALINLIK_ANAHTAR_RE.search(text_upper):
+                        # Sayıyı çıkar (cm veya mm olabilir; mm ise cm'ye çevrilir)
+                        for kalip, bolen in _KALINLIK_KALIPLARI:
+                            match = kalip.search(text_upper)
+                            if match:
+                                deger = float(match.group(1)) / bolen
+                                result['kalinlik'] = deger
+                                logger.info(f"✅ Text'ten kalınlık bulundu: {deger}cm")
+                                break
                     
                     # Duvar cinsi kontrolü
-                    if not result.get('cins'):
-                        for keyword in cins_keywords:
-                            if keyword.upper() in text_upper:
-                                # Cins bilgisini çıkar
-                                for cins_option in ['tuğla', 'tugla', 'beton', 'gazbeton', 'bims', 'ahşap', 'ahsap', 'çelik', 'celik']:
-                                    if cins_option.upper() in text_upper:
-                                        result['cins'] = cins_option.title()
-                                        logger.info(f"✅ Text'ten duvar cinsi bulundu: {result['cins']}")
-                                        break
+                    if not result.get('cins') and _CINS_ANAHTAR_RE.search(text_upper):
+                        # Cins bilgisini çıkar (öncelik sırasındaki ilk eşleşen cins)
+                        for cins_buyuk, cins_adi in _DUVAR_CINSLERI:
+                            if cins_buyuk in text_upper:
+                                result['cins'] = cins_adi
+                                logger.info(f"✅ Text'ten duvar cinsi bulundu: {result['cins']}")
+                                break
                 except Exception as e:
-                    logger.debug(f"Text entity işleme hatası: {e}")
+                    logger.debug("Text entity işleme hatası: %s", e)
                     continue
             
             # Eğer bulunamadıysa, yakın text'leri kontrol et
             if not result.get('kalinlik') or not result.get('cins'):
-                for entity in all_texts:
+                # Birime göre tolerans (50m, 5000cm, 50000mm)
+                tolerans = 50.0 * self._birim_katsayisi
+                # Tüm katmanlardaki text'ler (duvar katmanına yakın olabilir); tip dizininden,
+                # yalnızca aynı katmanda bilgi eksik kaldığında alınır
+                all_texts = self._tip_varliklari('TEXT') + self._tip_varliklari('MTEXT')
+                
+                # Yakınlık tüm text'ler için tek KD-ağacı sorgusuyla belirlenir (text × duvar döngüsü yok)
+                yakin_maskesi = None
+                if SCIPY_AVAILABLE and len(duvar_orta_noktalari) and all_texts:
+                    konumlar = np.full((len(all_texts), 2), np.nan)
+                    for i, entity in enumerate(all_texts):
+                        try:
+                            konumlar[i] = (entity.dxf.insert.x, entity.dxf.insert.y)
+                        except AttributeError:
+                            continue  # Konumu olmayan text elenmez
+                    konumlu = ~np.isnan(konumlar[:, 0])
+                    yakin_maskesi = ~konumlu
+                    if konumlu.any():
+                        agac = cKDTree(duvar_orta_noktalari)
+                        yakin_maskesi[konumlu] = agac.query_ball_point(
+                            konumlar[konumlu], r=tolerans, return_length=True) > 0
+                
+                for text_idx, entity in enumerate(all_texts):
                     try:
+                        if yakin_maskesi is not None and not yakin_maskesi[text_idx]:
+                            continue
+                        
                         # Text'in konumunu al
                         if hasattr(entity, 'dxf'):
                             text_pos = (entity.dxf.insert.x, entity.dxf.insert.y) if hasattr(entity.dxf, 'insert') else None
@@ -1089,13 +1855,11 @@ class DXFAnaliz:
                             text_pos = None
                             text_content = str(entity)
                         
-                        # Duvar çizgilerine yakın mı kontrol et (50 birim içinde)
-                        if text_pos and duvar_orta_noktalari:
+                        # Duvar çizgilerine yakın mı kontrol et (50 birim içinde; SciPy yoksa)
+                        if yakin_maskesi is None and text_pos and len(duvar_orta_noktalari):
                             yakın_mı = False
                             for duvar_orta in duvar_orta_noktalari:
                                 mesafe = math.hypot(text_pos[0] - duvar_orta[0], text_pos[1] - duvar_orta[1])
-                                # Birime göre tolerans (50m, 5000cm, 50000mm)
-                                tolerans = 50.0 if self.birim == 'm' else (5000.0 if self.birim == 'cm' else 50000.0)
                                 if mesafe <= tolerans:
                                     yakın_mı = True
                                     break
@@ -1106,36 +1870,25 @@ class DXFAnaliz:
                         text_upper = text_content.upper()
                         
                         # Kalınlık kontrolü
-                        if not result.get('kalinlik'):
-                            for keyword in kalinlik_keywords:
-                                if keyword.upper() in text_upper:
-                                    number_patterns = [
-                                        r'(\d+\.?\d*)\s*CM',
-                                        r'(\d+\.?\d*)\s*MM',
-                                        r'(\d+\.?\d*)',
-                                    ]
-                                    
-                                    for pattern in number_patterns:
-                                        match = re.search(pattern, text_upper)
-                                        if match:
-                                            deger = float(match.group(1))
-                                            if 'MM' in pattern:
-                                                deger = deger / 10.0
-                                            result['kalinlik'] = deger
-                                            logger.info(f"✅ Yakın text'ten kalınlık bulundu: {deger}cm")
-                                            break
+                        if not result.get('kalinlik') and _KALINLIK_ANAHTAR_RE.search(text_upper):
+                            for kalip, bolen in _KALINLIK_KALIPLARI:
+                                match = kalip.search(text_upper)
+                                if match:
+                                    deger = float(match.group(1)) / bolen
+                                    result['kalinlik'] = deger
+                                    logger.info(f"✅ Yakın text'ten kalınlık bulundu: {deger}cm")
+                                    break
                         
                         # Duvar cinsi kontrolü
-                        if not result.get('cins'):
-                            for keyword in cins_keywords:
-                                if keyword.upper() in text_upper:
-                                    for cins_option in ['tuğla', 'tugla', 'beton', 'gazbeton', 'bims', 'ahşap', 'ahsap', 'çelik', 'celik']:
-                                        if cins_option.upper() in text_upper:
-                                            result['cins'] = cins_option.title()
-                                            logger.info(f"✅ Yakın text'ten duvar cinsi bulundu: {result['cins']}")
-                                            break
+                        if not result.get('cins') and _CINS_ANAHTAR_RE.search(text_upper):
+                            # Cins bilgisini çıkar (öncelik sırasındaki ilk eşleşen cins)
+                            for cins_buyuk, cins_adi in _DUVAR_CINSLERI:
+                                if cins_buyuk in text_upper:
+                                    result['cins'] = cins_adi
+                                    logger.info(f"✅ Yakın text'ten duvar cinsi bulundu: {result['cins']}")
+                                    break
                     except Exception as e:
-                        logger.debug(f"Yakın text entity işleme hatası: {e}")
+                        logger.debug("Yakın text entity işleme hatası: %s", e)
                         continue
             
             return result
@@ -1151,6 +1904,7 @@ if __name__ == "__main__":
     
     # Dosya varsa testi başlat (Hata almamak için try-except bloğu dışına aldım örnekte)
     # motor = DXFAnaliz(test_dosyasi)
+    # veya önceden yüklenmiş doküman ile: DXFAnaliz(doc=DXFEngine().load_dxf(test_dosyasi))
     
     # 1. Mevcut katmanları gör
     # print("Katmanlar:", motor.katmanlari_listele())
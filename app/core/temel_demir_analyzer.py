@@ -13,6 +13,13 @@ from app.core.demir_engine import DemirEngine
 
 logger = logging.getLogger(__name__)
 
+# Text tarama desenleri (her metin için tekrar kullanılır; bir kez derlenir)
+_KESIT_RE = re.compile(r'([A-Z])-([A-Z])\s*KESİTİ')
+_POZ_RE = re.compile(r'P[OZ]+\s*(\d+)')
+_KOLON_FILIZ_RE = re.compile(r'(S\d+)\s*\|?\s*P\d+[-]?(\d+)[Ø@](\d+)\s*\|?\s*(\d+)')
+_KOLON_ETRIYE_RE = re.compile(r'(S\d+)\s*\|?\s*(\d+)\s*\|?\s*(\d+)[Ø@](\d+).*?l=(\d+)')
+_HATIL_RE = re.compile(r'(BK\d+)\s*\|?\s*(\d+)\s*\|?\s*(\d+)[Ø@](\d+).*?l=(\d+)')
+
 
 class TemelDemirAnalyzer:
     """DXF'nin temel paftasından demir hesaplamalarını yapan sınıf"""
@@ -28,6 +35,8 @@ class TemelDemirAnalyzer:
         self.dxf_analiz = None
         self.demir_engine = DemirEngine()
         self.temel_tipi = None
+        # Katman -> text listesi; modelspace yükleme başına bir kez taranır
+        self._textler: Optional[Dict[str, List[str]]] = None
         
         self.yukle()
     
@@ -35,13 +44,22 @@ class TemelDemirAnalyzer:
         """DXF dosyasını analiz için yükle"""
         try:
             self.dxf_analiz = DXFAnaliz(self.dxf_yolu, cizim_birimi="cm")
+            self._textler = None
             logger.info(f"DXF dosyası yüklendi: {self.dxf_yolu}")
         except Exception as e:
             logger.error(f"DXF yükleme hatası: {e}")
             raise
     
     def tum_textleri_getir(self) -> Dict[str, List[str]]:
-        """DXF'deki tüm text nesnelerini katman bazında topla"""
+        """
+        DXF'deki tüm text nesnelerini katman bazında topla
+        
+        Sonuç ilk çağrıda bir kez hesaplanır; demir çıkarma adımlarının
+        her biri modelspace'i yeniden taramaz. Dönen sözlük değiştirilmemelidir.
+        """
+        if self._textler is not None:
+            return self._textler
+        
         textler = {}
         
         try:
@@ -62,7 +80,9 @@ class TemelDemirAnalyzer:
         
         except Exception as e:
             logger.warning(f"Text çıkarma hatası: {e}")
+            return textler
         
+        self._textler = textler
         return textler
     
     def temel_tipi_belirle(self) -> Optional[str]:
@@ -93,12 +113,10 @@ class TemelDemirAnalyzer:
         textler = self.tum_textleri_getir()
         
         # Kesitleri ara (A-A KESİTİ, B-B KESİTİ, vb.)
-        kesit_pattern = r'([A-Z])-([A-Z])\s*KESİTİ'
-        
         for katman, metinler in textler.items():
             for metin in metinler:
                 # Kesit başlığını ara
-                kesit_match = re.search(kesit_pattern, metin.upper())
+                kesit_match = _KESIT_RE.search(metin.upper())
                 if kesit_match:
                     kesit_adi = f"{kesit_match.group(1)}-{kesit_match.group(2)}"
                     
@@ -126,7 +144,7 @@ class TemelDemirAnalyzer:
         for katman, metinler in textler.items():
             for metin in metinler:
                 # POZ patternu: "POZ 7", "PZ7", vb.
-                poz_match = re.search(r'P[OZ]+\s*(\d+)', metin)
+                poz_match = _POZ_RE.search(metin)
                 if poz_match:
                     poz_no = poz_match.group(1)
                     
@@ -153,9 +171,7 @@ class TemelDemirAnalyzer:
         if "kolon" in tum_text.lower() and "filiz" in tum_text.lower():
             # Basit pattern: "S001 ... P36-12Ø16 ... 275"
             # Tüm kolon numerik pattern'lerini ara
-            kolon_pattern = r'(S\d+)\s*\|?\s*P\d+[-]?(\d+)[Ø@](\d+)\s*\|?\s*(\d+)'
-            
-            matches = re.finditer(kolon_pattern, tum_text)
+            matches = _KOLON_FILIZ_RE.finditer(tum_text)
             for match in matches:
                 kolon_adi = match.group(1)
                 adet = int(match.group(2))
@@ -181,9 +197,7 @@ class TemelDemirAnalyzer:
         # Etriye tablosu kontrolü
         if "etriye" in tum_text.lower() and "donati" in tum_text.lower():
             # Pattern: "S001 ... 32 ... 5Ø8 ... 196"
-            etriye_pattern = r'(S\d+)\s*\|?\s*(\d+)\s*\|?\s*(\d+)[Ø@](\d+).*?l=(\d+)'
-            
-            matches = re.finditer(etriye_pattern, tum_text)
+            matches = _KOLON_ETRIYE_RE.finditer(tum_text)
             for match in matches:
                 kolon_adi = match.group(1)
                 poz_no = match.group(2)
@@ -211,9 +225,7 @@ class TemelDemirAnalyzer:
         # Hatıl tablosu kontrolü
         if "hatil" in tum_text.lower() and "donati" in tum_text.lower():
             # Pattern: "BK1 ... 20 ... 12Ø10 ... l=4000"
-            hatil_pattern = r'(BK\d+)\s*\|?\s*(\d+)\s*\|?\s*(\d+)[Ø@](\d+).*?l=(\d+)'
-            
-            matches = re.finditer(hatil_pattern, tum_text)
+            matches = _HATIL_RE.finditer(tum_text)
             for match in matches:
                 hatil_adi = match.group(1)
                 poz_no = match.group(2)
@@ -237,20 +249,16 @@ class TemelDemirAnalyzer:
             # Temel tipi belirle
             self.temel_tipi_belirle()
             
-            # 1. Kesit demirlerini çıkar ve hesapla
+            # Tüm demir kayıtları toplanır, hesaplar tek toplu çağrıda yapılır
+            kayitlar = []
+            
+            # 1. Kesit demirlerini çıkar
             kesit_demirler = self.temel_kesit_demirlerini_cikart()
             for kesit_adi, demirler in kesit_demirler.items():
                 for adet, cap, uzunluk in demirler:
-                    self.demir_engine.demir_ekle(
-                        poz_no=f"KESİT-{kesit_adi}",
-                        eleman_tipi="temel_kesit",
-                        eleman_adi=kesit_adi,
-                        adet=adet,
-                        demir_capi=cap,
-                        uzunluk=uzunluk
-                    )
+                    kayitlar.append((f"KESİT-{kesit_adi}", "temel_kesit", kesit_adi, adet, cap, uzunluk))
             
-            # 2. İlave demirlerini çıkar ve hesapla
+            # 2. İlave demirlerini çıkar
             ilave_demirler = self.temel_ilave_demirlerini_cikart()
             for poz_no, adet, cap, uzunluk in ilave_demirler:
                 # POZ 7, 8, 9... gibi numaraları belirle
@@ -261,52 +269,26 @@ class TemelDemirAnalyzer:
                     eleman_tipi = "temel_ilave"
                     adi = "İlave"
                 
-                self.demir_engine.demir_ekle(
-                    poz_no=poz_no,
-                    eleman_tipi=eleman_tipi,
-                    eleman_adi=adi,
-                    adet=adet,
-                    demir_capi=cap,
-                    uzunluk=uzunluk
-                )
+                kayitlar.append((poz_no, eleman_tipi, adi, adet, cap, uzunluk))
             
             # 3. Kolon filizlerini çıkar
             filizler = self.kolon_filizi_tablosunu_oku()
             for kolon_adi, (adet, cap, uzunluk) in filizler.items():
-                self.demir_engine.demir_ekle(
-                    poz_no=f"FILIZ-{kolon_adi}",
-                    eleman_tipi="kolon_filizi",
-                    eleman_adi=kolon_adi,
-                    adet=adet,
-                    demir_capi=cap,
-                    uzunluk=uzunluk
-                )
+                kayitlar.append((f"FILIZ-{kolon_adi}", "kolon_filizi", kolon_adi, adet, cap, uzunluk))
             
             # 4. Kolon etriyelerini çıkar
             etriyeler = self.kolon_etriye_tablosunu_oku()
             for kolon_adi, etriye_listesi in etriyeler.items():
                 for poz_no, adet, cap, uzunluk in etriye_listesi:
-                    self.demir_engine.demir_ekle(
-                        poz_no=poz_no,
-                        eleman_tipi="kolon_etriye",
-                        eleman_adi=kolon_adi,
-                        adet=adet,
-                        demir_capi=cap,
-                        uzunluk=uzunluk
-                    )
+                    kayitlar.append((poz_no, "kolon_etriye", kolon_adi, adet, cap, uzunluk))
             
             # 5. Hatıl donatısını çıkar (varsa)
             hatillar = self.hatil_donati_tablosunu_oku()
             for hatil_adi, hatil_listesi in hatillar.items():
                 for poz_no, adet, cap, uzunluk in hatil_listesi:
-                    self.demir_engine.demir_ekle(
-                        poz_no=poz_no,
-                        eleman_tipi="hatil",
-                        eleman_adi=hatil_adi,
-                        adet=adet,
-                        demir_capi=cap,
-                        uzunluk=uzunluk
-                    )
+                    kayitlar.append((poz_no, "hatil", hatil_adi, adet, cap, uzunluk))
+            
+            self.demir_engine.demir_ekle_toplu(kayitlar)
             
             # Özetleri hazırla
             sonuc['tip_ozet'] = self.demir_engine.ozet_by_type()
@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QTextEdit, QDialog, QMenu, QCheckBox, QScrollArea,
     QInputDialog, QListWidget, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot, QTimer
 from PyQt6.QtGui import QIcon, QFont, QColor
 
 from app.core.database import DatabaseManager
@@ -168,6 +168,17 @@ class MainWindow(QMainWindow):
         # İlk açılışta pozları kontrol et ve yükle (async - arka planda)
         self.check_and_load_pozlar_async()
         
+        # WAL dosyasını periyodik olarak ana veritabanına aktar (5 dakikada bir)
+        self._checkpoint_timer = QTimer(self)
+        self._checkpoint_timer.timeout.connect(self._wal_checkpoint)
+        self._checkpoint_timer.start(5 * 60 * 1000)
+        
+        # Uygulama kapanırken kalıcı veritabanı bağlantılarını kapat
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.db.close)
+        
         if self.splash:
             self.splash.showMessage(
                 "Hazırlanıyor...",
@@ -177,6 +188,13 @@ class MainWindow(QMainWindow):
             from PyQt6.QtWidgets import QApplication
             QApplication.processEvents()
     
+    def _wal_checkpoint(self) -> None:
+        """Zamanlayıcı ile WAL checkpoint çalıştır"""
+        try:
+            self.db.checkpoint()
+        except sqlite3.Error as e:
+            logger.debug(f"WAL checkpoint atlandı: {e}")
+    
     @property
     def material_calculator(self) -> MaterialCalculator:
         """MaterialCalculator'ı lazy loading ile yükle"""
@@ -1401,6 +1419,7 @@ class MainWindow(QMainWindow):
                         UPDATE pozlar SET resmi_fiyat = ?
                         WHERE poz_no = ?
                     """, (yeni_fiyat, poz_no))
+                self.db.invalidate_cache()
                 
                 QMessageBox.information(self, "Başarılı", f"Poz {poz_no} için birim fiyat {yeni_fiyat:,.2f} ₺ olarak güncellendi")
                 self.load_birim_fiyatlar()
@@ -2397,9 +2416,11 @@ class MainWindow(QMainWindow):
         self._dxf_dialog_katmanlar = katmanlar
         self._dxf_dialog_dxf_analiz = dxf_analiz
         
+        # Önce tüm katmanların uzunluklarını hesapla (önizleme için, katmanlar paralel)
+        uzunluk_sonuclari = dxf_analiz.uzunluk_hesapla_batch(katmanlar)
+        
         for row, katman in enumerate(katmanlar):
-            # Önce uzunluk hesapla (önizleme için)
-            uzunluk_sonuc = dxf_analiz.uzunluk_hesapla(katman)
+            uzunluk_sonuc = uzunluk_sonuclari[katman]
             uzunluk_m = uzunluk_sonuc['toplam_miktar']
             parca_sayisi = uzunluk_sonuc.get('parca_sayisi', 0)
             detay = uzunluk_sonuc.get('detay', [])
@@ -2781,36 +2802,40 @@ class MainWindow(QMainWindow):
             aciklik_detaylari = []
             
             if aciklik_katmanlari:
+                pencere_katmanlari = aciklik_katmanlari.get('pencere', [])
+                kapi_katmanlari = aciklik_katmanlari.get('kapi', [])
+                # Katmanlar birbirinden bağımsız: tüm açıklık alanları birlikte (paralel) hesaplanır,
+                # hem pencere hem kapı listesindeki katman bir kez hesaplanır
+                aciklik_alanlari = dxf_analiz.aciklik_alanlari_hesapla(
+                    list(dict.fromkeys(pencere_katmanlari + kapi_katmanlari)))
+                
                 # Pencere alanları
-                for pencere_katman in aciklik_katmanlari.get('pencere', []):
-                    try:
-                        pencere_alani = dxf_analiz.aciklik_alani_hesapla(pencere_katman)
-                        if pencere_alani > 0:
-                            toplam_aciklik_alani += pencere_alani
-                            aciklik_detaylari.append(f"Pencere ({pencere_katman}): {pencere_alani:.2f} m²")
-                            logger.info(f"🚪 Pencere alanı: {pencere_katman} = {pencere_alani:.2f} m²")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Pencere alanı hesaplanamadı ({pencere_katman}): {e}")
+                for pencere_katman in pencere_katmanlari:
+                    pencere_alani = aciklik_alanlari.get(pencere_katman, 0.0)
+                    if pencere_alani > 0:
+                        toplam_aciklik_alani += pencere_alani
+                        aciklik_detaylari.append(f"Pencere ({pencere_katman}): {pencere_alani:.2f} m²")
+                        logger.info(f"🚪 Pencere alanı: {pencere_katman} = {pencere_alani:.2f} m²")
                 
                 # Kapı alanları
-                for kapi_katman in aciklik_katmanlari.get('kapi', []):
-                    try:
-                        kapi_alani = dxf_analiz.aciklik_alani_hesapla(kapi_katman)
-                        if kapi_alani > 0:
-                            toplam_aciklik_alani += kapi_alani
-                            aciklik_detaylari.append(f"Kapı ({kapi_katman}): {kapi_alani:.2f} m²")
-                            logger.info(f"🚪 Kapı alanı: {kapi_katman} = {kapi_alani:.2f} m²")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Kapı alanı hesaplanamadı ({kapi_katman}): {e}")
+                for kapi_katman in kapi_katmanlari:
+                    kapi_alani = aciklik_alanlari.get(kapi_katman, 0.0)
+                    if kapi_alani > 0:
+                        toplam_aciklik_alani += kapi_alani
+                        aciklik_detaylari.append(f"Kapı ({kapi_katman}): {kapi_alani:.2f} m²")
+                        logger.info(f"🚪 Kapı alanı: {kapi_katman} = {kapi_alani:.2f} m²")
             
             logger.info(f"📊 Toplam açıklık alanı: {toplam_aciklik_alani:.2f} m²")
             
+            # Önce uzunlukları hesapla (duvarlar genelde LINE entity'leriyle çizilir);
+            # katmanlar paralel hesaplanır, sonuçlar özet mesajında da kullanılır
+            uzunluk_sonuclari = dxf_analiz.uzunluk_hesapla_batch(list(yukseklikler))
+            
             for katman, tahmin in yukseklikler.items():
                 yukseklik = tahmin['yukseklik']
                 brut_duvar_alani_m2 = 0.0
                 
-                # Önce uzunluk hesapla (duvarlar genelde LINE entity'leriyle çizilir)
-                uzunluk_sonuc = dxf_analiz.uzunluk_hesapla(katman)
+                uzunluk_sonuc = uzunluk_sonuclari[katman]
                 uzunluk_m = uzunluk_sonuc['toplam_miktar']
                 parca_sayisi = uzunluk_sonuc.get('parca_sayisi', 0)
                 detay = uzunluk_sonuc.get('detay', [])
@@ -2915,9 +2940,9 @@ class MainWindow(QMainWindow):
             if eklenen_sayisi > 0:
                 # Toplam hesaplanan alanı göster
                 toplam_hesaplanan = sum([
-                    dxf_analiz.uzunluk_hesapla(k).get('toplam_miktar', 0) * yukseklikler[k]['yukseklik']
+                    uzunluk_sonuclari[k].get('toplam_miktar', 0) * yukseklikler[k]['yukseklik']
                     for k in yukseklikler.keys()
-                    if dxf_analiz.uzunluk_hesapla(k).get('toplam_miktar', 0) > 0
+                    if uzunluk_sonuclari[k].get('toplam_miktar', 0) > 0
                 ])
                 
                 mesaj = f"✅ {eklenen_sayisi} duvar metraj kalemi eklendi.\n\n"
@@ -4491,6 +4516,8 @@ class MainWindow(QMainWindow):
             error_count = 0
             errors = []
             skipped_empty = 0
+            fiyat_satirlari = []  # Birim fiyatlar döngü sonunda tek seferde eklenir
+            fiyat_satir_nolari = []  # fiyat_satirlari ile aynı sırada Excel satır numaraları
             
             for idx, (index, row) in enumerate(df.iterrows()):
                 try:
@@ -4612,13 +4639,13 @@ class MainWindow(QMainWindow):
                     
                     # Birim fiyat ekle (eğer birim fiyat > 0 ise)
                     if birim_fiyat > 0:
-                        fiyat_id = self.db.add_birim_fiyat(
-                            poz_id=poz_id,
-                            poz_no=poz_no,
-                        birim_fiyat=birim_fiyat,
-                            kaynak='Excel Import'
-                    )
-                        print(f"DEBUG: Poz {poz_no} için birim fiyat eklendi: {birim_fiyat} (ID: {fiyat_id})")
+                        fiyat_satirlari.append({
+                            'poz_id': poz_id,
+                            'poz_no': poz_no,
+                            'birim_fiyat': birim_fiyat,
+                            'kaynak': 'Excel Import'
+                        })
+                        fiyat_satir_nolari.append(index + 2)
                     else:
                         print(f"DEBUG: Poz {poz_no} için birim fiyat 0, eklenmedi")
                     
@@ -4635,6 +4662,24 @@ class MainWindow(QMainWindow):
                         traceback.print_exc()
                     continue
             
+            # Toplanan birim fiyatları tek transaction'da ekle
+            if fiyat_satirlari:
+                try:
+                    self.db.add_birim_fiyatlar(fiyat_satirlari)
+                except Exception as e:
+                    # Toplu ekleme geri alındı: fiyatları satır satır tekrar dene,
+                    # eklenemeyen satırlar hatalı sayılır
+                    print(f"Toplu birim fiyat ekleme hatası, satır satır deneniyor: {e}")
+                    for satir_no, fiyat in zip(fiyat_satir_nolari, fiyat_satirlari):
+                        try:
+                            self.db.add_birim_fiyat(**fiyat)
+                        except Exception as e:
+                            success_count -= 1
+                            error_count += 1
+                            if len(errors) < 20:
+                                errors.append(f"Satır {satir_no}: Birim fiyat eklenemedi: {e}")
+                            print(f"Satır {satir_no} birim fiyat hatası: {e}")
+            
             # Progress dialog'u kapat
             if len(df) > 100:
                 progress.setValue(len(df))
@@ -4964,6 +5009,7 @@ class MainWindow(QMainWindow):
                                             SET resmi_fiyat = ? 
                                             WHERE poz_no = ? AND (resmi_fiyat = 0 OR resmi_fiyat IS NULL)
                                         """, (birim_fiyat, poz_no))
+                                    self.db.invalidate_cache()
                                 except:
                                     pass  # Güncelleme başarısız olsa bile devam et
                         except Exception as e:
@@ -192,6 +192,7 @@ def gui_uygulamasi():
             # Veritabanı bağlantısı
             from app.core.database import DatabaseManager
             db = DatabaseManager()
+            app.aboutToQuit.connect(db.close)
             
             # Ana pencere
             if user_type == 'taseron':